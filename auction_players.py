@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Auction Player Pool
+Shared player records and league roster settings for the draft-time Python tools
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+DEFAULT_PLAYERS_CSV = "complete_top_200_fantasy_football.csv"
+DEFAULT_BUDGET = 200
+TEAMS_PER_LEAGUE = 12
+
+# Same roster shape as the web app (initialRoster in src/app/page.tsx)
+ROSTER_SLOTS = {
+    "QB": 1,
+    "RB": 2,
+    "WR": 2,
+    "TE": 1,
+    "FLEX": 1,  # Can be RB/WR/TE
+    "K": 1,
+    "DEF": 1,
+    "BENCH": 5,
+}
+STARTER_SLOTS = sum(count for slot, count in ROSTER_SLOTS.items() if slot != "BENCH")
+FLEX_POSITIONS = ("RB", "WR", "TE")
+POSITIONS = ("QB", "RB", "WR", "TE", "K", "DEF")
+
+# PPR scoring, same weights as the ESPN scrapers
+PPR_SCORING = {
+    'receptions': 1.0,
+    'receiving_yards': 0.1,
+    'receiving_tds': 6.0,
+    'rushing_yards': 0.1,
+    'rushing_tds': 6.0,
+    'passing_yards': 0.04,  # 1 pt per 25 yards
+    'passing_tds': 4.0,
+}
+
+# Most players a team will carry at each position
+POSITION_LIMITS = {"QB": 2, "RB": 7, "WR": 7, "TE": 2, "K": 1, "DEF": 1}
+
+# 2025 NFL bye weeks (team abbreviations as in the generator lists)
+BYE_WEEKS = {
+    "ATL": 5, "CHI": 5, "GB": 5, "PIT": 5,
+    "HOU": 6, "MIN": 6,
+    "BAL": 7, "BUF": 7,
+    "ARI": 8, "DET": 8, "JAX": 8, "LV": 8, "LAR": 8, "SEA": 8,
+    "CLE": 9, "NYJ": 9, "PHI": 9, "TB": 9,
+    "CIN": 10, "DAL": 10, "KC": 10, "TEN": 10,
+    "IND": 11, "NO": 11,
+    "DEN": 12, "LAC": 12, "MIA": 12, "WSH": 12,
+    "CAR": 14, "NE": 14, "NYG": 14, "SF": 14,
+}
+
+
+@dataclass(frozen=True)
+class AuctionPlayer:
+    rank: int
+    name: str
+    position: str
+    team: str
+    tier: int
+    auction_value: int
+    projected_points: float
+    espn_id: str = ""
+
+
+def calculate_ppr_points(stats: Dict[str, float]) -> float:
+    """PPR fantasy points from a stats dict keyed like PPR_SCORING"""
+    return round(sum(stats.get(stat, 0) * weight for stat, weight in PPR_SCORING.items()), 1)
+
+
+def roster_size() -> int:
+    """Total number of roster spots, bench included"""
+    return sum(ROSTER_SLOTS.values())
+
+
+def load_auction_players(csv_path: str = DEFAULT_PLAYERS_CSV) -> List[AuctionPlayer]:
+    """
+    Load a generated top-200 CSV into AuctionPlayer records
+
+    Accepts both generator schemas: `auction_value_ppr` from
+    complete_200_players.py and `estimated_auction_value` from
+    final_top_200_with_known_ids.py.
+    """
+    import csv  # Snapshot readers never parse CSV, so they skip the import
+
+    players = []
+
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        for row in csv.DictReader(csvfile):
+            value = row.get('auction_value_ppr') or row.get('estimated_auction_value') or 1
+            players.append(AuctionPlayer(
+                rank=int(row['rank']),
+                name=row['name'],
+                position=row['position'],
+                team=row['team'],
+                tier=int(row.get('tier') or 4),
+                auction_value=max(int(float(value)), 1),
+                projected_points=float(row.get('projected_fpts_2025') or 0),
+                espn_id=row.get('espn_id', ''),
+            ))
+
+    return players
+
+
+def players_by_position(players: List[AuctionPlayer]) -> Dict[str, List[AuctionPlayer]]:
+    """Group players by position, best projection first"""
+    grouped: Dict[str, List[AuctionPlayer]] = {position: [] for position in POSITIONS}
+    for player in players:
+        grouped.setdefault(player.position, []).append(player)
+    for position_players in grouped.values():
+        position_players.sort(key=lambda p: (-p.projected_points, p.auction_value))
+    return grouped
+
+
+def _starter_gaps(counts: Dict[str, int]) -> Tuple[int, int]:
+    """(empty non-FLEX starter slots, reserves available to fill FLEX)"""
+    needed = 0
+    flex_surplus = 0
+    for position in POSITIONS:
+        have = counts.get(position, 0)
+        needed += max(ROSTER_SLOTS[position] - have, 0)
+        if position in FLEX_POSITIONS:
+            flex_surplus += max(have - ROSTER_SLOTS[position], 0)
+    return needed, flex_surplus
+
+
+def starter_slots_needed(counts: Dict[str, int]) -> int:
+    """Starting slots (FLEX included) still empty for a team holding `counts` players"""
+    needed, flex_surplus = _starter_gaps(counts)
+    return needed + max(ROSTER_SLOTS["FLEX"] - flex_surplus, 0)
+
+
+def can_roster(counts: Dict[str, int], open_slots: int, position: str) -> bool:
+    """Whether a player at `position` fits without stranding a required starter slot"""
+    have = counts.get(position, 0)
+    if open_slots < 1 or have >= POSITION_LIMITS.get(position, 0):
+        return False
+    if open_slots > STARTER_SLOTS:
+        return True
+
+    needed, flex_surplus = _starter_gaps(counts)
+    if have < ROSTER_SLOTS[position]:
+        needed -= 1
+    elif position in FLEX_POSITIONS:
+        flex_surplus += 1
+    return needed + max(ROSTER_SLOTS["FLEX"] - flex_surplus, 0) <= open_slots - 1
+
+
+def starting_lineup_points(players: List[AuctionPlayer]) -> float:
+    """Projected points of the best legal starting lineup from a roster"""
+    grouped = players_by_position(players)
+    points = 0.0
+    flex_pool = []
+    for position in POSITIONS:
+        starters = ROSTER_SLOTS[position]
+        points += sum(p.projected_points for p in grouped[position][:starters])
+        if position in FLEX_POSITIONS:
+            flex_pool.extend(grouped[position][starters:])
+    flex_pool.sort(key=lambda p: -p.projected_points)
+    points += sum(p.projected_points for p in flex_pool[:ROSTER_SLOTS["FLEX"]])
+    return round(points, 1)
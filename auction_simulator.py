@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo Auction Draft Simulator
+Runs thousands of full 12-team auction drafts across CPU cores to stress-test
+our auction_value_ppr numbers and roster strategies
+
+Each simulated draft has:
+- Nomination agents (rotate through teams, nominate a fit from the top of the board)
+- Bidding agents (noisy private valuations around the generated values)
+- Budget and roster constraints ($1 per open slot reserved, position limits)
+
+Every draft is seeded from (seed + draft number), so results are reproducible
+regardless of how many worker processes run them.
+
+Drafts run on player columns (DraftColumns) rather than AuctionPlayer
+objects. Worker processes wrap the parent's shared PlayerMatrix columns as
+NumPy arrays without copying, so no player objects are rebuilt per worker.
+"""
+
+import math
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from auction_players import (
+    DEFAULT_BUDGET, FLEX_POSITIONS, POSITIONS, ROSTER_SLOTS, TEAMS_PER_LEAGUE,
+    AuctionPlayer, can_roster, roster_size,
+)
+from player_matrix import PlayerMatrix
+from player_snapshot import load_players
+from roster_scenario_solver import STRATEGIES, StrategySpec
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    teams: int = TEAMS_PER_LEAGUE
+    budget: int = DEFAULT_BUDGET
+    price_sigma: float = 0.15  # Per-team valuation noise (log scale)
+    market_sigma: float = 0.10  # Per-draft hype/fade noise on each player (log scale)
+    nomination_window: int = 8  # Nominators pick from this many top fits
+    strategy: Optional[str] = None  # StrategySpec key for our team (team 0)
+
+
+@dataclass
+class SimTeam:
+    index: int
+    budget: int
+    open_slots: int
+    counts: Dict[str, int] = field(default_factory=dict)
+    spend: Dict[str, int] = field(default_factory=dict)
+    roster: List[int] = field(default_factory=list)  # Player indices
+
+    def max_bid(self) -> int:
+        """Keep $1 for every other open slot"""
+        return self.budget - (self.open_slots - 1) if self.open_slots > 0 else 0
+
+    def add(self, player: int, position: str, price: int):
+        self.budget -= price
+        self.open_slots -= 1
+        self.counts[position] = self.counts.get(position, 0) + 1
+        self.spend[position] = self.spend.get(position, 0) + price
+        self.roster.append(player)
+
+
+@dataclass(frozen=True)
+class DraftColumns:
+    """The player columns a draft reads, one entry per player index"""
+    rank: np.ndarray
+    tier: np.ndarray
+    auction_value: np.ndarray
+    projected_points: np.ndarray
+    position: np.ndarray  # Index into POSITIONS
+
+    @classmethod
+    def from_players(cls, players: List[AuctionPlayer]) -> "DraftColumns":
+        return cls(
+            rank=np.array([p.rank for p in players], dtype=np.int32),
+            tier=np.array([p.tier for p in players], dtype=np.int32),
+            auction_value=np.array([p.auction_value for p in players], dtype=np.int32),
+            projected_points=np.array([p.projected_points for p in players], dtype=np.float64),
+            position=np.array([POSITIONS.index(p.position) for p in players], dtype=np.uint8),
+        )
+
+    @classmethod
+    def from_matrix(cls, matrix: PlayerMatrix) -> "DraftColumns":
+        """Zero-copy views over the matrix's buffers; the matrix must stay open while they are used"""
+        return cls(
+            rank=np.frombuffer(matrix.column('rank'), dtype=np.int32),
+            tier=np.frombuffer(matrix.column('tier'), dtype=np.int32),
+            auction_value=np.frombuffer(matrix.column('auction_value'), dtype=np.int32),
+            projected_points=np.frombuffer(matrix.column('projected_points'), dtype=np.float64),
+            position=np.frombuffer(matrix.column('position'), dtype=np.uint8),
+        )
+
+
+@dataclass
+class MarketState:
+    dollars_left: int
+    slots_left: int
+    value_left: int
+    players_left: int
+
+    def inflation(self) -> float:
+        """Spendable dollars above $1 minimums per dollar of surplus value still on the board"""
+        surplus_dollars = self.dollars_left - self.slots_left
+        surplus_value = self.value_left - self.players_left
+        if surplus_value <= 0:
+            return 2.0
+        return min(max(surplus_dollars / surplus_value, 0.5), 2.0)
+
+
+class ValueBidder:
+    """Bids up to a noisy, inflation-adjusted read of the generated value"""
+
+    def __init__(self, price_sigma: float):
+        self.price_sigma = price_sigma
+
+    def valuation(self, team: SimTeam, position: str, market_value: float,
+                  inflation: float, rng: random.Random) -> float:
+        noise = math.exp(rng.gauss(0.0, self.price_sigma))
+        return 1 + (market_value - 1) * inflation * noise
+
+
+class StrategyBidder(ValueBidder):
+    """Value bidder that also respects a StrategySpec's spend caps"""
+
+    def __init__(self, price_sigma: float, spec: StrategySpec, budget: int):
+        super().__init__(price_sigma)
+        self.spec = spec
+        self.budget = budget
+
+    def valuation(self, team: SimTeam, position: str, market_value: float,
+                  inflation: float, rng: random.Random) -> float:
+        value = super().valuation(team, position, market_value, inflation, rng)
+        bounds = self.spec.bounds_for(position)
+        position_room = bounds.max_share * self.budget - team.spend.get(position, 0)
+        value = min(value, max(position_room, 1))
+        if self.spec.max_player_price is not None:
+            value = min(value, self.spec.max_player_price)
+        return value
+
+
+class ValueNominator:
+    """Nominates one of the most valuable players the team could still roster"""
+
+    def __init__(self, window: int):
+        self.window = window
+
+    def choose(self, team: SimTeam, board: List[int], positions: List[str],
+               rng: random.Random) -> Optional[int]:
+        fits = []
+        for player in board:
+            if can_roster(team.counts, team.open_slots, positions[player]):
+                fits.append(player)
+                if len(fits) == self.window:
+                    break
+        return rng.choice(fits) if fits else None
+
+
+@dataclass
+class DraftResult:
+    lineup_points: List[float]  # Per team, team 0 is ours
+    filled_slots: List[int]
+    price_totals: Dict[Tuple[str, int], Tuple[int, int, int]]  # (pos, tier) -> (price, value, count)
+    rosters: List[List[int]] = field(default_factory=list)  # Player indices per team, in purchase order
+
+
+def lineup_points(roster: List[int], points: List[float], positions: List[str]) -> float:
+    """starting_lineup_points for a roster of player indices"""
+    grouped: Dict[str, List[float]] = {position: [] for position in POSITIONS}
+    for player in roster:
+        grouped[positions[player]].append(points[player])
+    total = 0.0
+    flex_pool = []
+    for position in POSITIONS:
+        grouped[position].sort(reverse=True)
+        starters = ROSTER_SLOTS[position]
+        total += sum(grouped[position][:starters])
+        if position in FLEX_POSITIONS:
+            flex_pool.extend(grouped[position][starters:])
+    flex_pool.sort(reverse=True)
+    total += sum(flex_pool[:ROSTER_SLOTS["FLEX"]])
+    return round(total, 1)
+
+
+def simulate_draft(players: List[AuctionPlayer], config: SimulationConfig, seed: int) -> DraftResult:
+    """Run one full auction draft; rosters hold indices into `players`"""
+    return simulate_columns(DraftColumns.from_players(players), config, seed)
+
+
+def simulate_columns(columns: DraftColumns, config: SimulationConfig, seed: int) -> DraftResult:
+    """Run one full auction draft until no team can roster anyone left"""
+    rng = random.Random(seed)
+    slots = roster_size()
+    teams = [SimTeam(i, config.budget, slots) for i in range(config.teams)]
+
+    bidders: List[ValueBidder] = [ValueBidder(config.price_sigma) for _ in teams]
+    if config.strategy:
+        spec = next(s for s in STRATEGIES if s.key == config.strategy)
+        bidders[0] = StrategyBidder(config.price_sigma, spec, config.budget)
+    nominator_agent = ValueNominator(config.nomination_window)
+
+    # Scalar reads in the auction loop are much faster from lists than from NumPy arrays
+    values = columns.auction_value.tolist()
+    tiers = columns.tier.tolist()
+    points = columns.projected_points.tolist()
+    positions = [POSITIONS[i] for i in columns.position.tolist()]
+
+    # Board is kept in value order so nominators stop scanning early
+    board = np.lexsort((columns.rank, -columns.auction_value.astype(np.int64))).tolist()
+    market_values = {i: values[i] * math.exp(rng.gauss(0.0, config.market_sigma)) for i in board}
+    market = MarketState(
+        dollars_left=config.budget * config.teams,
+        slots_left=slots * config.teams,
+        value_left=sum(values),
+        players_left=len(board),
+    )
+
+    price_totals: Dict[Tuple[str, int], Tuple[int, int, int]] = {}
+    turn = rng.randrange(config.teams)
+    idle_turns = 0
+
+    while board and idle_turns < config.teams:
+        nominator = teams[turn]
+        turn = (turn + 1) % config.teams
+
+        player = nominator_agent.choose(nominator, board, positions, rng)
+        if player is None:
+            idle_turns += 1
+            continue
+        idle_turns = 0
+        position = positions[player]
+
+        inflation = market.inflation()
+        bids = []
+        for team, bidder in zip(teams, bidders):
+            if not can_roster(team.counts, team.open_slots, position):
+                continue
+            value = bidder.valuation(team, position, market_values[player], inflation, rng)
+            bid = min(int(value), team.max_bid())
+            if team is nominator:
+                bid = max(bid, 1)  # Nominations open at $1
+            if bid >= 1:
+                bids.append((bid, rng.random(), team))
+
+        # English auction: the top bidder pays $1 over the runner-up's limit
+        bids.sort(key=lambda b: (b[0], b[1]), reverse=True)
+        top_bid, _, winner = bids[0]
+        price = min(top_bid, bids[1][0] + 1) if len(bids) > 1 else 1
+
+        winner.add(player, position, price)
+        board.remove(player)
+        market.dollars_left -= price
+        market.slots_left -= 1
+        market.value_left -= values[player]
+        market.players_left -= 1
+
+        key = (position, tiers[player])
+        total_price, total_value, count = price_totals.get(key, (0, 0, 0))
+        price_totals[key] = (total_price + price, total_value + values[player], count + 1)
+
+    return DraftResult(
+        lineup_points=[lineup_points(team.roster, points, positions) for team in teams],
+        filled_slots=[len(team.roster) for team in teams],
+        price_totals=price_totals,
+        rosters=[list(team.roster) for team in teams],
+    )
+
+
+@dataclass
+class SimulationReport:
+    drafts: int
+    our_points: List[float]
+    league_points: List[float]
+    fill_rate: float
+    price_table: Dict[Tuple[str, int], Tuple[float, float, float]]  # avg price, avg value, per draft
+
+    def percentiles(self, values: List[float]) -> Dict[str, float]:
+        cuts = statistics.quantiles(values, n=10) if len(values) > 1 else values * 9
+        return {
+            'mean': round(statistics.fmean(values), 1),
+            'p10': round(cuts[0], 1),
+            'p50': round(statistics.median(values), 1),
+            'p90': round(cuts[-1], 1),
+        }
+
+
+# Per-worker state, installed once by the pool initializer
+_worker_matrix: Optional[PlayerMatrix] = None
+_worker_columns: Optional[DraftColumns] = None
+_worker_config = SimulationConfig()
+
+
+def _init_worker(matrix_name: str, config: SimulationConfig):
+    """Read the parent's shared player matrix in place; it stays attached for the worker's lifetime"""
+    global _worker_matrix, _worker_columns, _worker_config
+    _worker_matrix = PlayerMatrix.attach(matrix_name)
+    _worker_columns = DraftColumns.from_matrix(_worker_matrix)
+    _worker_config = config
+
+
+def _simulate_in_worker(seed: int) -> DraftResult:
+    return simulate_columns(_worker_columns, _worker_config, seed)
+
+
+def run_simulations(players: List[AuctionPlayer], drafts: int = 1000, seed: int = 2025,
+                    config: Optional[SimulationConfig] = None,
+                    workers: Optional[int] = None) -> SimulationReport:
+    """Run `drafts` seeded drafts across a process pool and aggregate the outcomes"""
+    config = config or SimulationConfig()
+    seeds = range(seed, seed + drafts)
+
+    if workers == 1:
+        columns = DraftColumns.from_players(players)
+        results = [simulate_columns(columns, config, s) for s in seeds]
+    else:
+        chunk = max(1, drafts // ((workers or os.cpu_count() or 1) * 4))
+        with PlayerMatrix.create(players) as matrix, \
+                ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                    initargs=(matrix.name, config)) as pool:
+            results = list(pool.map(_simulate_in_worker, seeds, chunksize=chunk))
+
+    our_points = [r.lineup_points[0] for r in results]
+    league_points = [points for r in results for points in r.lineup_points]
+    filled = sum(sum(r.filled_slots) for r in results)
+    fill_rate = filled / (drafts * config.teams * roster_size())
+
+    totals: Dict[Tuple[str, int], List[int]] = {}
+    for result in results:
+        for key, (price, value, count) in result.price_totals.items():
+            bucket = totals.setdefault(key, [0, 0, 0])
+            bucket[0] += price
+            bucket[1] += value
+            bucket[2] += count
+
+    price_table = {
+        key: (price / count, value / count, count / drafts)
+        for key, (price, value, count) in totals.items()
+    }
+    return SimulationReport(drafts, our_points, league_points, fill_rate, price_table)
+
+
+def print_report(report: SimulationReport, config: SimulationConfig):
+    ours = report.percentiles(report.our_points)
+    league = report.percentiles(report.league_points)
+
+    print(f"\n📊 Starting lineup projected points over {report.drafts} drafts")
+    print(f"   Our team ({config.strategy or 'value bidder'}): "
+          f"mean {ours['mean']} | p10 {ours['p10']} | p50 {ours['p50']} | p90 {ours['p90']}")
+    print(f"   League:    mean {league['mean']} | p10 {league['p10']} | "
+          f"p50 {league['p50']} | p90 {league['p90']}")
+    print(f"   Roster slots filled: {report.fill_rate:.1%}")
+
+    print("\n💰 Average price paid by position / tier")
+    print(f"   {'POS':<4} {'TIER':<5} {'PRICE':>7} {'VALUE':>7} {'RATIO':>6} {'SOLD/DRAFT':>11}")
+    for position in POSITIONS:
+        for (pos, tier), (price, value, per_draft) in sorted(report.price_table.items()):
+            if pos != position:
+                continue
+            print(f"   {pos:<4} {tier:<5} {price:>7.1f} {value:>7.1f} "
+                  f"{price / value:>6.2f} {per_draft:>11.1f}")
+
+
+def main():
+    players = load_players()
+    config = SimulationConfig()
+
+    print("🎲 Monte Carlo Auction Draft Simulator")
+    print("=" * 50)
+    print(f"🏈 {config.teams} teams | ${config.budget} budgets | {len(players)} players")
+
+    report = run_simulations(players, drafts=1000, config=config)
+    print_report(report, config)
+
+    print("\n🎯 Our team playing each strategy against value bidders")
+    for spec in STRATEGIES:
+        strategy_config = SimulationConfig(strategy=spec.key)
+        strategy_report = run_simulations(players, drafts=1000, config=strategy_config)
+        summary = strategy_report.percentiles(strategy_report.our_points)
+        print(f"   {spec.name:<16} mean {summary['mean']} | p10 {summary['p10']} | p90 {summary['p90']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Background Player Refresher
+Keeps player data fresh between manual script runs. A long-running loop
+re-fetches each player's ESPN overview and splits on that player's own
+schedule, within one global request budget, and pushes only the rows that
+actually changed downstream.
+
+A player's refresh interval shrinks the more their data matters and the more
+likely it is to have moved:
+
+    heat     = importance * (1 + VOLATILITY_WEIGHT * volatility) * injury factor * team-change factor
+    interval = BASE_INTERVAL_HOURS / heat, clamped to [MIN_INTERVAL_MINUTES, MAX_INTERVAL_HOURS]
+
+- importance is the scrape scheduler's rank/tier score
+- volatility is the exponentially weighted share of recent fetches that
+  changed something
+- players whose prefetched news mentions an injury refresh INJURY_FACTOR
+  times as often
+- players seen on a new team in the last TEAM_CHANGE_HOURS refresh
+  TEAM_CHANGE_FACTOR times as often
+
+Players wait in a heap keyed on when they fall due. The loop sleeps until the
+next one, and a shared rate limiter keeps the whole process under
+--requests-per-minute. When the budget cannot keep up, the most overdue player
+goes first.
+
+Players without an ESPN ID in the snapshot are looked up by name and position
+in ESPN's athlete list before scheduling (scrape_scheduler.resolve_espn_ids),
+and the IDs found are remembered in the state file.
+
+Each fetch becomes the row downstream consumers see: team, 2024 stats and the
+blended projection. It is compared with the last row seen for that player.
+Unchanged rows go nowhere. Changed rows are batched, appended to a JSONL change
+feed and, with --dsn, applied to the `players` table through the bulk loader
+(update only). Each sink has its own delivery queue, so a sink that fails is
+retried alone and the others do not see the batch twice. A queue holds at most
+one change per player: a newer change to a player still waiting is merged into
+the queued one, so a sink that stays down cannot grow it without limit.
+
+Usage:
+    python3 background_refresher.py [--requests-per-minute 6] [--dsn postgresql://...]
+                                    [--changes player_changes.jsonl] [--max-requests N] [--plan]
+"""
+
+import argparse
+import heapq
+import json
+import os
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from auction_players import AuctionPlayer
+from complete_200_players import project_fantasy_points
+from player_snapshot import load_players
+from scrape_scheduler import NEWS_STORE, importance, injured_players, load_state, resolve_espn_ids, save_state
+from streaming_scrape import RateLimiter
+
+DEFAULT_STATE = "refresh_state.json"
+DEFAULT_CHANGES = "player_changes.jsonl"
+
+REQUESTS_PER_REFRESH = 2  # Overview + splits
+BASE_INTERVAL_HOURS = 2.0  # A player of importance 1 with nothing going on
+MIN_INTERVAL_MINUTES = 10.0
+MAX_INTERVAL_HOURS = 48.0
+VOLATILITY_WEIGHT = 3.0
+VOLATILITY_DECAY = 0.7  # Share of the old volatility kept on each fetch
+INJURY_FACTOR = 4.0
+TEAM_CHANGE_FACTOR = 4.0
+TEAM_CHANGE_HOURS = 72.0
+RETRY_MINUTES = 5.0  # First back-off after a failed fetch, doubled per failure
+NEWS_CHECK_SECONDS = 60.0  # How often the news store is checked for new injuries
+
+
+@dataclass
+class RowChange:
+    player: AuctionPlayer  # The row as it should now read downstream
+    fields: Dict[str, Tuple[Any, Any]]  # Field -> (old, new); old is None on a first fetch
+    at: float
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            'at': round(self.at, 3), 'name': self.player.name, 'position': self.player.position,
+            'espn_id': self.player.espn_id, 'team': self.player.team,
+            'projected_points': self.player.projected_points,
+            'changed': {name: list(values) for name, values in self.fields.items()},
+        }
+
+
+@dataclass
+class RefreshStats:
+    refreshes: int = 0
+    requests: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    pushed: Dict[str, int] = field(default_factory=dict)  # Sink -> rows delivered
+    push_errors: List[str] = field(default_factory=list)
+
+
+def downstream_row(player: AuctionPlayer, fetched: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The row consumers see for a fetch: scrape_athlete's stats plus team and the
+    projection blended 50/50 with 2024 PPR points, as the pipeline does.
+    """
+    points = project_fantasy_points(player.position, player.tier, player.rank)
+    if fetched.get('fantasy_points_2024'):
+        points = (points + fetched['fantasy_points_2024']) / 2
+    row = dict(fetched)
+    row['team'] = fetched.get('team') if fetched.get('team') not in (None, '', 'UNK') else player.team
+    row['projected_points'] = round(points, 1)
+    return row
+
+
+class BackgroundRefresher:
+    def __init__(self, players: List[AuctionPlayer], state: Dict[str, Dict],
+                 fetch: Optional[Callable[[str], Dict]],
+                 requests_per_minute: float = 6.0, state_path: Optional[str] = DEFAULT_STATE,
+                 news_store: str = NEWS_STORE, clock: Callable[[], float] = time.time,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        `fetch(espn_id)` costs REQUESTS_PER_REFRESH requests and returns the
+        scraped stats (team included), raising when ESPN does not answer.
+        `state` is persisted to `state_path` on every flush; pass None to keep
+        it in memory only.
+        """
+        self.players = {player.name: player for player in players if player.espn_id}
+        self.no_id = [player for player in players if not player.espn_id]
+        self.state = state
+        self.fetch = fetch
+        self.state_path = state_path
+        self.news_store = news_store
+        self.clock = clock
+        self.sleep = sleep
+        self.limiter = RateLimiter(60.0 * REQUESTS_PER_REFRESH / requests_per_minute)
+        self.injured: Set[str] = set()
+        self.news_mtime: Optional[float] = None
+        self.news_checked = clock()
+        self.retry_at: Dict[str, float] = {}
+        self.failures: Dict[str, int] = {}
+        self.pending: List[RowChange] = []  # Changes not yet handed to any sink
+        self.undelivered: Dict[str, Dict[str, RowChange]] = {}  # Sink -> player -> change not accepted yet
+        self.stats = RefreshStats()
+        self.heap: List[Tuple[float, int, str]] = []
+        self.check_news()
+        self.reschedule()
+
+    def heat(self, player: AuctionPlayer) -> float:
+        entry = self.state.get(player.name, {})
+        heat = importance(player) * (1 + VOLATILITY_WEIGHT * entry.get('volatility', 0.0))
+        if player.name in self.injured:
+            heat *= INJURY_FACTOR
+        team_changed_at = entry.get('team_changed_at')
+        if team_changed_at is not None and self.clock() - team_changed_at < TEAM_CHANGE_HOURS * 3600:
+            heat *= TEAM_CHANGE_FACTOR
+        return heat
+
+    def interval(self, player: AuctionPlayer) -> float:
+        """Seconds between refreshes of this player"""
+        seconds = BASE_INTERVAL_HOURS * 3600 / self.heat(player)
+        return min(max(seconds, MIN_INTERVAL_MINUTES * 60), MAX_INTERVAL_HOURS * 3600)
+
+    def due_at(self, player: AuctionPlayer) -> float:
+        if player.name in self.retry_at:
+            return self.retry_at[player.name]
+        fetched_at = self.state.get(player.name, {}).get('fetched_at')
+        return 0.0 if fetched_at is None else fetched_at + self.interval(player)
+
+    def reschedule(self):
+        """Rebuild the heap, e.g. after the injury list changed"""
+        self.heap = [(self.due_at(player), player.rank, player.name) for player in self.players.values()]
+        heapq.heapify(self.heap)
+
+    def check_news(self) -> bool:
+        """Reload the injury list if the news store changed; True when it did"""
+        if not os.path.exists(self.news_store):
+            return False
+        mtime = os.path.getmtime(self.news_store)
+        if mtime == self.news_mtime:
+            return False
+        self.news_mtime = mtime
+        injured = injured_players(list(self.players.values()), self.news_store)
+        changed, self.injured = injured != self.injured, injured
+        return changed
+
+    def refresh(self, player: AuctionPlayer) -> Optional[RowChange]:
+        """Fetch one player; returns the change queued for downstream, if any"""
+        self.limiter.wait()
+        self.stats.requests += REQUESTS_PER_REFRESH
+        now = self.clock()
+        try:
+            fetched = self.fetch(player.espn_id)
+        except Exception as e:
+            failures = self.failures[player.name] = self.failures.get(player.name, 0) + 1
+            backoff = RETRY_MINUTES * 60 * 2 ** (failures - 1)
+            self.retry_at[player.name] = now + min(backoff, self.interval(player))
+            self.stats.failed += 1
+            print(f"⚠️  {player.name}: {e}")
+            return None
+        self.retry_at.pop(player.name, None)
+        self.failures.pop(player.name, None)
+        self.stats.refreshes += 1
+
+        entry = self.state.setdefault(player.name, {})
+        old = entry.get('row')
+        row = downstream_row(player, fetched)
+        changed = {name: (old.get(name) if old else None, value)
+                   for name, value in row.items() if old is None or old.get(name) != value}
+        if old is not None:  # A first fetch says nothing about how often this player moves
+            entry['volatility'] = (VOLATILITY_DECAY * entry.get('volatility', 0.0)
+                                   + (1 - VOLATILITY_DECAY) * (1.0 if changed else 0.0))
+        previous_team = old['team'] if old else player.team
+        if previous_team and row['team'] != previous_team:
+            entry['team_changed_at'] = now
+        entry['fetched_at'] = now
+        entry['row'] = row
+
+        if not changed:
+            self.stats.unchanged += 1
+            return None
+        self.stats.changed += 1
+        change = RowChange(replace(player, team=row['team'], projected_points=row['projected_points']), changed, now)
+        self.pending.append(change)
+        return change
+
+    def flush(self, sinks: Dict[str, Callable[[List[RowChange]], None]]) -> bool:
+        """
+        Push each sink the changes it has not accepted yet, then persist state.
+        A sink that fails keeps its queue for the next flush while the others
+        are cleared. State is saved either way, but players still queued for a
+        sink are saved without their last row, so after a crash their next
+        fetch counts as a first fetch and is pushed again.
+        """
+        for name in sinks:
+            queue = self.undelivered.setdefault(name, {})
+            for change in self.pending:
+                queued = queue.get(change.player.name)
+                queue[change.player.name] = merge_changes(queued, change) if queued else change
+        self.pending = []
+
+        delivered = True
+        for name, push in sinks.items():
+            queued = list(self.undelivered[name].values())
+            if not queued:
+                continue
+            try:
+                push(queued)
+            except Exception as e:
+                self.stats.push_errors.append(f"{name}: {e}")
+                print(f"❌ Push of {len(queued)} changes to {name} failed, will retry: {e}")
+                delivered = False
+                continue
+            self.stats.pushed[name] = self.stats.pushed.get(name, 0) + len(queued)
+            self.undelivered[name] = {}
+        if self.state_path:
+            save_state(self.state if delivered else self.delivered_state(), self.state_path)
+        return delivered
+
+    def delivered_state(self) -> Dict[str, Dict]:
+        """The state with the rows some sink has not accepted yet left out"""
+        waiting = {player for queue in self.undelivered.values() for player in queue}
+        return {name: {key: value for key, value in entry.items() if key != 'row'} if name in waiting else entry
+                for name, entry in self.state.items()}
+
+    def run(self, sinks: Dict[str, Callable[[List[RowChange]], None]], max_requests: Optional[int] = None,
+            flush_seconds: float = 60.0) -> RefreshStats:
+        """
+        Refresh players as they fall due until interrupted or `max_requests`
+        would be exceeded, pushing changes to every sink at most every `flush_seconds`.
+        """
+        last_flush = self.clock()
+        try:
+            while self.heap:
+                if max_requests is not None and self.stats.requests + REQUESTS_PER_REFRESH > max_requests:
+                    break
+                now = self.clock()
+                if now >= self.news_checked + NEWS_CHECK_SECONDS:
+                    self.news_checked = now
+                    if self.check_news():
+                        self.reschedule()
+                if now >= last_flush + flush_seconds:
+                    self.flush(sinks)
+                    last_flush = now
+
+                due, _, name = self.heap[0]
+                if due > now:
+                    self.sleep(min(due, self.news_checked + NEWS_CHECK_SECONDS, last_flush + flush_seconds) - now)
+                    continue
+                heapq.heappop(self.heap)
+                player = self.players[name]
+                self.refresh(player)
+                heapq.heappush(self.heap, (self.due_at(player), player.rank, name))
+        except KeyboardInterrupt:
+            print("\n🛑 Stopping")
+        finally:
+            self.flush(sinks)
+        return self.stats
+
+
+def merge_changes(older: RowChange, newer: RowChange) -> RowChange:
+    """
+    One change standing for two consecutive ones to the same player: the newer
+    row, with each field's old value taken from whichever change saw it first.
+    A field that moved back to where it started is dropped.
+    """
+    fields = dict(older.fields)
+    for name, (old, new) in newer.fields.items():
+        fields[name] = (fields[name][0] if name in fields else old, new)
+    fields = {name: (old, new) for name, (old, new) in fields.items() if old is None or old != new}
+    return RowChange(newer.player, fields, newer.at)
+
+
+def change_feed(path: str) -> Callable[[List[RowChange]], None]:
+    """Sink appending one JSON line per changed row"""
+    def push(changes: List[RowChange]):
+        with open(path, 'a', encoding='utf-8') as handle:
+            for change in changes:
+                handle.write(json.dumps(change.to_json(), separators=(',', ':')) + "\n")
+    return push
+
+
+def database_sink(dsn: str, players: List[AuctionPlayer]) -> Callable[[List[RowChange]], None]:
+    """Sink updating only the changed rows of the `players` table"""
+    from player_db_loader import load_players as load_into_db, position_ranks
+
+    ranks = position_ranks(players)  # Ranks come from the whole universe, not the changed few
+
+    def push(changes: List[RowChange]):
+        load_into_db(dsn, [change.player for change in changes], insert_new=False, ranks=ranks)
+    return push
+
+
+def describe(change: RowChange) -> str:
+    if all(old is None for old, _ in change.fields.values()):
+        return "first fetch"
+    shown = [f"{name} {old} → {new}" for name, (old, new) in change.fields.items()
+             if name in ('team', 'projected_points')]
+    return ", ".join(shown) or "stats changed"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep player data fresh in the background, pushing only changes")
+    parser.add_argument('--requests-per-minute', type=float, default=6.0, help="Global ESPN request budget")
+    parser.add_argument('--state', default=DEFAULT_STATE)
+    parser.add_argument('--changes', default=DEFAULT_CHANGES, help="JSONL feed of changed rows")
+    parser.add_argument('--dsn', default=os.environ.get('DATABASE_URL'),
+                        help="Also update changed rows in Postgres (default: $DATABASE_URL)")
+    parser.add_argument('--flush-seconds', type=float, default=60.0, help="How often changes are pushed")
+    parser.add_argument('--max-requests', type=int, help="Stop after this many requests")
+    parser.add_argument('--plan', action='store_true', help="Show each player's refresh interval and exit")
+    args = parser.parse_args()
+
+    fetch = athletes = None
+    if not args.plan:
+        from espn_player_scraper import ESPNPlayerScraper
+        from sharded_scrape import scrape_athlete
+
+        scraper = ESPNPlayerScraper()
+
+        def fetch(espn_id: str) -> Dict[str, Any]:
+            return scrape_athlete(scraper, espn_id)
+
+        def athletes():
+            return scraper.iter_athletes(page_size=1000)  # A few requests for the whole league
+
+    print("♻️  Background Player Refresher")
+    print("=" * 50)
+    state = load_state(args.state)
+    snapshot = load_players()
+    players = resolve_espn_ids(snapshot, state, athletes)
+    looked_up = sum(1 for before, after in zip(snapshot, players) if after.espn_id and not before.espn_id)
+    refresher = BackgroundRefresher(players, state, fetch,
+                                    requests_per_minute=args.requests_per_minute, state_path=args.state)
+
+    print(f"📊 {len(refresher.players)} players scheduled ({looked_up} IDs found by name lookup), "
+          f"{len(refresher.no_id)} still without ESPN IDs, {len(refresher.injured)} injured")
+    demand = sum(3600 / refresher.interval(p) for p in refresher.players.values()) * REQUESTS_PER_REFRESH
+    print(f"📈 Steady-state demand {demand:.0f} requests/hour, budget {args.requests_per_minute * 60:.0f}")
+
+    if args.plan:
+        now = time.time()
+        for due, _, name in sorted(refresher.heap)[:40]:
+            player = refresher.players[name]
+            entry = refresher.state.get(name, {})
+            flags = (" 🚑" if name in refresher.injured else "") + (" 🔀" if 'team_changed_at' in entry else "")
+            when = "now" if due <= now else f"in {(due - now) / 60:.0f}m"
+            print(f"   #{player.rank:<3} {name:<24} every {refresher.interval(player) / 60:6.0f}m, "
+                  f"volatility {entry.get('volatility', 0.0):.2f}, due {when}{flags}")
+        return
+
+    feed = change_feed(args.changes)
+
+    def log_and_append(changes: List[RowChange]):
+        feed(changes)
+        for change in changes:
+            print(f"   ✏️  {change.player.name:<24} {describe(change)}")
+        print(f"📤 Pushed {len(changes)} changed rows ({refresher.stats.refreshes} refreshes, "
+              f"{refresher.stats.unchanged} unchanged so far)")
+
+    sinks = {'change feed': log_and_append}
+    if args.dsn:
+        sinks['postgres'] = database_sink(args.dsn, players)
+
+    stats = refresher.run(sinks, args.max_requests, args.flush_seconds)
+    pushed = ", ".join(f"{count} to {name}" for name, count in stats.pushed.items()) or "none"
+    print(f"✅ {stats.refreshes} refreshes, {stats.requests} requests, {stats.changed} changed, "
+          f"{stats.failed} failed, rows pushed: {pushed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Live Max-Bid Recommender
+Answers "what is this nominated player worth to my roster right now?"
+
+The answer is the marginal roster value of the player: the best roster we can
+still build with them bought at $b, against the best roster without them. The
+max bid is the highest $b where buying still beats passing.
+
+Speed comes from cached optimizer state (see roster_scenario_solver.py):
+- Per-position frontiers for the current pool
+- For each position, the other five positions already merged
+A nomination only re-runs the knapsack for the nominated player's position
+(once with the player, once without) and binary searches the price.
+"""
+
+import bisect
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from auction_players import (
+    DEFAULT_BUDGET, POSITIONS, AuctionPlayer,
+    players_by_position, roster_size,
+)
+from player_snapshot import load_players
+from roster_scenario_solver import (
+    MERGE_ORDER, NEG_INF, PositionFrontier, StrategySpec,
+    build_position_frontier, count_bounds, merge_position, slot_weights,
+)
+
+# No strategy constraints: the best roster the remaining budget allows
+OPTIMAL_ROSTER = StrategySpec("optimal", "Optimal Roster", "Best weighted points for the budget")
+
+
+@dataclass
+class BidAdvice:
+    player: AuctionPlayer
+    max_bid: int  # $0 means pass
+    marginal_points: float  # Weighted roster points gained buying at $1
+    points_with: float
+    points_without: float
+    affordable_max: int  # Budget minus $1 for every other open slot
+    elapsed_ms: float
+
+
+def _prefix_max(row: List[float]) -> List[float]:
+    """Best value at a total cost of at most c"""
+    best = NEG_INF
+    out = []
+    for value in row:
+        best = max(best, value)
+        out.append(best)
+    return out
+
+
+class BidRecommender:
+    def __init__(self, players: List[AuctionPlayer], budget: int = DEFAULT_BUDGET,
+                 roster: Optional[List[AuctionPlayer]] = None, spec: StrategySpec = OPTIMAL_ROSTER):
+        self.spec = spec
+        self.budget = budget
+        self.roster: List[AuctionPlayer] = list(roster or [])
+        self.open_slots = roster_size() - len(self.roster)
+        self.drafted: Set[str] = {p.name for p in self.roster}
+        self._players = players
+
+        # Cached optimizer state, rebuilt lazily after a pick
+        self._pool: Dict[str, List[AuctionPlayer]] = {}
+        self._frontiers: Dict[str, PositionFrontier] = {}
+        self._others: Dict[str, Dict[Tuple[int, int], List[Tuple[int, float]]]] = {}
+
+    @property
+    def filled(self) -> Dict[str, int]:
+        counts = {position: 0 for position in POSITIONS}
+        for player in self.roster:
+            counts[player.position] += 1
+        return counts
+
+    def max_count(self, position: str) -> int:
+        return max(self.spec.bounds_for(position).max_count - self.filled[position], 0)
+
+    def warm(self):
+        """Build frontiers and the leave-one-position-out merges for the current pool"""
+        available = [p for p in self._players if p.name not in self.drafted]
+        self._pool = players_by_position(available)
+        filled = self.filled
+
+        for position in POSITIONS:
+            if position not in self._frontiers:
+                self._frontiers[position] = build_position_frontier(
+                    self._pool[position], position, self.max_count(position), self.budget,
+                    self.spec.max_player_price, filled[position])
+
+        for position in POSITIONS:
+            if position in self._others:
+                continue
+            states: Dict[Tuple[int, int], List[Tuple[int, float]]] = {(0, 0): [(0, 0.0)]}
+            for other in MERGE_ORDER:
+                if other != position:
+                    states, _ = merge_position(states, self._frontiers[other], self.spec,
+                                               self.budget, self.open_slots, filled)
+            self._others[position] = states
+
+    def _invalidate(self, position: str):
+        self._frontiers.pop(position, None)
+        self._others.clear()
+
+    def mark_drafted(self, player: AuctionPlayer):
+        """Another team bought the player"""
+        self.drafted.add(player.name)
+        self._invalidate(player.position)
+
+    def record_purchase(self, player: AuctionPlayer, price: int):
+        """We bought the player; budget, slots and every cached frontier change"""
+        self.drafted.add(player.name)
+        self.roster.append(player)
+        self.budget -= price
+        self.open_slots -= 1
+        self._frontiers.clear()
+        self._others.clear()
+
+    def unmark_drafted(self, player: AuctionPlayer):
+        """Undo mark_drafted: the player is back in the pool"""
+        self.drafted.discard(player.name)
+        self._invalidate(player.position)
+
+    def undo_purchase(self, player: AuctionPlayer, price: int):
+        """Undo record_purchase: refund the price and free the roster spot"""
+        self.drafted.discard(player.name)
+        self.roster.remove(player)
+        self.budget += price
+        self.open_slots += 1
+        self._frontiers.clear()
+        self._others.clear()
+
+    def _position_tables(self, nominated: AuctionPlayer) -> Tuple[List[List[float]], List[List[float]]]:
+        """
+        One knapsack pass over the nominated player's position producing two tables:
+        without[k][c] excludes the player, with_[k][c] forces them in at $0
+        (their price is charged against the budget at lookup time)
+        """
+        position = nominated.position
+        max_count = self.max_count(position)
+        budget = self.budget
+        weights = slot_weights(position, max_count, self.filled[position])
+        cap = self.spec.max_player_price
+
+        without = [[NEG_INF] * (budget + 1) for _ in range(max_count + 1)]
+        with_ = [[NEG_INF] * (budget + 1) for _ in range(max_count + 1)]
+        without[0][0] = 0.0
+
+        seen = 0
+        rivals = [p for p in self._pool[position] if p.name != nominated.name]
+        ordered = sorted(rivals + [nominated], key=lambda p: (-p.projected_points, p.auction_value))
+        for player in ordered:
+            if player is nominated:
+                for k in range(min(seen + 1, max_count), 0, -1):
+                    gain = weights[k - 1] * player.projected_points
+                    with_[k] = [base + gain for base in without[k - 1]]
+                seen += 1
+                continue
+            if cap is not None and player.auction_value > cap:
+                continue
+
+            cost = player.auction_value
+            seen += 1
+            if cost > budget:
+                continue
+            for table in (without, with_):
+                for k in range(min(seen, max_count), 0, -1):
+                    gain = weights[k - 1] * player.projected_points
+                    prev_row, row = table[k - 1], table[k]
+                    for c in range(budget, cost - 1, -1):
+                        base = prev_row[c - cost]
+                        if base != NEG_INF and base + gain > row[c]:
+                            row[c] = base + gain
+
+        return without, with_
+
+    def _best_total(self, others: Dict[Tuple[int, int], List[Tuple[int, float]]], prefix: List[List[float]],
+                    lo_count: int, hi_count: int, budget_left: int) -> float:
+        """Best full roster: cached other-position states plus this position's table"""
+        best = NEG_INF
+        for k in range(lo_count, hi_count + 1):
+            front = others.get((self.open_slots - k, 0), [])  # No elite bounds: e stays 0
+            row = prefix[k]
+            stop = bisect.bisect_right(front, (budget_left, float("inf")))
+            for spend, value in front[:stop]:
+                gain = row[budget_left - spend]
+                if gain != NEG_INF and value + gain > best:
+                    best = value + gain
+        return best
+
+    def recommend(self, nominated: AuctionPlayer) -> BidAdvice:
+        """Max bid for a nominated player given our current roster and budget"""
+        started = time.perf_counter()
+        if not self._others:
+            self.warm()
+
+        affordable = self.budget - (self.open_slots - 1) if self.open_slots > 0 else 0
+        if self.spec.max_player_price is not None:
+            affordable = min(affordable, self.spec.max_player_price)
+
+        position = nominated.position
+        lo_count, hi_count = count_bounds(self.spec, position, self.filled, self._frontiers[position])
+        if affordable < 1 or hi_count < 1:
+            elapsed = (time.perf_counter() - started) * 1000
+            return BidAdvice(nominated, 0, 0.0, NEG_INF, NEG_INF, max(affordable, 0), round(elapsed, 2))
+
+        without, with_ = self._position_tables(nominated)
+        without_prefix = [_prefix_max(row) for row in without]
+        with_prefix = [_prefix_max(row) for row in with_]
+        others = self._others[position]
+
+        points_without = self._best_total(others, without_prefix, lo_count, hi_count, self.budget)
+
+        def points_with(price: int) -> float:
+            return self._best_total(others, with_prefix, max(lo_count, 1), hi_count, self.budget - price)
+
+        # Roster value with the player only falls as the price rises
+        at_one = points_with(1)
+        max_bid = 0
+        if at_one >= points_without:
+            low, high = 1, affordable
+            while low < high:
+                mid = (low + high + 1) // 2
+                if points_with(mid) >= points_without:
+                    low = mid
+                else:
+                    high = mid - 1
+            max_bid = low
+
+        elapsed = (time.perf_counter() - started) * 1000
+        return BidAdvice(
+            player=nominated,
+            max_bid=max_bid,
+            marginal_points=round(at_one - points_without, 1),
+            points_with=round(at_one, 1),
+            points_without=round(points_without, 1),
+            affordable_max=affordable,
+            elapsed_ms=round(elapsed, 2),
+        )
+
+
+def main():
+    players = load_players()
+    recommender = BidRecommender(players)
+
+    print("💰 Live Max-Bid Recommender")
+    print("=" * 50)
+
+    started = time.perf_counter()
+    recommender.warm()
+    print(f"🔥 Warmed optimizer cache in {(time.perf_counter() - started) * 1000:.1f} ms")
+    print(f"📊 Budget: ${recommender.budget} | Open slots: {recommender.open_slots}\n")
+
+    for player in players[:15]:
+        advice = recommender.recommend(player)
+        print(f"   {player.position:<3} {player.name:<24} value ${player.auction_value:<3} "
+              f"max bid ${advice.max_bid:<3} (+{advice.marginal_points} pts) "
+              f"[{advice.elapsed_ms} ms]")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,18 +5,18 @@ Creates a comprehensive 200-player fantasy football CSV with auction values and
 """
 
 import csv
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
-def create_complete_200_player_list():
-    """Create the complete top 200 fantasy football players list"""
+def get_complete_player_data() -> Tuple[List[Dict], Dict[str, str]]:
+    """Return the hand-compiled player list (ranked order) and known ESPN IDs"""
     
     # Known ESPN IDs from our research
     known_ids = {
         "Josh Allen": "3128390",
-        "Justin Jefferson": "3139477", 
+        "Justin Jefferson": "4262921",
         "Davante Adams": "16800",
         "Derrick Henry": "3116385",
-        "Travis Kelce": "16800",
+        "Travis Kelce": "15847",
         "Ja'Marr Chase": "4431750",
         "CeeDee Lamb": "4040715",
         "Cooper Kupp": "2976499",
@@ -212,6 +212,49 @@ def create_complete_200_player_list():
             })
             current_rank += 1
     
+    return players, known_ids
+
+def project_fantasy_points(pos: str, tier: int, rank: int) -> float:
+    """Estimate 2025 PPR points from position, tier and overall rank"""
+    if pos == "QB":
+        base_fpts = 280
+        tier_penalty = tier * 30
+        rank_penalty = rank * 1.5
+    elif pos == "RB": 
+        base_fpts = 250
+        tier_penalty = tier * 25
+        rank_penalty = rank * 1.2
+    elif pos == "WR":
+        base_fpts = 240  
+        tier_penalty = tier * 20
+        rank_penalty = rank * 1.0
+    elif pos == "TE":
+        base_fpts = 160
+        tier_penalty = tier * 15
+        rank_penalty = rank * 0.8
+    else:  # K/DEF
+        base_fpts = 90
+        tier_penalty = tier * 5  
+        rank_penalty = rank * 0.3
+        
+    return max(base_fpts - tier_penalty - rank_penalty, 30)
+
+def draft_priority(rank: int) -> str:
+    """Priority label for drafting by overall rank"""
+    if rank <= 24:
+        return "Must Draft"
+    elif rank <= 60:
+        return "High Priority"  
+    elif rank <= 120:
+        return "Good Value"
+    else:
+        return "Depth/Handcuff"
+
+def create_complete_200_player_list():
+    """Create the complete top 200 fantasy football players list"""
+    
+    players, known_ids = get_complete_player_data()
+    
     # Create final CSV
     with open('complete_top_200_fantasy_football.csv', 'w', newline='', encoding='utf-8') as csvfile:
         fieldnames = [
@@ -227,39 +270,10 @@ def create_complete_200_player_list():
             # Calculate projected fantasy points
             pos = player["pos"]
             tier = player["tier"]
-            
-            if pos == "QB":
-                base_fpts = 280
-                tier_penalty = tier * 30
-                rank_penalty = rank * 1.5
-            elif pos == "RB": 
-                base_fpts = 250
-                tier_penalty = tier * 25
-                rank_penalty = rank * 1.2
-            elif pos == "WR":
-                base_fpts = 240  
-                tier_penalty = tier * 20
-                rank_penalty = rank * 1.0
-            elif pos == "TE":
-                base_fpts = 160
-                tier_penalty = tier * 15
-                rank_penalty = rank * 0.8
-            else:  # K/DEF
-                base_fpts = 90
-                tier_penalty = tier * 5  
-                rank_penalty = rank * 0.3
-                
-            projected_fpts = max(base_fpts - tier_penalty - rank_penalty, 30)
+            projected_fpts = project_fantasy_points(pos, tier, rank)
             
             # Priority for drafting
-            if rank <= 24:
-                priority = "Must Draft"
-            elif rank <= 60:
-                priority = "High Priority"  
-            elif rank <= 120:
-                priority = "Good Value"
-            else:
-                priority = "Depth/Handcuff"
+            priority = draft_priority(rank)
             
             espn_id = known_ids.get(player["name"], "")
             
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Draft-Day Daemon
+A resident asyncio service that keeps the player table, inflation tracker,
+bid recommender and scenario optimizer warm, so draft-night questions are
+answered in milliseconds instead of a fresh Python process each time.
+
+Endpoints (JSON over HTTP/1.1, keep-alive supported):
+    GET  /health
+    GET  /players/search?q=chase&position=WR&limit=10
+    GET  /players/best-available?position=RB&limit=20
+    GET  /players/similar?player=Ja'Marr Chase&max_price=40&k=5&positions=RB,WR,TE
+    GET  /scenarios[?buy=Ja'Marr Chase&price=55]      (what-if: as if I bought the player)
+    GET  /bid-advice?player=Ja'Marr Chase
+    GET  /draft                                      (open lot, budgets, rosters)
+    POST /nominations  {"player": "...", "team": "...", "price": 1}
+    POST /bids   {"team": "...", "price": 43}
+    POST /sales  {"player": "...", "team": "...", "price": 42}
+    POST /undo                                       (reverses the latest nomination, bid or sale)
+
+Nominations, bids, sales and undos are appended to an event log
+(draft_log.py) before they are acknowledged; on restart the daemon replays
+it, so a crash or refresh resumes the draft where it was.
+
+Scenario and bid-advice results are cached by a fingerprint of the draft
+state (draft_fingerprint.py). Undoing a pick or revisiting a what-if answers
+without re-solving.
+
+Usage:
+    python3 draft_daemon.py [--host 127.0.0.1] [--port 8765] [--unix /tmp/draft.sock]
+                            [--log draft_events.jsonl | --no-log]
+
+The Next.js app reaches it through /api/draft/* (src/app/api/draft).
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from auction_players import DEFAULT_BUDGET, TEAMS_PER_LEAGUE, AuctionPlayer
+from bid_recommender import BidRecommender
+from draft_fingerprint import DraftFingerprint, ResultCache
+from draft_log import DEFAULT_LOG, DraftBoard, DraftLog
+from entity_resolution import normalize_name
+from http_service import HTTPError, json_response, read_request
+from inflation_tracker import InflationTracker, SaleEvent
+from player_snapshot import load_players
+from roster_scenario_solver import ScenarioEngine, ScenarioResult
+from search_index import SearchIndex
+from similarity_index import SimilarityIndex
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MY_TEAM = "Me"
+SCENARIO_CACHE_SIZE = 256  # Draft states whose scenarios are kept
+ADVICE_CACHE_SIZE = 4096  # (draft state, player) bid advice entries kept
+
+
+class DraftState:
+    """Everything the endpoints read, built once and updated per sale"""
+
+    def __init__(self, players: List[AuctionPlayer], budget: int = DEFAULT_BUDGET,
+                 teams: Optional[List[str]] = None, my_team: str = MY_TEAM, log_path: Optional[str] = None):
+        self.players = players
+        self.my_team = my_team
+        self.teams = teams or [my_team] + [f"Team {i}" for i in range(2, TEAMS_PER_LEAGUE + 1)]
+        self.by_name: Dict[str, AuctionPlayer] = {normalize_name(p.name): p for p in players}
+        self.tracker = InflationTracker(players, self.teams, budget)
+        self.recommender = BidRecommender(players, budget)
+        self.similarity = SimilarityIndex(players)
+        self.search_index = SearchIndex(players)
+        self.fingerprint = DraftFingerprint(budget)
+        self.scenario_cache = ResultCache(SCENARIO_CACHE_SIZE)
+        self.advice_cache = ResultCache(ADVICE_CACHE_SIZE)
+
+        # The log is the source of truth; replay its sales into everything derived from them
+        self.log = DraftLog(DraftBoard(self.teams, budget, [p.name for p in players]), log_path)
+        for name, team, price in self.log.board.sales:
+            self._apply_sale(self.player(name), team, price)
+
+    def warm(self):
+        """Rebuild the optimizer caches; called at startup and after each sale"""
+        self.scenarios()
+        self.recommender.warm()
+
+    def player(self, name: str) -> AuctionPlayer:
+        player = self.by_name.get(normalize_name(name))
+        if player is None:
+            raise HTTPError(404, f"Unknown player: {name}")
+        return player
+
+    def _player_json(self, player: AuctionPlayer) -> Dict[str, Any]:
+        return dict(asdict(player), available=self.tracker.is_available(player.name),
+                    inflated_value=self.tracker.inflated_value(player))
+
+    def search(self, query: str, position: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        return [self._player_json(p) for p in self.search_index.search(query, position, limit)]
+
+    def best_available(self, position: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        available = [p for p in self.players
+                     if self.tracker.is_available(p.name) and (position is None or p.position == position)]
+        return [self._player_json(p) for p in available[:limit]]
+
+    def similar(self, name: str, k: int = 5, max_price: Optional[int] = None,
+                positions: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        player = self.player(name)
+        return [dict(self._player_json(match), distance=round(distance, 3))
+                for match, distance in self.similarity.nearest(player.name, k, max_price, positions)]
+
+    def scenarios(self, buy: Optional[str] = None, price: int = 1) -> List[ScenarioResult]:
+        """Scenarios for the current state, or for the state after I buy `buy` at `price`"""
+        recommender = self.recommender
+        budget, filled, open_slots = recommender.budget, recommender.filled, recommender.open_slots
+        roster = list(recommender.roster)
+        key = self.fingerprint.value
+        bought = None
+        if buy is not None:
+            bought = self.player(buy)
+            if not self.tracker.is_available(bought.name):
+                raise HTTPError(400, f"{bought.name} is already drafted")
+            if open_slots < 1 or not 1 <= price <= budget:
+                raise HTTPError(400, f"Cannot buy {bought.name} for ${price} with ${budget} and {open_slots} open slots")
+            key = self.fingerprint.after_purchase(bought.name, price)
+            budget, open_slots = budget - price, open_slots - 1
+            filled = dict(filled, **{bought.position: filled[bought.position] + 1})
+            roster.append(bought)
+
+        def solve() -> List[ScenarioResult]:
+            available = [p for p in self.players if self.tracker.is_available(p.name) and p is not bought]
+            engine = ScenarioEngine(available, budget, filled, open_slots, roster=roster)
+            return engine.solve_all(workers=1)  # Already resident; no pool startup
+
+        return self.scenario_cache.get_or_compute(key, solve)
+
+    def bid_advice(self, name: str) -> Dict[str, Any]:
+        player = self.player(name)
+        if not self.tracker.is_available(player.name):
+            raise HTTPError(400, f"{player.name} is already drafted")
+        advice = self.advice_cache.get_or_compute((self.fingerprint.value, player.name),
+                                                  lambda: self.recommender.recommend(player))
+        return dict(asdict(advice), player=self._player_json(player),
+                    league_max_bid=self.tracker.highest_max_bid(excluding=self.my_team))
+
+    def _record(self, kind: str, player: str = "", team: str = "", price: int = 0):
+        try:
+            return self.log.record(kind, player, team, price)
+        except ValueError as error:
+            raise HTTPError(400, str(error))
+
+    def _apply_sale(self, player: AuctionPlayer, team: str, price: int):
+        self.tracker.record_sale(SaleEvent(player.name, team, price))
+        if team == self.my_team:
+            self.recommender.record_purchase(player, price)
+            self.fingerprint.purchase(player.name, price)
+        else:
+            self.recommender.mark_drafted(player)
+            self.fingerprint.toggle_drafted(player.name)
+        self.similarity.remove(player.name)
+
+    def board(self) -> Dict[str, Any]:
+        return dict(self.log.board.to_json(), inflation=round(self.tracker.inflation, 3))
+
+    def nominate(self, name: str, team: str, price: int = 1) -> Dict[str, Any]:
+        self._record("nominate", self.player(name).name, team, price)
+        return self.board()
+
+    def bid(self, team: str, price: int) -> Dict[str, Any]:
+        self._record("bid", team=team, price=price)
+        return self.board()
+
+    def record_sale(self, name: str, team: str, price: int) -> Dict[str, Any]:
+        player = self.player(name)
+        self._record("sale", player.name, team, price)
+        self._apply_sale(player, team, price)
+        return {'player': player.name, 'team': team, 'price': price, 'inflation': round(self.tracker.inflation, 3)}
+
+    def undo(self) -> Dict[str, Any]:
+        """Reverse the latest nomination, bid or sale"""
+        _, undone = self._record("undo")
+        if undone.kind == "sale":
+            player = self.player(undone.player)
+            self.tracker.undo_sale()
+            if undone.team == self.my_team:
+                self.recommender.undo_purchase(player, undone.price)
+                self.fingerprint.undo_purchase(player.name, undone.price)
+            else:
+                self.recommender.unmark_drafted(player)
+                self.fingerprint.toggle_drafted(player.name)
+            self.similarity.restore(player.name)
+        return dict(self.board(), undone={'kind': undone.kind, 'player': undone.player,
+                                          'team': undone.team, 'price': undone.price})
+
+
+def _scenario_json(result: ScenarioResult) -> Dict[str, Any]:
+    return {
+        'key': result.key,
+        'name': result.name,
+        'description': result.description,
+        'feasible': result.feasible,
+        'total_cost': result.total_cost,
+        'projected_points': result.projected_points,
+        'weighted_points': result.weighted_points,
+        'spend_by_position': result.spend_by_position(),
+        'players': [asdict(p) for p in result.players],
+    }
+
+
+class DraftDaemon:
+    def __init__(self, state: DraftState):
+        self.state = state
+        self.lock = asyncio.Lock()  # One optimizer query or sale at a time
+        self._background = set()
+        self.routes = {
+            ('GET', '/health'): self.health,
+            ('GET', '/players/search'): self.search,
+            ('GET', '/players/best-available'): self.best_available,
+            ('GET', '/players/similar'): self.similar,
+            ('GET', '/scenarios'): self.scenarios,
+            ('GET', '/bid-advice'): self.bid_advice,
+            ('GET', '/draft'): self.draft,
+            ('POST', '/nominations'): self.nominations,
+            ('POST', '/bids'): self.bids,
+            ('POST', '/sales'): self.sales,
+            ('POST', '/undo'): self.undo,
+        }
+
+    async def _solve(self, func, *args):
+        """
+        Run an optimizer solve off the event loop so connections keep being
+        accepted. The lock keeps draft actions out while it reads the state;
+        a solve only writes the optimizer and result caches, which handlers on
+        the loop never iterate.
+        """
+        async with self.lock:
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _mutate(self, func, *args):
+        """
+        Apply a draft action inline on the event loop. Actions are O(1), and
+        running them on the loop means no search, /draft or /health read can
+        see a half-applied one. The lock makes them wait for a solve in flight.
+        """
+        async with self.lock:
+            return func(*args)
+
+    async def health(self, query: Dict[str, str], body: Dict[str, Any]) -> Dict[str, Any]:
+        return {'status': 'ok', 'players': len(self.state.players), 'sales': len(self.state.tracker.sales),
+                'inflation': round(self.state.tracker.inflation, 3),
+                'scenario_cache': self.state.scenario_cache.stats(), 'advice_cache': self.state.advice_cache.stats()}
+
+    async def search(self, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        if not query.get('q'):
+            raise HTTPError(400, "q is required")
+        return self.state.search(query['q'], query.get('position'), int(query.get('limit', 10)))
+
+    async def best_available(self, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        return self.state.best_available(query.get('position'), int(query.get('limit', 20)))
+
+    async def similar(self, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        if not query.get('player'):
+            raise HTTPError(400, "player is required")
+        max_price = int(query['max_price']) if query.get('max_price') else None
+        positions = query['positions'].split(',') if query.get('positions') else None
+        return self.state.similar(query['player'], int(query.get('k', 5)), max_price, positions)
+
+    async def scenarios(self, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        try:
+            price = int(query.get('price', 1))
+        except ValueError:
+            raise HTTPError(400, "price must be an integer")
+        results = await self._solve(self.state.scenarios, query.get('buy'), price)
+        return [_scenario_json(r) for r in sorted(results, key=lambda r: -r.weighted_points)]
+
+    async def bid_advice(self, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        if not query.get('player'):
+            raise HTTPError(400, "player is required")
+        return await self._solve(self.state.bid_advice, query['player'])
+
+    def _rewarm(self):
+        task = asyncio.get_running_loop().create_task(self._solve(self.state.warm))  # Re-warm in the background
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def draft(self, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        return self.state.board()
+
+    async def nominations(self, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        try:
+            player, team, price = body['player'], body.get('team', self.state.my_team), int(body.get('price', 1))
+        except (KeyError, TypeError, ValueError):
+            raise HTTPError(400, "player is required")
+        return await self._mutate(self.state.nominate, player, team, price)
+
+    async def bids(self, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        try:
+            team, price = body.get('team', self.state.my_team), int(body['price'])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPError(400, "price is required")
+        return await self._mutate(self.state.bid, team, price)
+
+    async def sales(self, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        try:
+            player, team, price = body['player'], body.get('team', self.state.my_team), int(body['price'])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPError(400, "player and price are required")
+        result = await self._mutate(self.state.record_sale, player, team, price)
+        self._rewarm()
+        return result
+
+    async def undo(self, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        result = await self._mutate(self.state.undo)
+        if result['undone']['kind'] == "sale":
+            self._rewarm()
+        return result
+
+    async def dispatch(self, method: str, target: str, raw_body: bytes) -> Tuple[int, Any]:
+        url = urlsplit(target)
+        handler = self.routes.get((method, url.path))
+        if handler is None:
+            known_path = any(path == url.path for _, path in self.routes)
+            return (405, {'error': 'method not allowed'}) if known_path else (404, {'error': 'not found'})
+
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+            return 200, await handler(query, body)
+        except HTTPError as error:
+            return error.status, {'error': str(error)}
+        except (json.JSONDecodeError, ValueError) as error:
+            return 400, {'error': str(error)}
+        except Exception as error:  # Keep serving the draft whatever one request does
+            return 500, {'error': repr(error)}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                started = time.perf_counter()
+                if request.too_large:
+                    status, payload = 413, {'error': 'body too large'}
+                else:
+                    status, payload = await self.dispatch(request.method, request.target, request.body)
+
+                writer.write(json_response(status, payload, request.keep_alive, time.perf_counter() - started))
+                await writer.drain()
+                if not request.keep_alive or request.too_large:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionResetError):
+            pass  # Malformed request or client went away
+        finally:
+            writer.close()
+
+
+async def serve(state: DraftState, host: str, port: int, unix_path: Optional[str] = None):
+    daemon = DraftDaemon(state)
+    if unix_path:
+        server = await asyncio.start_unix_server(daemon.handle_connection, path=unix_path)
+        where = unix_path
+    else:
+        server = await asyncio.start_server(daemon.handle_connection, host, port)
+        where = f"http://{host}:{server.sockets[0].getsockname()[1]}"  # Port 0 binds a free port
+    print(f"🟢 Listening on {where}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resident draft-day query service")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', help="Serve on a Unix socket instead of TCP")
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET)
+    parser.add_argument('--log', default=DEFAULT_LOG, help="Draft event log to append to and recover from")
+    parser.add_argument('--no-log', action='store_true', help="Keep the draft in memory only")
+    args = parser.parse_args()
+
+    print("🏟️  Draft-Day Daemon")
+    print("=" * 50)
+    started = time.perf_counter()
+    state = DraftState(load_players(), args.budget, log_path=None if args.no_log else args.log)
+    if state.log.path:
+        print(f"♻️  {state.log.path}: event {state.log.board.seq}, {len(state.log.board.sales)} sales recovered")
+    state.warm()
+    print(f"🔥 {len(state.players)} players, optimizer warmed in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    try:
+        asyncio.run(serve(state, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print("\n👋 Daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Draft-State Fingerprint and Result Cache
+Memoizes optimizer results by a Zobrist fingerprint of the draft state. Toggling
+between states ("what if I buy X? what if I don't?") is then answered from
+cache instead of re-solving.
+
+The fingerprint XORs one 64-bit key per drafted player, one per player on my
+roster and one for my remaining budget:
+
+    fingerprint = XOR drafted[p] ^ XOR mine[p] ^ budget[b]
+
+A pick changes it with two or three XORs. XOR is its own inverse, so undoing a
+pick lands back on the earlier fingerprint and on the results cached for it.
+Every input of the scenario engine and the bid recommender is a function of
+these three parts: the available pool, filled slots, open slots and budget.
+Keys are hashes of the player name, so the same state always has the same
+fingerprint, whatever order the picks came in.
+
+Results live in a size-bounded LRU.
+
+Usage:
+    python3 draft_fingerprint.py [--toggles 20] [--picks 30]
+"""
+
+import argparse
+import hashlib
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from auction_players import DEFAULT_BUDGET
+
+
+def zobrist_key(*parts: Any) -> int:
+    """Stable 64-bit key for one piece of draft state"""
+    digest = hashlib.blake2b(":".join(map(str, parts)).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+class DraftFingerprint:
+    """Incrementally maintained XOR hash of drafted players, my roster and my budget"""
+
+    def __init__(self, budget: int = DEFAULT_BUDGET):
+        self.budget = budget
+        self.value = zobrist_key('budget', budget)
+
+    def _budget_delta(self, budget: int) -> int:
+        return zobrist_key('budget', self.budget) ^ zobrist_key('budget', budget)
+
+    def toggle_drafted(self, name: str):
+        """Another team bought the player, or that sale was undone"""
+        self.value ^= zobrist_key('drafted', name)
+
+    def purchase(self, name: str, price: int):
+        self.value ^= self.purchase_delta(name, price)
+        self.budget -= price
+
+    def undo_purchase(self, name: str, price: int):
+        self.budget += price
+        self.value ^= self.purchase_delta(name, price)
+
+    def purchase_delta(self, name: str, price: int) -> int:
+        """XOR that turns the fingerprint before buying `name` into the one after (and back)"""
+        return zobrist_key('drafted', name) ^ zobrist_key('mine', name) ^ self._budget_delta(self.budget - price)
+
+    def after_purchase(self, name: str, price: int) -> int:
+        """The fingerprint if I bought `name` at `price`, without changing this one"""
+        return self.value ^ self.purchase_delta(name, price)
+
+
+class ResultCache:
+    """Size-bounded LRU of results keyed by draft fingerprint"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        if key not in self._entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: Hashable, value: Any):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        return {'entries': len(self._entries), 'max_entries': self.max_entries,
+                'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+def main():
+    from draft_daemon import DraftState
+    from player_snapshot import load_players
+
+    parser = argparse.ArgumentParser(description="Time scenario toggles with and without the fingerprint cache")
+    parser.add_argument('--picks', type=int, default=30, help="Sales made before toggling")
+    parser.add_argument('--toggles', type=int, default=20, help="Buy/undo round trips")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print("🧬 Draft-State Fingerprint Cache")
+    print("=" * 50)
+    state = DraftState(load_players())
+    rng = random.Random(args.seed)
+    others = [team for team in state.teams if team != state.my_team]
+    for i, player in enumerate(state.players[:args.picks]):
+        team = others[i % len(others)]
+        price = min(max(1, player.auction_value + rng.randint(-3, 3)), state.log.board.max_bid(team))
+        state.nominate(player.name, team)
+        state.record_sale(player.name, team, price)
+    print(f"📊 {args.picks} players sold, fingerprint {state.fingerprint.value:016x}")
+
+    target = next(p for p in state.players if state.tracker.is_available(p.name))
+
+    def toggle() -> float:
+        started = time.perf_counter()
+        state.nominate(target.name, state.my_team)
+        state.record_sale(target.name, state.my_team, target.auction_value)
+        state.scenarios()
+        state.undo()
+        state.undo()  # The sale, then the nomination
+        state.scenarios()
+        return (time.perf_counter() - started) * 1000
+
+    first = toggle()
+    repeats = [toggle() for _ in range(args.toggles)]
+    cache = state.scenario_cache.stats()
+    print(f"🔁 Buy/undo toggle of {target.name}: {first:.1f} ms the first time, "
+          f"{sum(repeats) / len(repeats):.2f} ms on average for the next {len(repeats)}")
+    print(f"   Scenario cache: {cache['hits']} hits, {cache['misses']} misses, {cache['entries']} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+"""
+Live Draft Hub
+Hosts many concurrent draft rooms in one asyncio process, so everyone in a
+room sees nominations, bids and sales the moment they happen instead of
+every client polling Supabase.
+
+- Each room is a DraftLog (draft_log.py). Actions are validated and applied
+  synchronously on the event loop, so a room's events are strictly ordered
+  without locks
+- Clients follow a room over Server-Sent Events: the full board once on
+  connect, then one compact diff per event (the lot on the block, and after
+  a sale the player and the buying team's money) rather than player lists
+- A diff is encoded once and written to every subscriber without waiting on
+  any of them. A client that stops reading is dropped once its send buffer
+  passes MAX_CLIENT_BUFFER; reconnecting with Last-Event-ID replays the
+  room's recent diffs, or sends the full board if it fell too far behind
+- With --log-dir, rooms persist to <room>.jsonl and come back on restart.
+  An action is acknowledged only once it is fsynced, but the fsyncs run on
+  worker threads, not the event loop, and are grouped: every action that
+  arrives while one batch is syncing shares the next fsync of its room's log.
+  Followers get the diff straight away; after a crash, a follower that saw
+  an unsynced event gets the full board when it reconnects
+
+Endpoints:
+    GET  /rooms                                  (room ids, events, clients)
+    POST /rooms  {"room": "league-1", "teams": ["Me", ...], "budget": 200}
+    GET  /rooms/<room>                           (full board)
+    GET  /rooms/<room>/events                    (SSE stream)
+    POST /rooms/<room>/nominations  {"player": "...", "team": "...", "price": 1}
+    POST /rooms/<room>/bids         {"team": "...", "price": 43}
+    POST /rooms/<room>/sales        {} sells the lot to its leader, or {"player", "team", "price"}
+    POST /rooms/<room>/undo
+    GET  /stats                                  (hub counters and CPU time)
+
+`load` is the bundled load generator: it opens --rooms rooms with --clients
+SSE followers each, drives every room's auction at --rate actions per
+second, and reports throughput and latency percentiles for actions and for
+diff delivery to followers. Without --url it starts a hub on a free port,
+persisting to --log-dir if given.
+
+Usage:
+    python3 draft_hub.py serve [--port 8766] [--log-dir rooms]
+    python3 draft_hub.py load [--rooms 300] [--clients 10] [--rate 2] [--seconds 20]
+                              [--url http://host:port | --log-dir DIR]
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from auction_players import DEFAULT_BUDGET
+from draft_log import DraftBoard, DraftEvent, DraftLog, Lot, default_teams
+from entity_resolution import normalize_name
+from http_service import HTTPError, Request, json_response, percentile, read_request, request_json, start_server
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8766
+RECENT_DIFFS = 256  # Per room, for Last-Event-ID catch-up
+MAX_CLIENT_BUFFER = 256 * 1024  # Unsent bytes before a follower counts as stalled
+HEARTBEAT_SECONDS = 15  # Comment line that keeps idle streams open through proxies
+ROOM_ID = re.compile(r'^[A-Za-z0-9_-]{1,64}$')  # Room ids double as log file names
+
+SSE_HEADERS = (b"HTTP/1.1 200 OK\r\n"
+               b"Content-Type: text/event-stream\r\n"
+               b"Cache-Control: no-cache\r\n"
+               b"Connection: keep-alive\r\n\r\n")
+
+
+def sse_message(seq: int, event: str, payload: Any) -> bytes:
+    return f"id: {seq}\nevent: {event}\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n".encode('utf-8')
+
+
+def _lot(lot: Optional[Lot]) -> Optional[List[Any]]:
+    return [lot.player, lot.price, lot.leader, lot.nominator] if lot else None
+
+
+def board_diff(board: DraftBoard, event: DraftEvent, undone: Optional[DraftEvent]) -> Dict[str, Any]:
+    """
+    What changed with one event: the lot ([player, price, leader, nominator]
+    or null) always; after a sale, or the undo of one, the player and the
+    team's new [team, budget, open_slots]
+    """
+    diff: Dict[str, Any] = {'seq': event.seq, 'kind': event.kind, 'lot': _lot(board.lot)}
+    sale = event if event.kind == "sale" else undone if undone and undone.kind == "sale" else None
+    if undone:
+        diff['undid'] = undone.kind
+    if sale:
+        diff['sold' if event.kind == "sale" else 'unsold'] = [sale.player, sale.team, sale.price]
+        diff['team'] = [sale.team, board.budgets[sale.team], board.open_slots(sale.team)]
+    return diff
+
+
+class Room:
+    def __init__(self, room_id: str, log: DraftLog):
+        self.id = room_id
+        self.log = log
+        self.subscribers: Set[asyncio.StreamWriter] = set()
+        self.recent: Deque[Tuple[int, bytes]] = deque(maxlen=RECENT_DIFFS)
+        self.dropped = 0
+
+    def act(self, kind: str, player: str = "", team: str = "", price: int = 0) -> Dict[str, Any]:
+        """Apply one action and broadcast its diff; ValueError if it is not legal now"""
+        event, undone = self.log.record(kind, player, team, price)
+        diff = board_diff(self.log.board, event, undone)
+        message = sse_message(event.seq, "diff", diff)
+        self.recent.append((event.seq, message))
+        self.broadcast(message)
+        return diff
+
+    def broadcast(self, message: bytes) -> int:
+        """Queue `message` on every follower's socket; returns how many got it"""
+        sent = 0
+        for writer in list(self.subscribers):
+            transport = writer.transport
+            if transport.is_closing() or transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+                self.subscribers.discard(writer)
+                self.dropped += 1
+                writer.close()
+                continue
+            writer.write(message)
+            sent += 1
+        return sent
+
+    def catch_up(self, since: int) -> Optional[List[bytes]]:
+        """The diffs after event `since`, or None if they are no longer all held"""
+        seq = self.log.board.seq
+        if since == seq:
+            return []
+        if 0 <= since < seq and self.recent and self.recent[0][0] <= since + 1:
+            return [message for event_seq, message in self.recent if event_seq > since]
+        return None
+
+
+class GroupCommit:
+    """
+    Fsyncs room logs on worker threads instead of the event loop. A batch
+    syncs every room with unsynced events, each room's log in parallel; actions
+    recorded meanwhile wait for the next batch, so under load one fsync covers
+    many actions.
+    """
+
+    def __init__(self):
+        self.logs: Set[DraftLog] = set()
+        self.waiters: List[Tuple[asyncio.Future, Any]] = []
+        self.wake = asyncio.Event()
+        self.batches = 0
+        self.fsyncs = 0
+        self.committed = 0
+
+    def add(self, log: DraftLog, result: Any) -> asyncio.Future:
+        """A future that resolves to `result` once everything `log` has recorded is on disk"""
+        waiter = asyncio.get_running_loop().create_future()
+        self.logs.add(log)
+        self.waiters.append((waiter, result))
+        self.wake.set()
+        return waiter
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self.wake.wait()
+            self.wake.clear()
+            logs, waiters = self.logs, self.waiters
+            self.logs, self.waiters = set(), []
+            syncs = [log.commit() for log in logs]  # On the loop, so no event is half recorded
+            error: Optional[OSError] = None
+            try:
+                await asyncio.gather(*(loop.run_in_executor(None, sync) for sync in syncs))
+            except OSError as failed:
+                error = failed
+            self.batches += 1
+            self.fsyncs += len(syncs)
+            self.committed += len(waiters)
+            for waiter, result in waiters:
+                if waiter.done():
+                    continue
+                if error:
+                    waiter.set_exception(error)
+                else:
+                    waiter.set_result(result)
+
+
+class DraftHub:
+    def __init__(self, players: List[str], log_dir: Optional[str] = None):
+        self.players = players
+        self.canonical: Dict[str, str] = {normalize_name(name): name for name in players}
+        self.log_dir = log_dir
+        self.rooms: Dict[str, Room] = {}
+        self.events = 0
+        self.deliveries = 0
+        self.committer = GroupCommit() if log_dir else None
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+            for meta_path in sorted(glob.glob(os.path.join(log_dir, "*.room.json"))):
+                with open(meta_path, encoding='utf-8') as handle:
+                    meta = json.load(handle)
+                self._open_room(meta['room'], meta['teams'], meta['budget'])
+
+    def _open_room(self, room_id: str, teams: List[str], budget: int) -> Room:
+        path = os.path.join(self.log_dir, f"{room_id}.jsonl") if self.log_dir else None
+        room = Room(room_id, DraftLog(DraftBoard(teams, budget, self.players), path, group_commit=True))
+        self.rooms[room_id] = room
+        return room
+
+    def create_room(self, room_id: str, teams: Optional[List[str]] = None, budget: int = DEFAULT_BUDGET) -> Room:
+        if not ROOM_ID.match(room_id or ""):
+            raise HTTPError(400, "room must be 1-64 letters, digits, '-' or '_'")
+        if room_id in self.rooms:
+            raise HTTPError(409, f"Room {room_id} already exists")
+        teams = list(teams or default_teams())
+        if len(set(teams)) != len(teams) or len(teams) < 2:
+            raise HTTPError(400, "teams must be at least two distinct names")
+        if self.log_dir:
+            with open(os.path.join(self.log_dir, f"{room_id}.room.json"), 'w', encoding='utf-8') as handle:
+                json.dump({'room': room_id, 'teams': teams, 'budget': budget}, handle)
+        return self._open_room(room_id, teams, budget)
+
+    def room(self, room_id: str) -> Room:
+        room = self.rooms.get(room_id)
+        if room is None:
+            raise HTTPError(404, f"Unknown room: {room_id}")
+        return room
+
+    def player(self, name: str) -> str:
+        player = self.canonical.get(normalize_name(name or ""))
+        if player is None:
+            raise HTTPError(404, f"Unknown player: {name}")
+        return player
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {
+            'rooms': len(self.rooms),
+            'clients': sum(len(room.subscribers) for room in self.rooms.values()),
+            'events': self.events,
+            'deliveries': self.deliveries,
+            'dropped': sum(room.dropped for room in self.rooms.values()),
+            'cpu_seconds': round(time.process_time(), 3),
+        }
+        if self.committer:
+            stats.update(commit_batches=self.committer.batches, fsyncs=self.committer.fsyncs,
+                         committed=self.committer.committed)
+        return stats
+
+    def _act(self, room: Room, kind: str, body: Dict[str, Any]) -> Any:
+        """The diff, or with --log-dir a future of it that resolves once the event is fsynced"""
+        lot = room.log.board.lot
+        try:
+            if kind == "nominate":
+                args = (self.player(body.get('player')), body['team'], int(body.get('price', 1)))
+            elif kind == "bid":
+                args = ("", body['team'], int(body['price']))
+            elif kind == "sale" and not body:
+                if lot is None:
+                    raise HTTPError(400, "No player is on the block")
+                args = (lot.player, lot.leader, lot.price)
+            elif kind == "sale":
+                args = (self.player(body.get('player')), body['team'], int(body['price']))
+            else:
+                args = ()
+        except (KeyError, TypeError, ValueError):
+            raise HTTPError(400, f"Missing or invalid fields for {kind}")
+        try:
+            diff = room.act(kind, *args)
+        except ValueError as error:
+            raise HTTPError(400, str(error))
+        self.events += 1
+        self.deliveries += len(room.subscribers)
+        return self.committer.add(room.log, diff) if self.committer else diff
+
+    def dispatch(self, method: str, path: str, body: Dict[str, Any]) -> Any:
+        parts = path.strip('/').split('/')
+        if parts == ['stats'] and method == 'GET':
+            return self.stats()
+        if parts[0] != 'rooms' or len(parts) > 3:
+            raise HTTPError(404, "not found")
+        if len(parts) == 1:
+            if method == 'GET':
+                return [{'room': room.id, 'seq': room.log.board.seq, 'clients': len(room.subscribers)}
+                        for room in self.rooms.values()]
+            if method == 'POST':
+                room = self.create_room(body.get('room'), body.get('teams'), int(body.get('budget', DEFAULT_BUDGET)))
+                return room.log.board.to_json()
+            raise HTTPError(405, "method not allowed")
+
+        room = self.room(parts[1])
+        if len(parts) == 2:
+            if method != 'GET':
+                raise HTTPError(405, "method not allowed")
+            return room.log.board.to_json()
+        kind = {'nominations': "nominate", 'bids': "bid", 'sales': "sale", 'undo': "undo"}.get(parts[2])
+        if kind is None:
+            raise HTTPError(404, "not found")
+        if method != 'POST':
+            raise HTTPError(405, "method not allowed")
+        return self._act(room, kind, body)
+
+    async def stream(self, room: Room, request: Request, reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter):
+        """Follow a room until the client disconnects"""
+        since = request.headers.get('last-event-id') or \
+            parse_qs(urlsplit(request.target).query).get('since', [None])[-1]
+        backlog = room.catch_up(int(since)) if since and since.isdigit() else None
+        writer.write(SSE_HEADERS)
+        if backlog is None:
+            writer.write(sse_message(room.log.board.seq, "state", room.log.board.to_json()))
+        else:
+            writer.writelines(backlog)
+        room.subscribers.add(writer)  # No await since the state was written, so no diff falls in between
+        try:
+            await writer.drain()
+            while await reader.read(4096):
+                pass
+        finally:
+            room.subscribers.discard(writer)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                started = time.perf_counter()
+                path = urlsplit(request.target).path
+                parts = path.strip('/').split('/')
+                if request.method == 'GET' and len(parts) == 3 and parts[0] == 'rooms' and parts[2] == 'events':
+                    room = self.rooms.get(parts[1])
+                    if room is not None:
+                        await self.stream(room, request, reader, writer)
+                        break
+
+                if request.too_large:
+                    status, payload = 413, {'error': 'body too large'}
+                else:
+                    try:
+                        body = json.loads(request.body) if request.body else {}
+                        status, payload = 200, self.dispatch(request.method, path, body)
+                        if asyncio.isfuture(payload):
+                            payload = await payload  # Acknowledge only once it is on disk
+                    except HTTPError as error:
+                        status, payload = error.status, {'error': str(error)}
+                    except (json.JSONDecodeError, AttributeError, ValueError) as error:
+                        status, payload = 400, {'error': str(error)}
+                    except OSError as error:
+                        status, payload = 500, {'error': f"could not persist: {error}"}
+                writer.write(json_response(status, payload, request.keep_alive, time.perf_counter() - started))
+                await writer.drain()
+                if not request.keep_alive or request.too_large:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass  # Malformed request or client went away
+        finally:
+            writer.close()
+
+    async def heartbeat(self):
+        while True:
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+            for room in self.rooms.values():
+                room.broadcast(b": keep-alive\n\n")
+
+
+async def serve(hub: DraftHub, host: str, port: int):
+    """Port 0 binds a free port; the listening line names the one chosen"""
+    server = await asyncio.start_server(hub.handle_connection, host, port, backlog=4096)
+    loop = asyncio.get_running_loop()
+    tasks = [loop.create_task(hub.heartbeat())]
+    if hub.committer:
+        tasks.append(loop.create_task(hub.committer.run()))
+    port = server.sockets[0].getsockname()[1]
+    print(f"🟢 Hub listening on http://{host}:{port} ({len(hub.rooms)} rooms)", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def start_hub(host: str, log_dir: Optional[str] = None) -> Tuple[subprocess.Popen, int]:
+    """Run `serve` in a child process on a free port; returns it and the port"""
+    command = [sys.executable, os.path.abspath(__file__), 'serve', '--host', host, '--port', '0']
+    if log_dir:
+        command += ['--log-dir', log_dir]
+    return start_server(command, "Hub")
+
+
+# Load generator
+
+class LoadStats:
+    def __init__(self):
+        self.action_ms: List[float] = []
+        self.delivery_ms: List[float] = []
+        self.actions = 0
+        self.rejected = 0
+        self.deliveries = 0
+        self.diff_bytes = 0
+        self.state_bytes = 0
+
+
+def percentiles(values: List[float]) -> str:
+    if not values:
+        return "n/a"
+    ordered = sorted(values)
+    return (f"p50 {percentile(ordered, 0.50):.1f} / p95 {percentile(ordered, 0.95):.1f} / "
+            f"p99 {percentile(ordered, 0.99):.1f} ms")
+
+
+async def follow(host: str, port: int, room_id: str, sent: Dict[Tuple[str, int], float], stats: LoadStats,
+                 connect_slots: asyncio.Semaphore):
+    """One SSE follower: times each diff from the moment its action was sent"""
+    async with connect_slots:
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(f"GET /rooms/{room_id}/events HTTP/1.1\r\nHost: hub\r\n\r\n".encode('latin-1'))
+        while (await reader.readline()) not in (b'\r\n', b''):
+            pass
+    seq = 0
+    event = b''
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if line.startswith(b'id: '):
+                seq = int(line[4:])
+            elif line.startswith(b'event: '):
+                event = line[7:-1]
+            elif line.startswith(b'data: '):
+                if event == b'diff':
+                    stats.deliveries += 1
+                    stats.diff_bytes += len(line)
+                    started = sent.get((room_id, seq))
+                    if started is not None:
+                        stats.delivery_ms.append((time.perf_counter() - started) * 1000)
+                else:
+                    stats.state_bytes = len(line)
+    finally:
+        writer.close()
+
+
+async def drive(host: str, port: int, room_id: str, players: List[str], rate: float, stop_at: float,
+                sent: Dict[Tuple[str, int], float], stats: LoadStats, seed: int):
+    """Run one room's auction: nominate, a bidding war, sell, repeat, at `rate` actions per second"""
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    status, board = await request_json(reader, writer, 'GET', f"/rooms/{room_id}")
+    seq = board['seq']
+    teams = {team['team']: [team['budget'], team['open_slots']] for team in board['teams']}
+    names = list(teams)
+    queue = iter(rng.sample(players, len(players)))
+    lot = None
+    bids_left = 0
+    turn = 0
+    await asyncio.sleep(rng.random() / rate)  # Spread rooms across the interval
+
+    def max_bid(team: str) -> int:
+        budget, open_slots = teams[team]
+        return budget - (open_slots - 1) if open_slots > 0 else 0
+
+    try:
+        while time.perf_counter() < stop_at:
+            if lot is None:
+                open_teams = [team for team in names if teams[team][1] > 0]
+                if not open_teams:
+                    break  # Draft complete
+                nominator = open_teams[turn % len(open_teams)]
+                turn += 1
+                player = next(queue, None)
+                if player is None:
+                    break
+                path, body = f"/rooms/{room_id}/nominations", {'player': player, 'team': nominator}
+                bids_left = rng.randint(2, 12)
+            else:
+                bidders = [team for team in names if team != lot[2] and max_bid(team) > lot[1]]
+                if bids_left and bidders:
+                    bidder = rng.choice(bidders)
+                    price = min(lot[1] + rng.randint(1, 3), max_bid(bidder))
+                    path, body = f"/rooms/{room_id}/bids", {'team': bidder, 'price': price}
+                    bids_left -= 1
+                else:
+                    path, body = f"/rooms/{room_id}/sales", {}
+
+            sent[(room_id, seq + 1)] = started = time.perf_counter()
+            status, diff = await request_json(reader, writer, 'POST', path, body)
+            stats.action_ms.append((time.perf_counter() - started) * 1000)
+            if status != 200:
+                stats.rejected += 1
+                status, board = await request_json(reader, writer, 'GET', f"/rooms/{room_id}")  # Resync
+                seq, lot = board['seq'], _lot(Lot(**board['lot'])) if board['lot'] else None
+                continue
+            stats.actions += 1
+            seq, lot = diff['seq'], diff['lot']
+            if 'team' in diff:
+                team, budget, open_slots = diff['team']
+                teams[team] = [budget, open_slots]
+            await asyncio.sleep(min(rng.expovariate(rate), max(stop_at - time.perf_counter(), 0)))
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, rooms: int, clients: int, rate: float, seconds: float,
+                   players: List[str]):
+    stats = LoadStats()
+    sent: Dict[Tuple[str, int], float] = {}
+    run_id = f"{int(time.time()) % 100000}"
+    room_ids = [f"load-{run_id}-{i:04d}" for i in range(rooms)]
+
+    reader, writer = await asyncio.open_connection(host, port)
+    for room_id in room_ids:
+        status, payload = await request_json(reader, writer, 'POST', "/rooms", {'room': room_id})
+        if status != 200:
+            raise RuntimeError(f"Could not create {room_id}: {payload}")
+
+    started = time.perf_counter()
+    connect_slots = asyncio.Semaphore(200)  # Bound concurrent connects so the listen backlog keeps up
+    loop = asyncio.get_running_loop()
+    followers = [loop.create_task(follow(host, port, room_id, sent, stats, connect_slots))
+                 for room_id in room_ids for _ in range(clients)]
+    while True:  # Every follower is subscribed before any room starts
+        status, hub_stats = await request_json(reader, writer, 'GET', "/stats")
+        if hub_stats['clients'] >= rooms * clients or time.perf_counter() - started > 60:
+            break
+        await asyncio.sleep(0.2)
+    connected = hub_stats['clients']
+    print(f"🔌 {connected:,} followers in {rooms} rooms connected in {time.perf_counter() - started:.1f} s")
+
+    cpu_before, own_before = hub_stats['cpu_seconds'], time.process_time()
+    started = time.perf_counter()
+    stop_at = started + seconds
+    await asyncio.gather(*(drive(host, port, room_id, players, rate, stop_at, sent, stats, seed)
+                           for seed, room_id in enumerate(room_ids)))
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(1.0)  # Let the last diffs arrive
+    status, hub_stats = await request_json(reader, writer, 'GET', "/stats")
+    hub_cpu = (hub_stats['cpu_seconds'] - cpu_before) / elapsed
+    own_cpu = (time.process_time() - own_before) / elapsed
+
+    for task in followers:
+        task.cancel()
+    writer.close()
+
+    expected = stats.actions * clients
+    print(f"⚡ {stats.actions:,} actions in {elapsed:.1f} s ({stats.actions / elapsed:,.0f}/s), "
+          f"{stats.rejected} rejected; round trip {percentiles(stats.action_ms)}")
+    print(f"📡 {stats.deliveries:,} diffs delivered ({stats.deliveries / elapsed:,.0f}/s) of {expected:,} expected, "
+          f"{hub_stats['dropped']} followers dropped; delivery {percentiles(stats.delivery_ms)}")
+    if stats.deliveries:
+        print(f"📦 {stats.diff_bytes / stats.deliveries:.0f} bytes per diff vs {stats.state_bytes:,} for the full board")
+    print(f"🖥️  CPU: hub {hub_cpu:.0%}, load generator {own_cpu:.0%} of one core")
+    if 'commit_batches' in hub_stats and hub_stats['commit_batches']:
+        print(f"💾 {hub_stats['committed']:,} actions fsynced in {hub_stats['commit_batches']:,} batches "
+              f"({hub_stats['committed'] / hub_stats['commit_batches']:.1f} actions, "
+              f"{hub_stats['fsyncs'] / hub_stats['commit_batches']:.1f} room logs per batch)")
+
+
+def main():
+    from player_snapshot import load_players
+
+    parser = argparse.ArgumentParser(description="Multi-room live draft hub")
+    sub = parser.add_subparsers(dest='command', required=True)
+    serve_parser = sub.add_parser('serve', help="Run the hub")
+    serve_parser.add_argument('--host', default=DEFAULT_HOST)
+    serve_parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    serve_parser.add_argument('--log-dir', help="Persist rooms as event logs here")
+    load_parser = sub.add_parser('load', help="Drive many rooms and followers against a hub")
+    load_parser.add_argument('--url', help="Running hub to test (default: start one on a free port)")
+    load_parser.add_argument('--rooms', type=int, default=300)
+    load_parser.add_argument('--clients', type=int, default=10, help="SSE followers per room")
+    load_parser.add_argument('--rate', type=float, default=2.0, help="Actions per second per room")
+    load_parser.add_argument('--seconds', type=float, default=20.0)
+    load_parser.add_argument('--log-dir', help="Started hub persists rooms here (fsynced group commits)")
+    args = parser.parse_args()
+
+    players = [player.name for player in load_players()]
+    if args.command == 'serve':
+        print("🏟️  Live Draft Hub")
+        print("=" * 50)
+        try:
+            asyncio.run(serve(DraftHub(players, args.log_dir), args.host, args.port))
+        except KeyboardInterrupt:
+            print("\n👋 Hub stopped")
+        return
+
+    print("🏋️  Live Draft Hub load test")
+    print("=" * 50)
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host = DEFAULT_HOST
+        process, port = start_hub(host, args.log_dir)
+    try:
+        asyncio.run(run_load(host, port, args.rooms, args.clients, args.rate, args.seconds, players))
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Multi-Source Entity Resolution
+Joins every per-player source onto the ranked player universe with hash
+indexes instead of per-row name searches:
+
+- Tiers and position ranks from the Beer Sheet CSV
+- Rotowire URLs and IDs from Rotowire_URLs.csv
+- ESPN IDs from the generators' known_ids tables
+
+Names are normalized into a canonical key ("jamarr chase|WR") that ignores
+case, accents, punctuation and Jr./II-style suffixes, so "Ja'Marr Chase",
+"Patrick Mahomes II" and the Rotowire slug "jamarr-chase-15183" all match.
+Defenses key on the team nickname ("eagles|DEF"). Each source is one pass
+over its rows with O(1) lookups, O(n + m) overall.
+
+Every row that cannot be placed is reported, and an ESPN ID claimed by more
+than one player is flagged as a collision and withheld from all of them.
+"""
+
+import csv
+import re
+import sys
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from auction_players import DEFAULT_PLAYERS_CSV, AuctionPlayer, load_auction_players
+
+BEER_SHEET_CSV = "Beer Sheet 2025 - Tier_Updates_Aug_12.csv"
+ROTOWIRE_CSV = "Rotowire_URLs.csv"
+
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+POSITION_ALIASES = {"DST": "DEF", "D/ST": "DEF", "PK": "K"}
+TEAM_ALIASES = {"WAS": "WSH", "JAC": "JAX", "LA": "LAR", "OAK": "LV", "SD": "LAC", "KCC": "KC"}
+
+
+def fold_words(text: str) -> List[str]:
+    """Lowercase ASCII words: accents folded, apostrophes/periods dropped, other punctuation splits"""
+    ascii_text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    ascii_text = re.sub(r"['.]", "", ascii_text.lower())
+    return re.sub(r"[^a-z0-9]+", " ", ascii_text).split()
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase ASCII words with punctuation and generational suffixes dropped"""
+    words = fold_words(name)
+    while len(words) > 1 and words[-1] in NAME_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def normalize_position(position: str) -> str:
+    position = position.strip().upper()
+    return POSITION_ALIASES.get(position, position)
+
+
+def normalize_team(team: str) -> str:
+    team = team.strip().upper()
+    return TEAM_ALIASES.get(team, team)
+
+
+def player_key(name: str, position: str) -> str:
+    """Canonical key; defenses use the nickname so "Philadelphia Eagles" matches "Eagles" """
+    position = normalize_position(position)
+    normalized = normalize_name(name)
+    if position == "DEF":
+        normalized = normalized.split()[-1] if normalized else normalized
+    return f"{normalized}|{position}"
+
+
+@dataclass
+class ResolvedPlayer:
+    key: str
+    player: AuctionPlayer
+    beer_tier: Optional[int] = None
+    beer_position_rank: Optional[int] = None
+    rotowire_url: str = ""
+    rotowire_id: str = ""
+    espn_id: str = ""
+
+
+@dataclass
+class ResolutionReport:
+    players: List[ResolvedPlayer]
+    unmatched: Dict[str, List[str]] = field(default_factory=dict)  # Source -> rows not placed
+    ambiguous: Dict[str, List[str]] = field(default_factory=dict)  # Source -> rows matching several players
+    id_collisions: Dict[str, List[str]] = field(default_factory=dict)  # ESPN ID -> players claiming it
+    id_conflicts: Dict[str, List[str]] = field(default_factory=dict)  # Player -> different IDs from sources
+
+
+class EntityResolver:
+    """Hash indexes over the player universe: canonical key and name-only"""
+
+    def __init__(self, players: List[AuctionPlayer]):
+        self.resolved: Dict[str, ResolvedPlayer] = {}
+        self.by_name: Dict[str, List[str]] = {}
+        self.report = ResolutionReport(players=[])
+        self._espn_claims: Dict[str, List[str]] = {}
+
+        for player in players:
+            key = player_key(player.name, player.position)
+            if key in self.resolved:
+                self._flag(self.report.ambiguous, 'universe', f"{player.name} ({player.position})")
+                continue
+            self.resolved[key] = ResolvedPlayer(key, player)
+            self.by_name.setdefault(key.split("|")[0], []).append(key)
+            self.report.players.append(self.resolved[key])
+
+    @staticmethod
+    def _flag(bucket: Dict[str, List[str]], source: str, row: str):
+        bucket.setdefault(source, []).append(row)
+
+    def _lookup(self, source: str, name: str, position: Optional[str] = None,
+                team: Optional[str] = None) -> Optional[ResolvedPlayer]:
+        """Exact key when the source has a position, otherwise the name index"""
+        if position:
+            match = self.resolved.get(player_key(name, position))
+            if match is None:
+                self._flag(self.report.unmatched, source, f"{name} ({position})")
+            return match
+
+        keys = self.by_name.get(normalize_name(name), [])
+        if len(keys) > 1 and team:
+            keys = [k for k in keys if normalize_team(self.resolved[k].player.team) == normalize_team(team)]
+        if len(keys) == 1:
+            return self.resolved[keys[0]]
+        self._flag(self.report.unmatched if not keys else self.report.ambiguous, source, name)
+        return None
+
+    def add_beer_sheet(self, csv_path: str = BEER_SHEET_CSV):
+        with open(csv_path, newline='', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(csvfile):
+                position_rank = row['position_rank'].strip()
+                position = position_rank.rstrip("0123456789")
+                match = self._lookup('beer_sheet', row['PLAYER NAME'], position)
+                if match:
+                    match.beer_tier = int(row['tier'])
+                    match.beer_position_rank = int(position_rank[len(position):] or 0)
+
+    def add_rotowire(self, csv_path: str = ROTOWIRE_CSV):
+        with open(csv_path, newline='', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(csvfile):
+                slug = row['rotowire_url'].rstrip("/").rsplit("/", 1)[-1]
+                name = re.sub(r"-\d+$", "", slug)  # "jamarr-chase-15183" -> "jamarr-chase"
+                match = self._lookup('rotowire', name)
+                if match:
+                    match.rotowire_url = row['rotowire_url']
+                    match.rotowire_id = row['id']
+
+    def add_espn_ids(self, known_ids: Dict[str, str], source: str = 'known_ids'):
+        """Names in known_ids carry no position, so they resolve through the name index"""
+        for name, espn_id in known_ids.items():
+            match = self._lookup(source, name)
+            if match is None or not espn_id:
+                continue
+            if match.espn_id and match.espn_id != espn_id:
+                self.report.id_conflicts.setdefault(match.player.name, [match.espn_id]).append(espn_id)
+                continue
+            match.espn_id = espn_id
+            claims = self._espn_claims.setdefault(espn_id, [])
+            if match.key not in claims:
+                claims.append(match.key)
+
+    def resolve(self) -> ResolutionReport:
+        """Withhold every ESPN ID that more than one player claims"""
+        for espn_id, keys in self._espn_claims.items():
+            if len(keys) > 1:
+                self.report.id_collisions[espn_id] = [self.resolved[k].player.name for k in keys]
+                for key in keys:
+                    self.resolved[key].espn_id = ""
+        for player in self.report.players:
+            if player.player.name in self.report.id_conflicts:
+                player.espn_id = ""
+        return self.report
+
+
+def generator_known_ids() -> List[Tuple[str, Dict[str, str]]]:
+    """known_ids tables from both top-200 generators"""
+    from complete_200_players import get_complete_player_data
+    from final_top_200_with_known_ids import get_final_player_data
+
+    return [
+        ('complete_200_players', get_complete_player_data()[1]),
+        ('final_top_200_with_known_ids', get_final_player_data()[1]),
+    ]
+
+
+def espn_athlete_ids(players: List[AuctionPlayer], athletes: Iterable[Dict]) -> Dict[str, str]:
+    """
+    Player name -> ESPN ID, matched by canonical key against ESPN's athlete list
+    (ESPNPlayerScraper.iter_athletes). A key two athletes share is left out.
+    """
+    wanted = {player_key(player.name, player.position): player.name for player in players}
+    found: Dict[str, str] = {}
+    shared = set()
+    for athlete in athletes:
+        position = (athlete.get('position') or {}).get('abbreviation', '')
+        key = player_key(athlete.get('displayName', ''), position)
+        if key not in wanted or not athlete.get('id'):
+            continue
+        if key in found:
+            shared.add(key)
+        found[key] = str(athlete['id'])
+    return {wanted[key]: espn_id for key, espn_id in found.items() if key not in shared}
+
+
+def resolve_players(players: List[AuctionPlayer], beer_sheet: Optional[str] = BEER_SHEET_CSV,
+                    rotowire: Optional[str] = ROTOWIRE_CSV) -> ResolutionReport:
+    """Join every source onto the universe in one pass each"""
+    resolver = EntityResolver(players)
+    if beer_sheet:
+        resolver.add_beer_sheet(beer_sheet)
+    if rotowire:
+        resolver.add_rotowire(rotowire)
+    for source, known_ids in generator_known_ids():
+        resolver.add_espn_ids(known_ids, source)
+    return resolver.resolve()
+
+
+def export_resolved(report: ResolutionReport, output_file: str):
+    fields = ['key', 'rank', 'name', 'position', 'team', 'tier', 'beer_tier', 'beer_position_rank',
+              'espn_id', 'rotowire_id', 'rotowire_url']
+    with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fields)
+        writer.writeheader()
+        for resolved in report.players:
+            player = resolved.player
+            writer.writerow({
+                'key': resolved.key,
+                'rank': player.rank,
+                'name': player.name,
+                'position': player.position,
+                'team': player.team,
+                'tier': player.tier,
+                'beer_tier': resolved.beer_tier or '',
+                'beer_position_rank': resolved.beer_position_rank or '',
+                'espn_id': resolved.espn_id,
+                'rotowire_id': resolved.rotowire_id,
+                'rotowire_url': resolved.rotowire_url,
+            })
+
+
+def main():
+    players_csv = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PLAYERS_CSV
+    output_file = sys.argv[2] if len(sys.argv) > 2 else "resolved_players.csv"
+
+    report = resolve_players(load_auction_players(players_csv))
+
+    print("🔗 Player Entity Resolution")
+    print("=" * 50)
+    print(f"📊 Universe: {len(report.players)} players")
+    print(f"   Beer Sheet tiers: {sum(1 for p in report.players if p.beer_tier)}")
+    print(f"   Rotowire URLs:    {sum(1 for p in report.players if p.rotowire_url)}")
+    print(f"   ESPN IDs:         {sum(1 for p in report.players if p.espn_id)}")
+
+    if report.id_collisions:
+        print("\n⚠️  ESPN ID collisions (withheld):")
+        for espn_id, names in report.id_collisions.items():
+            print(f"   {espn_id}: {', '.join(names)}")
+    if report.id_conflicts:
+        print("\n⚠️  Conflicting ESPN IDs across sources (withheld):")
+        for name, ids in report.id_conflicts.items():
+            print(f"   {name}: {', '.join(ids)}")
+    for label, bucket in (("Unmatched", report.unmatched), ("Ambiguous", report.ambiguous)):
+        for source, rows in bucket.items():
+            preview = ', '.join(rows[:5]) + (' ...' if len(rows) > 5 else '')
+            print(f"\n❓ {label} in {source}: {len(rows)} ({preview})")
+
+    export_resolved(report, output_file)
+    print(f"\n💾 Resolved players written to {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,7 @@ import requests
 import csv
 import json
 import time
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 class ESPNPlayerScraper:
     def __init__(self):
@@ -60,6 +60,30 @@ class ESPNPlayerScraper:
             print(f"Error fetching athletes: {e}")
             return []
     
+    def iter_athletes(self, page_size: int = 100) -> Iterator[Dict]:
+        """Yield active NFL athletes one page at a time, so memory stays constant"""
+        url = f"{self.base_url_core}/v3/sports/football/nfl/athletes"
+        page = 1
+        
+        while True:
+            try:
+                response = self.session.get(url, params={'limit': page_size, 'page': page, 'active': 'true'},
+                                            timeout=10)
+                response.raise_for_status()
+                data = response.json()
+            except Exception as e:
+                print(f"Error fetching athletes page {page}: {e}")
+                return
+            
+            for athlete in data.get('athletes', []):
+                name = athlete.get('displayName', '')
+                if name and not ('[' in name and ']' in name):
+                    yield athlete
+            
+            if page >= data.get('pageCount', page):
+                return
+            page += 1
+    
     def get_player_overview(self, athlete_id: str) -> Optional[Dict]:
         """Get player overview data including team info"""
         url = f"{self.base_url_web}/apis/common/v3/sports/football/nfl/athletes/{athlete_id}/overview"
@@ -152,6 +176,10 @@ class ESPNPlayerScraper:
                             stats['rushingYards'] = float(value)
                         elif 'rushingtouchdowns' in name:
                             stats['rushingTouchdowns'] = float(value)
+                        elif 'passingyards' in name:
+                            stats['passingYards'] = float(value)
+                        elif 'passingtouchdowns' in name:
+                            stats['passingTouchdowns'] = float(value)
             
         except Exception as e:
             print(f"Error extracting stats: {e}")
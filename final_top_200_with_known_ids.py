@@ -5,23 +5,21 @@ Creates a comprehensive list with all known ESPN IDs populated
 """
 
 import csv
-import requests
-import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-def create_final_top_200_csv():
-    """Create final CSV with known ESPN IDs and placeholder auction values"""
+def get_final_player_data() -> Tuple[List[Dict], Dict[str, str]]:
+    """Return the ranked player list with auction values and known ESPN IDs"""
     
     # Known ESPN IDs (from our testing and research)
     known_ids = {
         "Josh Allen": "3128390",
-        "Justin Jefferson": "3139477", 
+        "Justin Jefferson": "4262921",
         "Davante Adams": "16800",
         "Derrick Henry": "3116385",
-        "Travis Kelce": "16800",  # Need to verify this
+        "Travis Kelce": "15847",
         
         # Additional known IDs from research
-        "Patrick Mahomes": "3139477",  # Need to verify
+        "Patrick Mahomes": "3139477",
         "Lamar Jackson": "3916387",    # Commonly referenced
         "Christian McCaffrey": "3128720", # Commonly referenced  
         "Ja'Marr Chase": "4431750",   # Commonly referenced
@@ -144,6 +142,13 @@ def create_final_top_200_csv():
     # Combine lists
     all_players = top_200_players + additional_players
     
+    return all_players, known_ids
+
+def create_final_top_200_csv():
+    """Create final CSV with known ESPN IDs and placeholder auction values"""
+    
+    all_players, known_ids = get_final_player_data()
+    
     # Create CSV
     with open('final_top_200_fantasy_players.csv', 'w', newline='', encoding='utf-8') as csvfile:
         fieldnames = [
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+HTTP Service Helpers
+The small HTTP/1.1 layer shared by the resident asyncio services
+(draft_daemon.py, draft_hub.py) and the tools that load-test them:
+- server side: read one request off a keep-alive connection, write one
+  JSON response
+- client side: JSON requests over a keep-alive connection, with
+  Content-Length or chunked responses (as the Next.js routes send)
+Standard library only.
+"""
+
+import asyncio
+import json
+import re
+import subprocess
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+MAX_BODY = 64 * 1024
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class Request:
+    method: str
+    target: str
+    headers: Dict[str, str]
+    body: bytes
+    keep_alive: bool
+    too_large: bool = False  # Body over MAX_BODY, left unread
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """The next HTTP/1.x request on a connection, or None once the client hangs up"""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    method, target, version = request_line.decode('latin-1').split()
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+    length = int(headers.get('content-length', 0))
+    if length > MAX_BODY:
+        return Request(method, target, headers, b'', keep_alive, too_large=True)
+    body = await reader.readexactly(length) if length else b''
+    return Request(method, target, headers, body, keep_alive)
+
+
+def json_response(status: int, payload: Any, keep_alive: bool, elapsed: float) -> bytes:
+    """A complete JSON response; elapsed (seconds) goes in X-Elapsed-Ms"""
+    data = json.dumps(payload).encode('utf-8')
+    return (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"X-Elapsed-Ms: {elapsed * 1000:.2f}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode('latin-1') + data
+
+
+async def read_response(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str], bytes]:
+    """Status, headers and body of the next response on a connection"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("Server closed the connection")
+    status = int(status_line.split()[1])
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass  # Trailers
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        return status, headers, b''.join(chunks)
+    length = int(headers.get('content-length', 0))
+    return status, headers, await reader.readexactly(length) if length else b''
+
+
+def _request_bytes(method: str, path: str, body: Optional[Any], host: str) -> bytes:
+    data = json.dumps(body).encode('utf-8') if body is not None else b''
+    return (f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n\r\n").encode('latin-1') + data
+
+
+def _decode(raw: bytes) -> Any:
+    try:
+        return json.loads(raw) if raw else None
+    except ValueError:
+        return raw.decode('utf-8', 'replace')  # An HTML error page, say
+
+
+async def request_json(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str,
+                       body: Optional[Any] = None, host: str = "localhost") -> Tuple[int, Any]:
+    """One request on an open keep-alive connection"""
+    writer.write(_request_bytes(method, path, body, host))
+    status, _, raw = await read_response(reader)
+    return status, _decode(raw)
+
+
+class HTTPClient:
+    """One keep-alive connection to a server, reopened whenever the server closes it"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, method: str, path: str, body: Optional[Any] = None) -> Tuple[int, Any]:
+        if self.writer is None or self.reader.at_eof():
+            self.close()
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            self.writer.write(_request_bytes(method, path, body, f"{self.host}:{self.port}"))
+            status, headers, raw = await read_response(self.reader)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            self.close()
+            raise
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+        return status, _decode(raw)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+def start_server(command: List[str], name: str = "Server") -> Tuple[subprocess.Popen, int]:
+    """
+    Run a service that was told `--port 0` and return it with the port it bound,
+    read from its "listening on http://host:port" line. Nothing else that
+    happens to own a fixed port can answer in its place.
+    """
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True, encoding='utf-8')
+    for line in process.stdout:
+        listening = re.search(r'listening on http://\S+:(\d+)', line, re.IGNORECASE)
+        if listening:
+            return process, int(listening.group(1))
+    process.wait()
+    raise RuntimeError(f"{name} exited with status {process.returncode} before listening")
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+League-Wide Inflation Tracker
+Ingests every sale in the room (player, team, price) and keeps live:
+- League-wide remaining dollars and open roster slots
+- Each team's max bid (remaining budget minus $1 for every other open slot)
+- An inflation factor applied to every undrafted player's value
+
+Inflation compares the dollars teams can still spend above their $1 minimums
+with the surplus value of the players those dollars will actually buy (the
+top-N undrafted by value, N = open slots league-wide). The top-N sum comes
+from a Fenwick tree over value-ranked players, so each sale costs O(log n)
+and nothing rescans the player pool.
+"""
+
+import csv
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from auction_players import (
+    DEFAULT_BUDGET, TEAMS_PER_LEAGUE, AuctionPlayer, roster_size,
+)
+from player_snapshot import load_players
+
+
+@dataclass(frozen=True)
+class SaleEvent:
+    player: str
+    team: str
+    price: int
+
+
+@dataclass
+class TeamLedger:
+    name: str
+    budget: int
+    open_slots: int
+    players: List[str] = field(default_factory=list)
+
+    @property
+    def max_bid(self) -> int:
+        """Remaining budget minus $1 for every other open slot"""
+        return self.budget - (self.open_slots - 1) if self.open_slots > 0 else 0
+
+
+class FenwickTree:
+    """Prefix counts and sums over value-ranked slots"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.counts = [0] * (size + 1)
+        self.sums = [0] * (size + 1)
+
+    def add(self, index: int, count: int, value: int):
+        i = index + 1
+        while i <= self.size:
+            self.counts[i] += count
+            self.sums[i] += value
+            i += i & -i
+
+    def top_sum(self, n: int) -> int:
+        """Sum of the first n remaining entries (binary lifting, O(log n))"""
+        if n <= 0:
+            return 0
+        position, remaining, total = 0, n, 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = position + step
+            if nxt <= self.size and self.counts[nxt] <= remaining:
+                position = nxt
+                remaining -= self.counts[nxt]
+                total += self.sums[nxt]
+                if remaining == 0:
+                    break
+            step >>= 1
+        return total
+
+
+class InflationTracker:
+    def __init__(self, players: List[AuctionPlayer], teams: List[str], budget: int = DEFAULT_BUDGET):
+        slots = roster_size()
+        self.teams: Dict[str, TeamLedger] = {name: TeamLedger(name, budget, slots) for name in teams}
+        self.dollars_left = budget * len(teams)
+        self.slots_left = slots * len(teams)
+        self.sales: List[SaleEvent] = []
+        self._sold: Set[str] = set()  # Includes names outside the player list
+
+        # Players ranked by value once; a sale only clears their slot in the tree
+        ranked = sorted(players, key=lambda p: (-p.auction_value, p.rank))
+        self._values = {p.name: p.auction_value for p in ranked}
+        self._ranked_slot = {p.name: i for i, p in enumerate(ranked)}
+        self._slot = dict(self._ranked_slot)  # Undrafted players only
+        self._undrafted = len(ranked)
+        self._tree = FenwickTree(len(ranked))
+        for i, player in enumerate(ranked):
+            self._tree.add(i, 1, player.auction_value)
+
+    def record_sale(self, event: SaleEvent):
+        """Apply one sale; O(log n) for the value tree, O(1) everything else"""
+        team = self.teams[event.team]
+        if event.player in self._sold:
+            raise ValueError(f"{event.player} is not available")
+        if team.open_slots < 1 or event.price > team.max_bid:
+            raise ValueError(f"{event.team} cannot pay ${event.price} for {event.player}")
+
+        team.budget -= event.price
+        team.open_slots -= 1
+        team.players.append(event.player)
+        self.dollars_left -= event.price
+        self.slots_left -= 1
+        self._sold.add(event.player)
+
+        slot = self._slot.pop(event.player, None)
+        if slot is not None:
+            self._tree.add(slot, -1, -self._values[event.player])
+            self._undrafted -= 1
+
+        self.sales.append(event)
+
+    def undo_sale(self) -> SaleEvent:
+        """Reverse the most recent sale, e.g. a mis-entered price; O(log n) like record_sale"""
+        if not self.sales:
+            raise ValueError("No sale to undo")
+        event = self.sales.pop()
+        team = self.teams[event.team]
+        team.budget += event.price
+        team.open_slots += 1
+        team.players.pop()
+        self.dollars_left += event.price
+        self.slots_left += 1
+        self._sold.discard(event.player)
+
+        slot = self._ranked_slot.get(event.player)
+        if slot is not None and event.player not in self._slot:
+            self._slot[event.player] = slot
+            self._tree.add(slot, 1, self._values[event.player])
+            self._undrafted += 1
+        return event
+
+    @property
+    def inflation(self) -> float:
+        """Dollars above minimums per dollar of surplus value still to be bought"""
+        buyable = min(self.slots_left, self._undrafted)
+        surplus_value = self._tree.top_sum(buyable) - buyable
+        surplus_dollars = self.dollars_left - self.slots_left
+        if surplus_value <= 0:
+            return 1.0
+        return surplus_dollars / surplus_value
+
+    def is_available(self, name: str) -> bool:
+        return name in self._slot
+
+    def inflated_value(self, player: AuctionPlayer) -> float:
+        """Undrafted player's value at current league prices"""
+        if not self.is_available(player.name):
+            return 0.0
+        return round(1 + (player.auction_value - 1) * self.inflation, 1)
+
+    def max_bids(self) -> Dict[str, int]:
+        return {name: team.max_bid for name, team in self.teams.items()}
+
+    def highest_max_bid(self, excluding: Optional[str] = None) -> int:
+        """Most any (other) team can pay right now"""
+        return max((team.max_bid for name, team in self.teams.items() if name != excluding), default=0)
+
+
+def load_sales(csv_path: str) -> List[SaleEvent]:
+    """Read sales from a CSV with player, team, price columns"""
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        return [SaleEvent(row['player'], row['team'], int(float(row['price'])))
+                for row in csv.DictReader(csvfile)]
+
+
+def main():
+    players = load_players()
+    teams = [f"Team {i}" for i in range(1, TEAMS_PER_LEAGUE + 1)]
+    tracker = InflationTracker(players, teams)
+
+    if len(sys.argv) > 1:
+        sales = load_sales(sys.argv[1])
+    else:
+        # Demo: the first ten players all go 20% over value
+        sales = [SaleEvent(p.name, teams[i % len(teams)], round(p.auction_value * 1.2))
+                 for i, p in enumerate(players[:10])]
+
+    print("📈 League Inflation Tracker")
+    print("=" * 50)
+    print(f"Start inflation: {tracker.inflation:.3f}")
+
+    for sale in sales:
+        tracker.record_sale(sale)
+        print(f"   {sale.team:<8} bought {sale.player:<24} ${sale.price:<3} "
+              f"-> inflation {tracker.inflation:.3f} | ${tracker.dollars_left} left league-wide")
+
+    print("\n💰 Max bids:")
+    for name, max_bid in tracker.max_bids().items():
+        print(f"   {name:<8} ${max_bid}")
+
+    print("\n🏷️  Inflated values for the next players on the board:")
+    for player in [p for p in players if tracker.is_available(p.name)][:10]:
+        print(f"   {player.name:<24} ${player.auction_value} -> ${tracker.inflated_value(player)}")
+
+
+if __name__ == "__main__":
+    main()
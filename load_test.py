@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Draft-Time Load Test
+Replays a draft against a local deployment while a whole league queries it,
+and reports throughput and p50/p95/p99 latency per endpoint.
+
+The draft is an event log (draft_events.jsonl, as the daemon writes it) or a
+synthetic auction from draft_log.simulate_draft. For every lot:
+- the commissioner posts the nomination, each bid and the sale (or undo) to
+  the daemon, in log order
+- meanwhile each of --users managers types the player's name into search,
+  one request per keystroke, asks for bid advice and similar players, and
+  with --app fetches the player's news through the Next.js route
+- after the sale every manager refreshes scenarios and best available
+
+Each manager keeps one keep-alive connection per server, like a browser tab.
+Unless --url points at a running daemon, a fresh one is started with
+--no-log and --port 0, and its own listening line says where it is, so a
+test can never write into a real draft.
+
+Usage:
+    python3 load_test.py [--users 12] [--lots 40] [--draft draft_events.jsonl]
+                         [--url http://127.0.0.1:8765] [--app http://localhost:3000]
+                         [--think-ms 40] [--lot-seconds 0] [--json load_report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from draft_log import DraftBoard, DraftEvent, DraftLog, default_teams, simulate_draft
+from http_service import HTTPClient, percentile, start_server
+
+DEFAULT_DAEMON_URL = "http://127.0.0.1:8765"
+
+
+@dataclass
+class EndpointStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, elapsed: float) -> Dict[str, float]:
+        ordered = sorted(self.latencies_ms)
+        return {
+            'requests': len(ordered),
+            'per_second': round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+            'errors': self.errors,
+            'p50_ms': round(percentile(ordered, 0.50), 2),
+            'p95_ms': round(percentile(ordered, 0.95), 2),
+            'p99_ms': round(percentile(ordered, 0.99), 2),
+            'max_ms': round(ordered[-1], 2) if ordered else 0.0,
+        }
+
+
+class Recorder:
+    """Times every request, bucketed by method and path (query strings dropped)"""
+
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointStats] = {}
+
+    async def call(self, client: HTTPClient, method: str, path: str,
+                   body: Optional[Dict] = None) -> Tuple[int, object]:
+        stats = self.endpoints.setdefault(f"{method} {urlsplit(path).path}", EndpointStats())
+        started = time.perf_counter()
+        try:
+            status, payload = await client.request(method, path, body)
+        except (OSError, asyncio.IncompleteReadError, ValueError) as error:
+            stats.errors += 1
+            return 0, {'error': repr(error)}
+        stats.latencies_ms.append((time.perf_counter() - started) * 1000)
+        if status >= 400:
+            stats.errors += 1
+        return status, payload
+
+
+class RecordingLog(DraftLog):
+    """An in-memory DraftLog that keeps every event it records"""
+
+    def __init__(self, board: DraftBoard):
+        super().__init__(board, path=None)
+        self.events: List[DraftEvent] = []
+
+    def record(self, kind: str, player: str = "", team: str = "", price: int = 0):
+        event, undone = super().record(kind, player, team, price)
+        self.events.append(event)
+        return event, undone
+
+
+def synthetic_draft(players: List[str], seed: int) -> List[DraftEvent]:
+    log = RecordingLog(DraftBoard(default_teams(), players=players))
+    simulate_draft(log, players, seed)
+    return log.events
+
+
+def recorded_draft(path: str) -> List[DraftEvent]:
+    """Events from a draft log file; a torn last line is skipped"""
+    events = []
+    with open(path, encoding='utf-8') as handle:
+        for line in handle:
+            try:
+                events.append(DraftEvent(**json.loads(line)))
+            except (ValueError, TypeError):
+                if line.endswith("\n"):
+                    raise
+    return events
+
+
+def news_ids(players: Iterable) -> Dict[str, str]:
+    """Player name -> the id the news route expects (Rotowire_URLs.csv)"""
+    from entity_resolution import EntityResolver
+
+    resolver = EntityResolver(list(players))
+    resolver.add_rotowire()
+    return {resolved.player.name: resolved.rotowire_id for resolved in resolver.report.players
+            if resolved.rotowire_id}
+
+
+class Manager:
+    """One league member's browser: search as they type, then research the player"""
+
+    def __init__(self, daemon: HTTPClient, app: Optional[HTTPClient], recorder: Recorder,
+                 think_ms: float, news: Dict[str, str], seed: int):
+        self.daemon = daemon
+        self.app = app
+        self.recorder = recorder
+        self.think = think_ms / 1000
+        self.news = news
+        self.rng = random.Random(seed)
+
+    async def pause(self):
+        if self.think:
+            await asyncio.sleep(self.rng.expovariate(1 / self.think))
+
+    async def on_nomination(self, player: str):
+        typed = self.rng.randint(min(3, len(player)), len(player))  # Most people stop once the player shows up
+        for end in range(1, typed + 1):
+            await self.recorder.call(self.daemon, 'GET', "/players/search?" + urlencode({'q': player[:end]}))
+            await self.pause()
+        await self.recorder.call(self.daemon, 'GET', "/bid-advice?" + urlencode({'player': player}))
+        await self.recorder.call(self.daemon, 'GET', "/players/similar?" + urlencode({'player': player, 'k': 5}))
+        if self.app and player in self.news:
+            await self.recorder.call(self.app, 'POST', "/api/scrape-news",
+                                     {'playerId': self.news[player], 'playerName': player})
+
+    async def on_sale(self):
+        await self.recorder.call(self.daemon, 'GET', "/scenarios")
+        await self.recorder.call(self.daemon, 'GET', "/players/best-available?limit=20")
+
+
+def event_request(event: DraftEvent) -> Tuple[str, Optional[Dict]]:
+    """The daemon call that replays one draft event"""
+    if event.kind == "nominate":
+        return "/nominations", {'player': event.player, 'team': event.team, 'price': event.price}
+    if event.kind == "bid":
+        return "/bids", {'team': event.team, 'price': event.price}
+    if event.kind == "sale":
+        return "/sales", {'player': event.player, 'team': event.team, 'price': event.price}
+    return "/undo", None
+
+
+async def replay(events: List[DraftEvent], daemon: Tuple[str, int], app: Optional[Tuple[str, int]],
+                 users: int, lots: int, think_ms: float, lot_seconds: float, news: Dict[str, str]
+                 ) -> Tuple[Recorder, float, int]:
+    recorder = Recorder()
+    commissioner = HTTPClient(*daemon)
+    managers = [Manager(HTTPClient(*daemon), HTTPClient(*app) if app else None, recorder, think_ms, news, seed)
+                for seed in range(users)]
+    researching: List[asyncio.Task] = []
+    played = 0
+    lot_started = time.perf_counter()
+    started = time.perf_counter()
+
+    for event in events:
+        if event.kind == "nominate":
+            if played == lots:
+                break
+            played += 1
+            lot_started = time.perf_counter()
+        if event.kind == "sale" and researching:
+            await asyncio.gather(*researching)  # Bidding stays open while the league researches
+            researching = []
+
+        path, body = event_request(event)
+        status, payload = await recorder.call(commissioner, 'POST', path, body)
+        if status != 200:
+            raise RuntimeError(f"Daemon rejected event {event.seq} ({event.kind}): {payload}. "
+                               f"Replays need a fresh draft; drop --url or restart the daemon with --no-log.")
+
+        if event.kind == "nominate":
+            researching = [asyncio.get_running_loop().create_task(m.on_nomination(event.player))
+                           for m in managers]
+        elif event.kind == "sale":
+            await asyncio.gather(*(m.on_sale() for m in managers))
+            await asyncio.sleep(max(0.0, lot_seconds - (time.perf_counter() - lot_started)))
+        elif event.kind == "bid":
+            await asyncio.sleep(think_ms / 2000)
+
+    if researching:
+        await asyncio.gather(*researching)
+    elapsed = time.perf_counter() - started
+    for client in [commissioner] + [m.daemon for m in managers] + [m.app for m in managers if m.app]:
+        client.close()
+    return recorder, elapsed, played
+
+
+def _host_port(url: str) -> Tuple[str, int]:
+    parts = urlsplit(url)
+    return parts.hostname or "127.0.0.1", parts.port or (443 if parts.scheme == 'https' else 80)
+
+
+def print_report(recorder: Recorder, elapsed: float, played: int, users: int):
+    print(f"\n📊 {played} lots, {users} managers, {elapsed:.1f} s")
+    print(f"   {'Endpoint':<32} {'Requests':>9} {'Req/s':>8} {'Errors':>7} "
+          f"{'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}  (ms)")
+    total, errors = 0, 0
+    for endpoint in sorted(recorder.endpoints):
+        row = recorder.endpoints[endpoint].summary(elapsed)
+        total += row['requests']
+        errors += row['errors']
+        print(f"   {endpoint:<32} {row['requests']:>9,} {row['per_second']:>8.1f} {row['errors']:>7} "
+              f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} {row['max_ms']:>8.2f}")
+    print(f"   {'Total':<32} {total:>9,} {total / elapsed:>8.1f} {errors:>7}")
+
+
+def main():
+    from player_snapshot import load_players
+
+    parser = argparse.ArgumentParser(description="Replay draft traffic against the draft-time services")
+    parser.add_argument('--url', help=f"Running daemon (default: start a fresh one; normally {DEFAULT_DAEMON_URL})")
+    parser.add_argument('--app', help="Next.js app for the news route, e.g. http://localhost:3000")
+    parser.add_argument('--draft', help="Draft event log to replay (default: a synthetic auction)")
+    parser.add_argument('--users', type=int, default=12, help="Concurrent managers")
+    parser.add_argument('--lots', type=int, default=40, help="Lots to replay (0 for the whole draft)")
+    parser.add_argument('--think-ms', type=float, default=40.0, help="Mean pause between a manager's requests")
+    parser.add_argument('--lot-seconds', type=float, default=0.0, help="Minimum time per lot")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help="Also write the per-endpoint report here")
+    args = parser.parse_args()
+
+    print("🏋️  Draft-Time Load Test")
+    print("=" * 50)
+    players = load_players()
+    events = recorded_draft(args.draft) if args.draft else synthetic_draft([p.name for p in players], args.seed)
+    news = news_ids(players) if args.app else {}
+    lots = args.lots or sum(1 for event in events if event.kind == "nominate")
+    print(f"📜 {'Recorded' if args.draft else 'Synthetic'} draft: {len(events)} events, replaying {lots} lots")
+
+    process = None
+    if args.url:
+        daemon = _host_port(args.url)
+    else:
+        print("🚀 Starting a throwaway daemon on a free port...")
+        process, port = start_server([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                   "draft_daemon.py"),
+                                      '--host', '127.0.0.1', '--port', '0', '--no-log'], "Daemon")
+        daemon = ("127.0.0.1", port)
+        print(f"   listening on port {port}")
+    try:
+        recorder, elapsed, played = asyncio.run(replay(events, daemon, _host_port(args.app) if args.app else None,
+                                                       args.users, lots, args.think_ms, args.lot_seconds, news))
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+
+    print_report(recorder, elapsed, played, args.users)
+    if args.json:
+        report = {
+            'lots': played, 'users': args.users, 'seconds': round(elapsed, 2),
+            'endpoints': {endpoint: stats.summary(elapsed) for endpoint, stats in sorted(recorder.endpoints.items())},
+        }
+        with open(args.json, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2)
+            handle.write("\n")
+        print(f"💾 Report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Shared-Memory Player Matrix
+Packs the player universe into one flat, columnar buffer that worker processes
+attach to by name (shared memory) or by path (memory-mapped file) without
+pickling or copying the player list
+
+Layout (little-endian, every column 8-byte aligned):
+- Header: magic "FFPM", version, player count, string blob size
+- projected_points: float64[n]
+- rank, tier, auction_value: int32[n] each
+- string_offsets: uint32[3n + 1] (name, team, espn_id for each player)
+- position: uint8[n] (index into POSITIONS)
+- strings: UTF-8 blob
+
+Usage:
+    matrix = PlayerMatrix.create(players)        # parent, pass matrix.name to workers
+    shared = PlayerMatrix.attach(name)           # worker, zero-copy
+    values = shared.column('auction_value')      # memoryview over the shared buffer
+"""
+
+import mmap
+import struct
+import sys
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+from auction_players import POSITIONS, AuctionPlayer
+
+MAGIC = b"FFPM"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")  # magic, version, reserved, count, strings size
+
+# Column name -> (memoryview format, item size)
+COLUMNS = {
+    'projected_points': ('d', 8),
+    'rank': ('i', 4),
+    'tier': ('i', 4),
+    'auction_value': ('i', 4),
+    'string_offsets': ('I', 4),
+    'position': ('B', 1),
+}
+STRINGS_PER_PLAYER = 3  # name, team, espn_id
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _layout(count: int, strings_size: int) -> Tuple[Dict[str, Tuple[int, int]], int]:
+    """Byte offset and length of every column plus the total buffer size"""
+    offsets = {}
+    cursor = _align(HEADER.size)
+    for column, (_, item_size) in COLUMNS.items():
+        items = count * STRINGS_PER_PLAYER + 1 if column == 'string_offsets' else count
+        offsets[column] = (cursor, items * item_size)
+        cursor = _align(cursor + items * item_size)
+    offsets['strings'] = (cursor, strings_size)
+    return offsets, max(cursor + strings_size, 1)
+
+
+def _pack(players: List[AuctionPlayer], buffer) -> None:
+    """Write players into a buffer sized by _layout"""
+    encoded = []
+    for player in players:
+        encoded.extend([player.name.encode('utf-8'), player.team.encode('utf-8'),
+                        player.espn_id.encode('utf-8')])
+    blob = b"".join(encoded)
+    offsets, _ = _layout(len(players), len(blob))
+
+    HEADER.pack_into(buffer, 0, MAGIC, VERSION, 0, len(players), len(blob))
+
+    string_offsets = [0]
+    for chunk in encoded:
+        string_offsets.append(string_offsets[-1] + len(chunk))
+
+    columns = {
+        'projected_points': [p.projected_points for p in players],
+        'rank': [p.rank for p in players],
+        'tier': [p.tier for p in players],
+        'auction_value': [p.auction_value for p in players],
+        'string_offsets': string_offsets,
+        'position': [POSITIONS.index(p.position) for p in players],
+    }
+    for column, values in columns.items():
+        start, _ = offsets[column]
+        struct.pack_into(f"<{len(values)}{COLUMNS[column][0]}", buffer, start, *values)
+
+    start, size = offsets['strings']
+    buffer[start:start + size] = blob
+
+
+def packed_size(players: List[AuctionPlayer]) -> int:
+    strings_size = sum(len(p.name.encode('utf-8')) + len(p.team.encode('utf-8'))
+                       + len(p.espn_id.encode('utf-8')) for p in players)
+    return _layout(len(players), strings_size)[1]
+
+
+class PlayerMatrix:
+    """Read-only columnar view over a packed player buffer"""
+
+    def __init__(self, buffer: memoryview, shm: Optional[shared_memory.SharedMemory] = None,
+                 mapped: Optional[mmap.mmap] = None, owner: bool = False):
+        magic, version, _, count, strings_size = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} player matrix")
+
+        self._buffer = buffer
+        self._shm = shm
+        self._mapped = mapped
+        self._owner = owner
+        self.count = count
+
+        # Typed views are sliced once; every read after this is a plain index
+        layout, _ = _layout(count, strings_size)
+        self._columns: Dict[str, memoryview] = {}
+        for column, (start, size) in layout.items():
+            view = buffer[start:start + size]
+            self._columns[column] = view if column == 'strings' else view.cast(COLUMNS[column][0])
+
+    @classmethod
+    def create(cls, players: List[AuctionPlayer], name: Optional[str] = None) -> "PlayerMatrix":
+        """Pack players into a new shared memory block owned by this process"""
+        shm = shared_memory.SharedMemory(name=name, create=True, size=packed_size(players))
+        _pack(players, shm.buf)
+        return cls(shm.buf, shm=shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "PlayerMatrix":
+        """Attach to a matrix created by another process; nothing is copied"""
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            # Pool workers share the creator's resource tracker, so the
+            # segment stays owned by the creating process
+            shm = shared_memory.SharedMemory(name=name)
+        return cls(shm.buf, shm=shm)
+
+    @staticmethod
+    def write_file(players: List[AuctionPlayer], path: str) -> None:
+        """Write the same layout to a file for memory-mapped loading"""
+        buffer = bytearray(packed_size(players))
+        _pack(players, buffer)
+        with open(path, 'wb') as handle:
+            handle.write(buffer)
+
+    @classmethod
+    def open_file(cls, path: str) -> "PlayerMatrix":
+        """Memory-map a matrix file read-only"""
+        with open(path, 'rb') as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(memoryview(mapped), mapped=mapped)
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._shm.name if self._shm else None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def column(self, column: str) -> memoryview:
+        """Zero-copy typed view of one column, valid until close()"""
+        return self._columns[column]
+
+    def _string(self, index: int) -> str:
+        offsets = self._columns['string_offsets']
+        return bytes(self._columns['strings'][offsets[index]:offsets[index + 1]]).decode('utf-8')
+
+    def name_of(self, i: int) -> str:
+        return self._string(i * STRINGS_PER_PLAYER)
+
+    def player(self, i: int) -> AuctionPlayer:
+        """Materialize one row as an AuctionPlayer"""
+        base = i * STRINGS_PER_PLAYER
+        return AuctionPlayer(
+            rank=self._columns['rank'][i],
+            name=self._string(base),
+            position=POSITIONS[self._columns['position'][i]],
+            team=self._string(base + 1),
+            tier=self._columns['tier'][i],
+            auction_value=self._columns['auction_value'][i],
+            projected_points=self._columns['projected_points'][i],
+            espn_id=self._string(base + 2),
+        )
+
+    def players(self) -> List[AuctionPlayer]:
+        return [self.player(i) for i in range(self.count)]
+
+    def close(self):
+        """Detach; column views handed out become invalid"""
+        for view in self._columns.values():
+            view.release()
+        self._columns.clear()
+        self._buffer.release()
+        if self._shm:
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+        if self._mapped:
+            self._mapped.close()
+
+    def __enter__(self) -> "PlayerMatrix":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Player Data Pipeline
+One CLI replacing the overlapping top-200 generator scripts with a staged DAG:
+
+    roster source -> ID resolution -> stat fetch -> scoring -> projection -> valuation -> tiering -> export
+                                                                                                    -> snapshot
+
+Every stage output is stored content-addressed under .pipeline_cache/. A
+stage's cache key hashes its code, the source files it reads, the parameters
+it uses, the module constants it reads (such as EXPORT_FIELDS) and the digests
+of its inputs, so a run only re-executes stages whose inputs actually changed.
+If an upstream stage re-runs but produces the same output, everything
+downstream stays cached.
+
+The tiering stage re-clusters every position on each build. The clustered
+tiers go to the boundaries sidecar beside the CSV (<output>_tiers.json), so
+the CSV and snapshot keep the hand-typed tier column.
+
+Usage:
+    python3 player_pipeline.py                      # offline build, writes the CSV
+    python3 player_pipeline.py --fetch-stats        # also pull 2024 stats from ESPN
+    python3 player_pipeline.py --until projection   # stop after a stage
+    python3 player_pipeline.py --force fetch_stats  # ignore the cache for a stage
+    python3 player_pipeline.py --tiers kmeans       # cluster with another method
+    python3 player_pipeline.py --tiers hand         # skip clustering
+"""
+
+import argparse
+import csv
+import datetime
+import hashlib
+import inspect
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from auction_players import DEFAULT_PLAYERS_CSV, AuctionPlayer, calculate_ppr_points
+from player_snapshot import DEFAULT_SNAPSHOT, write_snapshot
+
+DEFAULT_CACHE_DIR = ".pipeline_cache"
+TIER_CHOICES = ('natural-breaks', 'kmeans', 'gmm', 'hand')  # tier_clustering.METHODS, or no clustering
+DEFAULT_TIERS = 'natural-breaks'
+EXPORT_FIELDS = [
+    'rank', 'name', 'position', 'team', 'tier',
+    'auction_value_ppr', 'espn_id', 'projected_fpts_2025',
+    'notes', 'priority'
+]
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def _file_digest(path: str) -> str:
+    with open(path, 'rb') as handle:
+        return _digest(handle.read())
+
+
+# --- Stages -----------------------------------------------------------------
+
+def roster_source(inputs: Dict[str, Any], params: Dict[str, Any]) -> List[Dict]:
+    """Ranked player universe with tiers and auction values"""
+    from complete_200_players import get_complete_player_data
+
+    players, _ = get_complete_player_data()
+    return [
+        {
+            'rank': rank,
+            'name': player['name'],
+            'position': player['pos'],
+            'team': player['team'],
+            'tier': player['tier'],
+            'auction_value': player['auction'],
+        }
+        for rank, player in enumerate(players[:params['limit']], 1)
+    ]
+
+
+def resolve_ids(inputs: Dict[str, Any], params: Dict[str, Any]) -> List[Dict]:
+    """Attach ESPN IDs through entity resolution; colliding IDs are withheld"""
+    from entity_resolution import resolve_players
+
+    universe = [
+        AuctionPlayer(p['rank'], p['name'], p['position'], p['team'], p['tier'], p['auction_value'], 0.0)
+        for p in inputs['roster_source']
+    ]
+    report = resolve_players(universe, beer_sheet=None, rotowire=None)
+    espn_ids = {resolved.player.name: resolved.espn_id for resolved in report.players}
+    return [dict(player, espn_id=espn_ids.get(player['name'], '')) for player in inputs['roster_source']]
+
+
+def fetch_stats(inputs: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Dict]:
+    """2024 season stats per player from ESPN splits (empty when offline)"""
+    if not params['fetch_stats']:
+        return {}
+
+    from top_200_fantasy_scraper import Top200FantasyScraper
+
+    scraper = Top200FantasyScraper()
+    stats = {}
+    for player in inputs['resolve_ids']:
+        if player['espn_id']:
+            stats[player['name']] = scraper.get_player_stats(player['espn_id'])
+            time.sleep(0.5)  # Rate limiting
+    return stats
+
+
+def scoring(inputs: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, float]:
+    """PPR points for every player with fetched stats"""
+    return {name: calculate_ppr_points(stats) for name, stats in inputs['fetch_stats'].items()}
+
+
+def projection(inputs: Dict[str, Any], params: Dict[str, Any]) -> List[Dict]:
+    """2025 projection from tier/rank, blended 50/50 with 2024 PPR points when available"""
+    from complete_200_players import project_fantasy_points
+
+    scored = inputs['scoring']
+    projected = []
+    for player in inputs['resolve_ids']:
+        points = project_fantasy_points(player['position'], player['tier'], player['rank'])
+        if scored.get(player['name']):
+            points = (points + scored[player['name']]) / 2
+        projected.append(dict(player, projected_fpts_2025=round(points, 1)))
+    return projected
+
+
+def valuation(inputs: Dict[str, Any], params: Dict[str, Any]) -> List[Dict]:
+    """Auction value, draft priority and notes for export"""
+    from complete_200_players import draft_priority
+
+    return [
+        dict(
+            player,
+            auction_value_ppr=player['auction_value'],
+            priority=draft_priority(player['rank']),
+            notes='ESPN ID available' if player['espn_id'] else 'Need ESPN ID for live stats',
+        )
+        for player in inputs['projection']
+    ]
+
+
+def tiering(inputs: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Per-position tiers clustered from projected points beside the typed ones, with each tier's boundaries"""
+    from tier_clustering import tier_boundaries, tier_by_position
+
+    rows = inputs['valuation']
+    positions = [player['position'] for player in rows]
+    points = [player['projected_fpts_2025'] for player in rows]
+    hand_tiers = [player['tier'] for player in rows]
+    if params['tiers'] == 'hand':
+        tiers = hand_tiers
+        boundaries = {}
+        for position in dict.fromkeys(positions):
+            members = [i for i, pos in enumerate(positions) if pos == position]
+            boundaries[position] = tier_boundaries([points[i] for i in members], [tiers[i] for i in members])
+    else:
+        tiers, boundaries = tier_by_position(positions, points, params['tiers'], current=hand_tiers)
+    return {
+        'players': [dict(player, cluster_tier=tier) for player, tier in zip(rows, tiers)],
+        'boundaries': {
+            'method': params['tiers'], 'feature': 'points', 'positions': boundaries,
+            'players': [{'name': player['name'], 'position': player['position'], 'tier': tier}
+                        for player, tier in zip(rows, tiers)],
+        },
+    }
+
+
+def export(inputs: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Write the unified CSV (typed tiers), with the clustered tiers and boundaries in a JSON file beside it"""
+    from tier_clustering import boundaries_path
+
+    rows = inputs['tiering']['players']
+    with open(params['output'], 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=EXPORT_FIELDS, extrasaction='ignore', lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+    tiers_path = boundaries_path(params['output'])
+    with open(tiers_path, 'w', encoding='utf-8') as handle:
+        json.dump(inputs['tiering']['boundaries'], handle, indent=2)
+        handle.write("\n")
+    return {'path': params['output'], 'rows': len(rows), 'sha256': _file_digest(params['output']),
+            'tiers_path': tiers_path, 'tiers_sha256': _file_digest(tiers_path)}
+
+
+def snapshot(inputs: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Publish the indexed SQLite snapshot that draft-time tools open read-only"""
+    players = [
+        AuctionPlayer(p['rank'], p['name'], p['position'], p['team'], p['tier'],
+                      max(int(p['auction_value_ppr']), 1), float(p['projected_fpts_2025']), p['espn_id'])
+        for p in inputs['tiering']['players']
+    ]
+    write_snapshot(players, params['snapshot'], source='player_pipeline')
+    return {'path': params['snapshot'], 'rows': len(players), 'sha256': _file_digest(params['snapshot'])}
+
+
+def _output_still_valid(output: Dict[str, Any]) -> bool:
+    """Re-publish if a file on disk was deleted or edited since the cached run"""
+    files = [(output['path'], output['sha256'])]
+    if 'tiers_path' in output:
+        files.append((output['tiers_path'], output['tiers_sha256']))
+    return all(os.path.exists(path) and _file_digest(path) == digest for path, digest in files)
+
+
+@dataclass
+class Stage:
+    name: str
+    run: Callable[[Dict[str, Any], Dict[str, Any]], Any]
+    inputs: Tuple[str, ...] = ()
+    params: Tuple[str, ...] = ()
+    source_files: Tuple[str, ...] = ()
+    still_valid: Optional[Callable[[Any], bool]] = None
+    constants: Dict[str, Any] = field(default_factory=dict)  # Module-level settings the stage reads
+
+
+STAGES = [
+    Stage('roster_source', roster_source, params=('limit',),
+          source_files=('complete_200_players.py',)),
+    Stage('resolve_ids', resolve_ids, inputs=('roster_source',),
+          source_files=('entity_resolution.py', 'complete_200_players.py', 'final_top_200_with_known_ids.py')),
+    Stage('fetch_stats', fetch_stats, inputs=('resolve_ids',), params=('fetch_stats', 'stats_as_of'),
+          source_files=('top_200_fantasy_scraper.py',)),
+    Stage('scoring', scoring, inputs=('fetch_stats',), source_files=('auction_players.py',)),
+    Stage('projection', projection, inputs=('resolve_ids', 'scoring'),
+          source_files=('complete_200_players.py',)),
+    Stage('valuation', valuation, inputs=('projection',), source_files=('complete_200_players.py',)),
+    Stage('tiering', tiering, inputs=('valuation',), params=('tiers',), source_files=('tier_clustering.py',)),
+    Stage('export', export, inputs=('tiering',), params=('output',), source_files=('tier_clustering.py',),
+          still_valid=_output_still_valid, constants={'fields': EXPORT_FIELDS}),
+    Stage('snapshot', snapshot, inputs=('tiering',), params=('snapshot',),
+          source_files=('player_snapshot.py',), still_valid=_output_still_valid),
+]
+
+
+class PipelineCache:
+    """Content-addressed objects plus stage-key -> object digest references"""
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR):
+        self.objects = os.path.join(root, 'objects')
+        self.refs = os.path.join(root, 'refs')
+        os.makedirs(self.objects, exist_ok=True)
+        os.makedirs(self.refs, exist_ok=True)
+
+    def lookup(self, stage: str, key: str) -> Optional[Tuple[str, Any]]:
+        ref_path = os.path.join(self.refs, f"{stage}-{key}")
+        if not os.path.exists(ref_path):
+            return None
+        with open(ref_path, encoding='utf-8') as handle:
+            digest = handle.read().strip()
+        object_path = os.path.join(self.objects, digest)
+        if not os.path.exists(object_path):
+            return None
+        with open(object_path, 'rb') as handle:
+            return digest, json.loads(handle.read())
+
+    def store(self, stage: str, key: str, output: Any) -> str:
+        data = _canonical(output)
+        digest = _digest(data)
+        object_path = os.path.join(self.objects, digest)
+        if not os.path.exists(object_path):
+            with open(object_path, 'wb') as handle:
+                handle.write(data)
+        with open(os.path.join(self.refs, f"{stage}-{key}"), 'w', encoding='utf-8') as handle:
+            handle.write(digest)
+        return digest
+
+
+class Pipeline:
+    def __init__(self, params: Dict[str, Any], stages: List[Stage] = STAGES,
+                 cache_dir: str = DEFAULT_CACHE_DIR):
+        self.params = params
+        self.stages = {stage.name: stage for stage in stages}
+        self.order = [stage.name for stage in stages]  # Listed in dependency order
+        self.cache = PipelineCache(cache_dir)
+
+    def stage_key(self, stage: Stage, input_digests: Dict[str, str]) -> str:
+        manifest = {
+            'stage': stage.name,
+            'code': _digest(inspect.getsource(stage.run).encode('utf-8')),
+            'files': {path: _file_digest(path) for path in stage.source_files if os.path.exists(path)},
+            'params': {name: self.params[name] for name in stage.params},
+            'constants': stage.constants,
+            'inputs': input_digests,
+        }
+        return _digest(_canonical(manifest))
+
+    def _needed(self, until: Optional[str]) -> List[str]:
+        if until is None:
+            return self.order
+        needed = set()
+        pending = [until]
+        while pending:
+            name = pending.pop()
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.stages[name].inputs)
+        return [name for name in self.order if name in needed]
+
+    def run(self, until: Optional[str] = None, force: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        outputs: Dict[str, Any] = {}
+        digests: Dict[str, str] = {}
+
+        for name in self._needed(until):
+            stage = self.stages[name]
+            key = self.stage_key(stage, {upstream: digests[upstream] for upstream in stage.inputs})
+            cached = None if name in force else self.cache.lookup(name, key)
+            if cached and stage.still_valid and not stage.still_valid(cached[1]):
+                cached = None
+
+            if cached:
+                digests[name], outputs[name] = cached
+                print(f"   ✅ {name:<14} cached   {digests[name][:12]}")
+                continue
+
+            stage_inputs = {upstream: outputs[upstream] for upstream in stage.inputs}
+            started = time.perf_counter()
+            output = stage.run(stage_inputs, self.params)
+            # Round-trip through JSON so fresh and cached outputs look identical downstream
+            outputs[name] = json.loads(_canonical(output))
+            digests[name] = self.cache.store(name, key, output)
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"   🔄 {name:<14} ran      {digests[name][:12]} ({elapsed:.0f} ms)")
+
+        return outputs
+
+
+def pipeline_params(output: str = DEFAULT_PLAYERS_CSV, snapshot: str = DEFAULT_SNAPSHOT, limit: int = 200,
+                    fetch_stats: bool = False, tiers: str = DEFAULT_TIERS) -> Dict[str, Any]:
+    """Stage parameters for one build; main() and draft_cli.py generate both go through here"""
+    if tiers not in TIER_CHOICES:
+        raise ValueError(f"Unknown tier method: {tiers}")
+    return {
+        'output': output,
+        'snapshot': snapshot,
+        'limit': limit,
+        'fetch_stats': fetch_stats,
+        'tiers': tiers,
+        # Fetched stats are refreshed at most daily unless forced
+        'stats_as_of': datetime.date.today().isoformat() if fetch_stats else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Staged, cached top-200 player data pipeline")
+    parser.add_argument('--output', default=DEFAULT_PLAYERS_CSV, help="CSV written by the export stage")
+    parser.add_argument('--snapshot', default=DEFAULT_SNAPSHOT, help="SQLite snapshot written by the snapshot stage")
+    parser.add_argument('--limit', type=int, default=200, help="Players kept from the roster source")
+    parser.add_argument('--fetch-stats', action='store_true', help="Fetch 2024 stats from the ESPN API")
+    parser.add_argument('--tiers', choices=TIER_CHOICES, default=DEFAULT_TIERS,
+                        help="Clustering method for the tiers sidecar (tier_clustering.py); 'hand' skips clustering")
+    parser.add_argument('--until', choices=[stage.name for stage in STAGES], help="Last stage to run")
+    parser.add_argument('--force', nargs='*', default=[], choices=[stage.name for stage in STAGES],
+                        help="Stages to re-run even if cached")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+
+    params = pipeline_params(args.output, args.snapshot, args.limit, args.fetch_stats, args.tiers)
+
+    print("🏈 Player Data Pipeline")
+    print("=" * 50)
+    outputs = Pipeline(params, cache_dir=args.cache_dir).run(until=args.until, force=tuple(args.force))
+
+    if 'export' in outputs:
+        print(f"\n💾 {outputs['export']['rows']} players written to {outputs['export']['path']}")
+        print(f"📐 Clustered tiers and boundaries written to {outputs['export']['tiers_path']}")
+    if 'snapshot' in outputs:
+        print(f"🗃️  Snapshot published to {outputs['snapshot']['path']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Indexed SQLite Player Snapshot
+A single-file, versioned copy of the player universe that tools open
+read-only at startup instead of re-parsing CSVs and rebuilding lists.
+
+The pipeline's snapshot stage publishes it (player_pipeline.py); queries by
+position, tier, team, normalized name and cost go through B-tree indexes,
+so each lookup is O(log n) with no rebuild step.
+
+Only sqlite3 and the AuctionPlayer record load at import time; the name
+normalizer and the CSV reader are imported by the calls that need them, so
+opening the snapshot stays within draft_cli.py's cold-start budget.
+
+Usage:
+    python3 player_snapshot.py                  # build from the CSV and show stats
+    python3 player_snapshot.py "ja'marr chase"  # look a player up by name
+
+    with PlayerSnapshot.open() as snapshot:
+        rbs = snapshot.by_position("RB")
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from typing import List, Optional
+
+from auction_players import DEFAULT_PLAYERS_CSV, AuctionPlayer, load_auction_players
+
+DEFAULT_SNAPSHOT = "player_snapshot.sqlite"
+SCHEMA_VERSION = 1
+
+SCHEMA_SQL = """
+CREATE TABLE players (
+  rank INTEGER PRIMARY KEY,
+  key TEXT NOT NULL UNIQUE,
+  name TEXT NOT NULL,
+  normalized_name TEXT NOT NULL,
+  position TEXT NOT NULL,
+  team TEXT NOT NULL,
+  tier INTEGER NOT NULL,
+  auction_value INTEGER NOT NULL,
+  projected_points REAL NOT NULL,
+  espn_id TEXT NOT NULL
+);
+CREATE TABLE meta (
+  name TEXT PRIMARY KEY,
+  value TEXT NOT NULL
+);
+CREATE INDEX idx_players_position ON players(position, rank);
+CREATE INDEX idx_players_tier ON players(tier, rank);
+CREATE INDEX idx_players_team ON players(team, rank);
+CREATE INDEX idx_players_normalized_name ON players(normalized_name);
+CREATE INDEX idx_players_auction_value ON players(auction_value);
+"""
+
+PLAYER_COLUMNS = "rank, name, position, team, tier, auction_value, projected_points, espn_id"
+
+
+def write_snapshot(players: List[AuctionPlayer], path: str = DEFAULT_SNAPSHOT, source: str = "") -> str:
+    """Build the snapshot next to `path` and swap it in atomically"""
+    from entity_resolution import normalize_name, player_key
+
+    temp_path = f"{path}.tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    conn = sqlite3.connect(temp_path)
+    try:
+        conn.executescript(SCHEMA_SQL)
+        seen = set()
+        rows = []
+        for p in sorted(players, key=lambda p: p.rank):
+            key = player_key(p.name, p.position)
+            if key in seen:
+                continue
+            seen.add(key)
+            rows.append((p.rank, key, p.name, normalize_name(p.name), p.position, p.team, p.tier,
+                         p.auction_value, p.projected_points, p.espn_id))
+        conn.executemany("INSERT INTO players VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ('built_at', time.strftime('%Y-%m-%dT%H:%M:%S')),
+            ('source', source),
+            ('players', str(len(rows))),
+        ])
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(temp_path, path)
+    return path
+
+
+class PlayerSnapshot:
+    """Read-only queries over a published snapshot"""
+
+    def __init__(self, conn: sqlite3.Connection, path: str):
+        self.conn = conn
+        self.path = path
+
+    @classmethod
+    def open(cls, path: str = DEFAULT_SNAPSHOT) -> "PlayerSnapshot":
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.close()
+            raise ValueError(f"{path} is snapshot version {version}, expected {SCHEMA_VERSION}")
+        return cls(conn, path)
+
+    def _query(self, where: str = "", args: tuple = (), order: str = "rank") -> List[AuctionPlayer]:
+        sql = f"SELECT {PLAYER_COLUMNS} FROM players {where} ORDER BY {order}"
+        return [AuctionPlayer(*row) for row in self.conn.execute(sql, args)]
+
+    def meta(self) -> dict:
+        return dict(self.conn.execute("SELECT name, value FROM meta"))
+
+    def players(self) -> List[AuctionPlayer]:
+        return self._query()
+
+    def by_position(self, position: str) -> List[AuctionPlayer]:
+        return self._query("WHERE position = ?", (position,))
+
+    def by_tier(self, tier: int) -> List[AuctionPlayer]:
+        return self._query("WHERE tier = ?", (tier,))
+
+    def by_team(self, team: str) -> List[AuctionPlayer]:
+        return self._query("WHERE team = ?", (team,))
+
+    def in_price_range(self, low: int, high: int) -> List[AuctionPlayer]:
+        return self._query("WHERE auction_value BETWEEN ? AND ?", (low, high), order="auction_value DESC, rank")
+
+    def find(self, name: str) -> List[AuctionPlayer]:
+        """Players whose normalized name matches ("Patrick Mahomes II" finds Patrick Mahomes)"""
+        from entity_resolution import normalize_name
+
+        return self._query("WHERE normalized_name = ?", (normalize_name(name),))
+
+    def get(self, rank: int) -> Optional[AuctionPlayer]:
+        found = self._query("WHERE rank = ?", (rank,))
+        return found[0] if found else None
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "PlayerSnapshot":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_players(snapshot_path: str = DEFAULT_SNAPSHOT, csv_path: str = DEFAULT_PLAYERS_CSV) -> List[AuctionPlayer]:
+    """The snapshot when it is at least as new as the CSV, otherwise the CSV"""
+    if os.path.exists(snapshot_path) and (
+            not os.path.exists(csv_path) or os.path.getmtime(snapshot_path) >= os.path.getmtime(csv_path)):
+        try:
+            with PlayerSnapshot.open(snapshot_path) as snapshot:
+                return snapshot.players()
+        except (sqlite3.Error, ValueError):
+            pass  # Unreadable or older schema; fall back to the CSV
+    return load_auction_players(csv_path)
+
+
+def main():
+    if not os.path.exists(DEFAULT_SNAPSHOT):
+        write_snapshot(load_auction_players(), source=DEFAULT_PLAYERS_CSV)
+
+    started = time.perf_counter()
+    with PlayerSnapshot.open() as snapshot:
+        opened = (time.perf_counter() - started) * 1000
+        print("🗃️  Player Snapshot")
+        print("=" * 50)
+        print(f"📄 {snapshot.path}: {snapshot.meta()} (opened in {opened:.2f} ms)")
+
+        if len(sys.argv) > 1:
+            for player in snapshot.find(sys.argv[1]):
+                print(f"   #{player.rank} {player.name} {player.position} {player.team} "
+                      f"tier {player.tier} ${player.auction_value}")
+            return
+
+        for position in ("QB", "RB", "WR", "TE", "K", "DEF"):
+            started = time.perf_counter()
+            count = len(snapshot.by_position(position))
+            print(f"   {position:<3} {count:>3} players ({(time.perf_counter() - started) * 1000:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
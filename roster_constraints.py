@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Roster Constraint Engine
+Checks whether a candidate roster is legal, and where it breaks, fast enough
+for optimizers and simulators to test millions of candidates per second.
+
+Every player is encoded once as bitmasks:
+- eligible slots: their position, FLEX for RB/WR/TE, and BENCH
+- NFL team: one bit per team, so QB + pass-catcher stacks are one AND
+- bye week: one bit per week, from BYE_WEEKS
+
+and as a packed counter: one small field per constraint, holding 1 where
+the player counts toward it. Adding the players' counters adds every field
+at once, and each field carries a bias chosen so that its top (guard) bit
+ends up set exactly when the field is in bounds (minimums) or out of bounds
+(maximums). A whole roster is then checked with one add, one AND and one
+XOR, whatever the number of constraints:
+- total auction spend within the budget (a wider field of prices)
+- starting slots can be filled: Hall's condition over the slot eligibility
+  masks, e.g. 1 QB, 2 RB, and 6 RB/WR/TE once FLEX is counted
+- at most POSITION_LIMITS per position and roster_size() players overall
+- optionally at most --max-per-team players from one NFL team
+
+Bye coverage is scored, not enforced: the same counters hold one field per
+bye week and QB/RB/WR/TE/FLEX starter group, and bye_gaps() lists the weeks
+where the players not on bye cannot fill those starters (K and DEF are
+streamed, one per roster). Most real rosters have a gap or two, covered
+from waivers for that week, so a gap lowers a roster's score instead of
+making it illegal.
+
+check_many() and bye_gaps_many() do the same over NumPy arrays of rosters,
+one column of players at a time. The benchmark checks rosters bought in
+simulated auctions (auction_simulator.py).
+
+Usage:
+    python3 roster_constraints.py [--max-per-team 4] [--bench 1000000]
+"""
+
+import argparse
+import time
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from auction_players import BYE_WEEKS, DEFAULT_BUDGET, FLEX_POSITIONS, POSITION_LIMITS, POSITIONS, \
+    ROSTER_SLOTS, AuctionPlayer, roster_size
+from entity_resolution import normalize_name
+
+SLOT_BITS = {slot: 1 << i for i, slot in enumerate(ROSTER_SLOTS)}
+BYE_CHECKED_POSITIONS = ("QB", "RB", "WR", "TE")
+
+FIELD_BITS = 6  # Player-count fields; a field never straddles a uint64 word, so NumPy can add words
+BUDGET_BITS = 16  # The spend field, wide enough for any auction budget
+MAX_COUNT = (1 << (FIELD_BITS - 1)) - 1  # Largest roster a count field holds without carrying into its neighbour
+CHUNK_ROSTERS = 1 << 12  # Keeps each chunk's counters in cache
+
+
+def eligible_slots(position: str) -> int:
+    """Bitmask of the slots a player at `position` can fill"""
+    mask = SLOT_BITS.get(position, 0) | SLOT_BITS["BENCH"]
+    if position in FLEX_POSITIONS:
+        mask |= SLOT_BITS["FLEX"]
+    return mask
+
+
+def starter_requirements(slots: Dict[str, int] = ROSTER_SLOTS,
+                         positions: Iterable[str] = POSITIONS) -> Dict[FrozenSet[str], int]:
+    """
+    Minimum players needed from each group of positions to fill the starting slots.
+
+    By Hall's theorem the starters can be placed iff every set of starting
+    slots has at least as many eligible players as it has slots. Each slot set
+    becomes "players from these positions >= slots"; groups whose minimum
+    already follows from a split into smaller groups are dropped, which for
+    the standard roster leaves one per position plus RB/WR/TE >= 6.
+    """
+    positions = tuple(positions)
+    starting = [slot for slot, count in slots.items() if slot != "BENCH" and count]
+    needs: Dict[FrozenSet[str], int] = {}
+    for subset in range(1, 1 << len(starting)):
+        chosen = [slot for i, slot in enumerate(starting) if subset >> i & 1]
+        chosen_bits = sum(SLOT_BITS[slot] for slot in chosen)
+        group = frozenset(p for p in positions if eligible_slots(p) & chosen_bits)
+        needs[group] = max(needs.get(group, 0), sum(slots[slot] for slot in chosen))
+
+    essential = {}
+    for group, need in sorted(needs.items(), key=lambda item: len(item[0])):
+        members = sorted(group)
+        implied = False
+        for split in range(1, (1 << len(members)) - 1):
+            part = frozenset(m for i, m in enumerate(members) if split >> i & 1)
+            if needs.get(part, 0) + needs.get(group - part, 0) >= need:
+                implied = True
+                break
+        if not implied:
+            essential[group] = need
+    return essential
+
+
+def _group_label(group: FrozenSet[str]) -> str:
+    return "/".join(p for p in POSITIONS if p in group)
+
+
+class RosterConstraints:
+    def __init__(self, players: List[AuctionPlayer], slots: Dict[str, int] = ROSTER_SLOTS,
+                 limits: Dict[str, int] = POSITION_LIMITS, max_per_team: Optional[int] = None,
+                 bye_weeks: Optional[Dict[str, int]] = None,
+                 bye_positions: Iterable[str] = BYE_CHECKED_POSITIONS, budget: Optional[int] = DEFAULT_BUDGET):
+        self.players = players
+        self.row: Dict[str, int] = {normalize_name(p.name): i for i, p in enumerate(players)}
+        self.budget = budget
+        bye_weeks = BYE_WEEKS if bye_weeks is None else bye_weeks
+
+        teams = sorted({p.team for p in players})
+        self.teams = teams
+        self.eligible = [eligible_slots(p.position) for p in players]
+        self.team_bits = [1 << teams.index(p.team) for p in players]
+        self.bye_bits = [1 << bye_weeks[p.team] if p.team in bye_weeks else 0 for p in players]
+
+        # (label, is_minimum, bound, weights, bits, soft): each player adds their weight to the field;
+        # soft fields (bye coverage) are scored by bye_gaps() and never make a roster infeasible
+        fields: List[Tuple[str, bool, int, List[int], int, bool]] = []
+
+        def count_field(label: str, is_minimum: bool, bound: int, members: Iterable[bool], soft: bool = False):
+            fields.append((label, is_minimum, bound, [int(member) for member in members], FIELD_BITS, soft))
+
+        count_field(f"more than {roster_size()} players", False, roster_size(), [True] * len(players))
+        for position in POSITIONS:
+            count_field(f"more than {limits[position]} {position}", False, limits[position],
+                        (p.position == position for p in players))
+        requirements = starter_requirements(slots)
+        for group, need in requirements.items():
+            count_field(f"fewer than {need} {_group_label(group)} to start", True, need,
+                        (p.position in group for p in players))
+        checked = set(bye_positions)
+        for week in sorted({bye_weeks[team] for team in teams if team in bye_weeks}):
+            for group, need in requirements.items():
+                if group <= checked:
+                    count_field(f"week {week} byes leave fewer than {need} {_group_label(group)}", True, need,
+                                (p.position in group and not bits >> week & 1
+                                 for p, bits in zip(players, self.bye_bits)), soft=True)
+        if max_per_team is not None:
+            for team in teams:
+                count_field(f"more than {max_per_team} from {team}", False, max_per_team,
+                            (p.team == team for p in players))
+        if budget is not None:
+            fields.append((f"over the ${budget} budget", False, budget,
+                           [p.auction_value for p in players], BUDGET_BITS, False))
+        self.fields = fields
+
+        # Packed counters as Python ints (one per player) and the biases that move guard bits
+        self.codes = [0] * len(players)
+        self.bias = self.guard = self.min_guard = self.soft_guard = self.soft_min_guard = 0
+        self.offsets = []
+        self.soft_bits: List[int] = []  # Guard bit position of each soft field
+        offset = 0
+        for label, is_minimum, bound, weights, bits, soft in fields:
+            if offset % 64 + bits > 64:
+                offset += 64 - offset % 64
+            guard_bit = 1 << (bits - 1)
+            if not 0 <= bound < guard_bit:
+                raise ValueError(f"Constraint bound out of range: {label}")
+            self.offsets.append(offset)
+            # Minimum: total + (guard - need) reaches the guard bit iff total >= need
+            # Maximum: total + (guard - 1 - limit) reaches the guard bit iff total > limit
+            self.bias += (guard_bit - bound if is_minimum else guard_bit - 1 - bound) << offset
+            if soft:
+                self.soft_bits.append(offset + bits - 1)
+                self.soft_guard |= guard_bit << offset
+                if is_minimum:
+                    self.soft_min_guard |= guard_bit << offset
+            else:
+                self.guard |= guard_bit << offset
+                if is_minimum:
+                    self.min_guard |= guard_bit << offset
+            for i, weight in enumerate(weights):
+                self.codes[i] += weight << offset
+            offset += bits
+
+        # The same counters as uint64 words for check_many, plus an all-zero row for padding
+        self.words = (offset + 63) // 64
+        self.code_words = np.array([self._split(code) for code in self.codes + [0]], dtype=np.uint64)
+        self.bias_words = np.array(self._split(self.bias), dtype=np.uint64)
+        self.guard_words = np.array(self._split(self.guard), dtype=np.uint64)
+        self.min_guard_words = np.array(self._split(self.min_guard), dtype=np.uint64)
+        self.soft_min_guard_words = np.array(self._split(self.soft_min_guard), dtype=np.uint64)
+        qb = np.array([p.position == "QB" for p in players] + [False])
+        catcher = np.array([p.position in ("WR", "TE") for p in players] + [False])
+        team_bits = np.array(self.team_bits + [0], dtype=np.uint64)
+        self.qb_team_bits = np.where(qb, team_bits, 0).astype(np.uint64)
+        self.catcher_team_bits = np.where(catcher, team_bits, 0).astype(np.uint64)
+
+    def _split(self, value: int) -> List[int]:
+        return [(value >> (64 * word)) & 0xFFFFFFFFFFFFFFFF for word in range(self.words)]
+
+    def index(self, name: str) -> int:
+        index = self.row.get(normalize_name(name))
+        if index is None:
+            raise KeyError(f"Unknown player: {name}")
+        return index
+
+    def _flags(self, indices: List[int], soft: bool = False) -> int:
+        total = sum(self.codes[i] for i in indices) + self.bias
+        if soft:
+            return (total & self.soft_guard) ^ self.soft_min_guard
+        return (total & self.guard) ^ self.min_guard
+
+    def _labels(self, flags: int, soft: bool) -> List[str]:
+        return [label for (label, _, _, _, bits, is_soft), offset in zip(self.fields, self.offsets)
+                if is_soft == soft and flags >> (offset + bits - 1) & 1]
+
+    def is_feasible(self, indices: List[int]) -> bool:
+        return len(indices) <= MAX_COUNT and not self._flags(indices)
+
+    def violations(self, indices: List[int]) -> List[str]:
+        """Every hard constraint the roster breaks, in field order (empty when legal)"""
+        if len(indices) > MAX_COUNT:
+            return [f"more than {MAX_COUNT} players"]
+        return self._labels(self._flags(indices), soft=False)
+
+    def bye_gaps(self, indices: List[int]) -> List[str]:
+        """Bye weeks that leave a starter group short; the roster's soft score is their count"""
+        if len(indices) > MAX_COUNT:
+            return []
+        return self._labels(self._flags(indices, soft=True), soft=True)
+
+    def stacks(self, indices: List[int]) -> List[str]:
+        """NFL teams where the roster has a QB and at least one WR/TE from the same team"""
+        qb_teams = catcher_teams = 0
+        for i in indices:
+            position = self.players[i].position
+            if position == "QB":
+                qb_teams |= self.team_bits[i]
+            elif position in ("WR", "TE"):
+                catcher_teams |= self.team_bits[i]
+        stacked = qb_teams & catcher_teams
+        return [team for bit, team in enumerate(self.teams) if stacked >> bit & 1]
+
+    def _chunk_totals(self, rosters: np.ndarray):
+        """(start, biased counter totals) for each chunk of `rosters`"""
+        rosters = np.asarray(rosters)
+        if rosters.shape[1] > MAX_COUNT:
+            raise ValueError(f"Rosters can hold at most {MAX_COUNT} players")
+        pad = len(self.players)
+        for start in range(0, len(rosters), CHUNK_ROSTERS):
+            # Column-major so each gather reads one contiguous run of player indices
+            columns = np.ascontiguousarray(np.where(rosters[start:start + CHUNK_ROSTERS] < 0, pad,
+                                                    rosters[start:start + CHUNK_ROSTERS]).T)
+            totals = self.code_words[columns[0]] + self.bias_words
+            gathered = np.empty_like(totals)
+            for column in columns[1:]:
+                np.take(self.code_words, column, axis=0, out=gathered)
+                totals += gathered
+            yield start, totals
+
+    def check_many(self, rosters: np.ndarray) -> np.ndarray:
+        """
+        Feasibility of each row of `rosters`, an int array (n, players) of
+        player indices with -1 padding short rosters
+        """
+        feasible = np.empty(len(rosters), dtype=bool)
+        for start, totals in self._chunk_totals(rosters):
+            flags = (totals & self.guard_words) ^ self.min_guard_words
+            feasible[start:start + len(totals)] = ~flags.any(axis=1)
+        return feasible
+
+    def bye_gaps_many(self, rosters: np.ndarray) -> np.ndarray:
+        """Number of bye gaps (the bye_gaps() score) of each row of `rosters`"""
+        gaps = np.empty(len(rosters), dtype=np.int32)
+        for start, totals in self._chunk_totals(rosters):
+            flags = totals ^ self.soft_min_guard_words
+            count = np.zeros(len(totals), dtype=np.int32)
+            for bit in self.soft_bits:
+                count += ((flags[:, bit // 64] >> np.uint64(bit % 64)) & np.uint64(1)).astype(np.int32)
+            gaps[start:start + len(totals)] = count
+        return gaps
+
+    def stacked_many(self, rosters: np.ndarray) -> np.ndarray:
+        """Whether each roster has at least one QB + WR/TE stack"""
+        rosters = np.asarray(rosters)
+        stacked = np.empty(len(rosters), dtype=bool)
+        for start in range(0, len(rosters), CHUNK_ROSTERS):
+            chunk = rosters[start:start + CHUNK_ROSTERS]
+            chunk = np.where(chunk < 0, len(self.players), chunk)
+            qb_teams = np.bitwise_or.reduce(self.qb_team_bits[chunk], axis=1)
+            catcher_teams = np.bitwise_or.reduce(self.catcher_team_bits[chunk], axis=1)
+            stacked[start:start + len(chunk)] = (qb_teams & catcher_teams) != 0
+        return stacked
+
+
+def auction_rosters(engine: RosterConstraints, drafts: int = 100, seed: int = 0) -> np.ndarray:
+    """Every team's roster from `drafts` simulated auctions, -1 padding unfilled slots"""
+    from auction_simulator import SimulationConfig, simulate_draft
+
+    config = SimulationConfig()
+    rosters = np.full((drafts * config.teams, roster_size()), -1, dtype=np.int64)
+    row = 0
+    for draft in range(drafts):
+        for roster in simulate_draft(engine.players, config, seed + draft).rosters:
+            rosters[row, :len(roster)] = roster
+            row += 1
+    return rosters
+
+
+def bench(engine: RosterConstraints, count: int):
+    drafted = auction_rosters(engine)
+    rosters = np.resize(drafted, (count, drafted.shape[1]))  # Repeats the drafted rosters up to `count`
+    engine.check_many(rosters[:1000])  # Warm up
+    started = time.perf_counter()
+    feasible = engine.check_many(rosters)
+    elapsed = time.perf_counter() - started
+    stacked = engine.stacked_many(rosters)
+    gaps = engine.bye_gaps_many(drafted)
+    print(f"⚡ {count:,} rosters in {elapsed * 1000:.0f} ms ({count / elapsed / 1e6:.1f}M rosters/s), "
+          f"from {len(drafted):,} auctioned rosters: {feasible.mean():.2%} legal, {stacked.mean():.1%} stacked, "
+          f"{gaps.mean():.1f} bye gaps per roster")
+    reasons = Counter(problem for roster in drafted.tolist()
+                      for problem in engine.violations([i for i in roster if i >= 0]))
+    for problem, times in reasons.most_common(3):
+        print(f"   {times / len(drafted):.1%} {problem}")
+
+    sample = rosters[:2000].tolist()
+    started = time.perf_counter()
+    for roster in sample:
+        engine.is_feasible([i for i in roster if i >= 0])
+    per_check = (time.perf_counter() - started) / len(sample) * 1e6
+    print(f"🐍 One roster from Python ints: {per_check:.1f} µs")
+
+
+def main():
+    from player_snapshot import load_players
+    from roster_scenario_solver import ScenarioEngine
+
+    parser = argparse.ArgumentParser(description="Bitset roster constraint checks")
+    parser.add_argument('--max-per-team', type=int, help="Most players allowed from one NFL team")
+    parser.add_argument('--bench', type=int, default=1_000_000, help="Auctioned rosters to time (0 to skip)")
+    args = parser.parse_args()
+
+    players = load_players()
+    engine = RosterConstraints(players, max_per_team=args.max_per_team)
+    print("🧩 Roster Constraint Engine")
+    print("=" * 50)
+    print(f"📊 {len(players)} players, {len(engine.fields)} constraints packed into {engine.words} words")
+
+    for result in ScenarioEngine(players).solve_all(workers=1):
+        if not result.feasible:
+            continue
+        roster = [engine.index(player.name) for player in result.players]
+        problems = engine.violations(roster)
+        stacks = engine.stacks(roster)
+        print(f"\n{'✅' if not problems else '⚠️ '} {result.name} (${result.total_cost})"
+              f"{' stacks: ' + ', '.join(stacks) if stacks else ''}")
+        for problem in problems:
+            print(f"   - {problem}")
+        for gap in engine.bye_gaps(roster):
+            print(f"   🗓️  {gap}")
+
+    if args.bench:
+        print()
+        bench(engine, args.bench)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Roster Scenario Solver
+Expresses each draft strategy as roster constraints and budget bounds, then
+solves every strategy with one shared optimizer in a process pool
+
+Strategies (from Product_Requirements.md):
+- Balanced, Stars & Scrubs, Depth, Zero RB, Hero RB, Late QB
+
+How it works:
+1. For every position, a knapsack pass over that position's players builds a
+   frontier: best weighted points for exactly k players costing exactly $c
+2. The frontiers are built once in the parent and handed to each worker
+3. A strategy only filters the frontier (count / spend / elite bounds) and merges
+   the positions, so adding a strategy is one StrategySpec, not another pass
+
+"Elite" is a player worth at least ELITE_PRICE. Strategies that are about
+stars (Hero RB, Stars & Scrubs) bound how many elite players the roster ends
+with, per position or roster-wide. Their frontiers then also track the elite
+count, best[e][k][c], and the merge carries it along with the player count.
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from auction_players import (
+    DEFAULT_BUDGET, FLEX_POSITIONS, POSITION_LIMITS, POSITIONS, ROSTER_SLOTS,
+    AuctionPlayer, players_by_position, roster_size,
+)
+from player_snapshot import load_players
+
+NEG_INF = float("-inf")
+
+# Points credit by depth chart spot. The first reserve at each FLEX position
+# is credited at FLEX_WEIGHT, an optimistic stand-in for the single FLEX slot.
+FLEX_WEIGHT = 0.8
+BENCH_WEIGHT = 0.3
+
+# Position merge order: fixed-count positions first keeps the DP state small,
+# and the last position only has to extend states that complete the roster
+MERGE_ORDER = ("K", "DEF", "QB", "TE", "RB", "WR")
+
+ELITE_PRICE = 45  # Auction value that makes a player a star (tier-1 RB/WR, top QB)
+
+
+@dataclass(frozen=True)
+class PositionBounds:
+    min_count: int
+    max_count: int
+    min_share: float = 0.0  # Fraction of the remaining budget spent at this position
+    max_share: float = 1.0
+    min_elite: int = 0  # Players at this position worth at least the strategy's elite price
+    max_elite: Optional[int] = None
+
+
+DEFAULT_BOUNDS = {
+    position: PositionBounds(ROSTER_SLOTS[position], POSITION_LIMITS[position])
+    for position in POSITIONS
+}
+
+
+@dataclass(frozen=True)
+class StrategySpec:
+    key: str
+    name: str
+    description: str
+    bounds: Dict[str, PositionBounds] = field(default_factory=dict)
+    max_player_price: Optional[int] = None
+    elite_price: Optional[int] = None  # Needed for any elite bound to apply
+    min_elite: int = 0  # Elite players on the whole roster
+    max_elite: Optional[int] = None
+
+    def bounds_for(self, position: str) -> PositionBounds:
+        return self.bounds.get(position, DEFAULT_BOUNDS[position])
+
+    def elite_cap(self, position: str) -> int:
+        """Most elite players this strategy could keep at a position (0 without an elite price)"""
+        if self.elite_price is None:
+            return 0
+        caps = [self.bounds_for(position).max_count, self.bounds_for(position).max_elite, self.max_elite]
+        return min(cap for cap in caps if cap is not None)
+
+    def frontier_key(self) -> Tuple:
+        """Strategies with equal keys can share frontiers"""
+        if self.elite_price is None:
+            return (self.max_player_price,)
+        return (self.max_player_price, self.elite_price, tuple(self.elite_cap(p) for p in POSITIONS))
+
+
+STRATEGIES = [
+    StrategySpec(
+        "balanced", "Balanced Build", "Even distribution across all positions",
+        bounds={
+            "QB": PositionBounds(1, 2, 0.08, 0.20),
+            "RB": PositionBounds(2, 6, 0.30, 0.45),
+            "WR": PositionBounds(2, 6, 0.25, 0.40),
+            "TE": PositionBounds(1, 2, 0.04, 0.12),
+        },
+    ),
+    StrategySpec(
+        "stars-scrubs", "Stars & Scrubs", "Target 2-3 elite players, fill with value picks",
+        bounds={
+            "QB": PositionBounds(1, 2, 0.0, 0.04),
+            "RB": PositionBounds(2, 7, 0.45, 1.0),
+            "WR": PositionBounds(2, 7, 0.30, 1.0),
+            "TE": PositionBounds(1, 2, 0.0, 0.04),
+        },
+        elite_price=ELITE_PRICE, min_elite=2, max_elite=3,
+    ),
+    StrategySpec(
+        "depth-build", "Depth Strategy", "No single player over $35, build deep bench",
+        max_player_price=35,
+    ),
+    StrategySpec(
+        "zero-rb", "Zero RB", "Punt RB early, load WR/TE",
+        bounds={
+            "RB": PositionBounds(2, 7, 0.0, 0.10),
+            "WR": PositionBounds(2, 7, 0.45, 1.0),
+            "TE": PositionBounds(1, 2, 0.08, 1.0),
+        },
+    ),
+    StrategySpec(
+        "hero-rb", "Hero RB", "One elite RB + depth everywhere",
+        bounds={
+            "RB": PositionBounds(2, 6, 0.25, 0.35, min_elite=1, max_elite=1),
+            "WR": PositionBounds(2, 7, 0.30, 1.0),
+        },
+        elite_price=ELITE_PRICE, min_elite=1, max_elite=1,  # The hero is the only star
+    ),
+    StrategySpec(
+        "late-qb", "Late QB", "Minimum QB spend, max skill positions",
+        bounds={"QB": PositionBounds(1, 1, 0.0, 0.02)},
+    ),
+]
+
+
+@dataclass
+class PositionFrontier:
+    position: str
+    players: List[AuctionPlayer]
+    # best[e][k][c]: weighted points, exactly k players (e of them elite) costing exactly $c.
+    # Without an elite price e is always 0.
+    best: List[List[List[float]]]
+    picks: List[List[List[Tuple[int, ...]]]]  # Indices into players for each best[e][k][c]
+
+    @property
+    def max_count(self) -> int:
+        return len(self.best[0]) - 1
+
+
+@dataclass
+class ScenarioResult:
+    key: str
+    name: str
+    description: str
+    feasible: bool
+    players: List[AuctionPlayer] = field(default_factory=list)
+    total_cost: int = 0
+    projected_points: float = 0.0
+    weighted_points: float = 0.0
+
+    def spend_by_position(self) -> Dict[str, int]:
+        spend = {position: 0 for position in POSITIONS}
+        for player in self.players:
+            spend[player.position] += player.auction_value
+        return spend
+
+
+def slot_weights(position: str, max_count: int, have: int = 0) -> List[float]:
+    """
+    Points weight for the 1st, 2nd, ... best player added at a position. The
+    `have` players already rostered there hold the top of the depth chart.
+    """
+    starters = ROSTER_SLOTS.get(position, 0)
+    weights = []
+    for depth in range(have, have + max_count):
+        if depth < starters:
+            weights.append(1.0)
+        elif depth == starters and position in FLEX_POSITIONS:
+            weights.append(FLEX_WEIGHT)
+        else:
+            weights.append(BENCH_WEIGHT)
+    return weights
+
+
+def build_position_frontier(players: List[AuctionPlayer], position: str, max_count: int,
+                            budget: int, max_price: Optional[int] = None, have: int = 0,
+                            elite_price: Optional[int] = None, elite_cap: int = 0) -> PositionFrontier:
+    """
+    0/1 knapsack over one position, players visited best projection first.
+    With an elite price, rosters are also split by how many players cost at
+    least that much, up to `elite_cap` of them.
+    """
+    pool = [p for p in players if max_price is None or p.auction_value <= max_price]
+    weights = slot_weights(position, max_count, have)
+    levels = min(elite_cap, max_count) + 1 if elite_price is not None else 1
+
+    best = [[[NEG_INF] * (budget + 1) for _ in range(max_count + 1)] for _ in range(levels)]
+    picks: List[List[List[Tuple[int, ...]]]] = [[[()] * (budget + 1) for _ in range(max_count + 1)]
+                                                for _ in range(levels)]
+    best[0][0][0] = 0.0
+
+    for i, player in enumerate(pool):
+        cost = player.auction_value
+        if cost > budget:
+            continue
+        elite = 1 if elite_price is not None and cost >= elite_price else 0
+        # Players arrive in projection order, so the k-th pick is the k-th best kept
+        for k in range(min(i + 1, max_count), 0, -1):
+            gain = weights[k - 1] * player.projected_points
+            for e in range(elite, levels):
+                prev_row, row = best[e - elite][k - 1], best[e][k]
+                prev_picks, row_picks = picks[e - elite][k - 1], picks[e][k]
+                for c in range(budget, cost - 1, -1):
+                    base = prev_row[c - cost]
+                    if base == NEG_INF:
+                        continue
+                    candidate = base + gain
+                    if candidate > row[c]:
+                        row[c] = candidate
+                        row_picks[c] = prev_picks[c - cost] + (i,)
+
+    return PositionFrontier(position, pool, best, picks)
+
+
+def build_frontiers(players: List[AuctionPlayer], strategies: List[StrategySpec],
+                    budget: int, filled: Dict[str, int]) -> Dict[Tuple, Dict[str, PositionFrontier]]:
+    """One frontier per position per distinct frontier key (price cap, elite rules) across the strategies"""
+    grouped = players_by_position(players)
+    frontiers: Dict[Tuple, Dict[str, PositionFrontier]] = {}
+
+    for spec in strategies:
+        key = spec.frontier_key()
+        if key in frontiers:
+            continue
+        frontiers[key] = {}
+        for position in POSITIONS:
+            max_count = max(other.bounds_for(position).max_count for other in strategies)
+            max_count = max(max_count - filled.get(position, 0), 0)
+            frontiers[key][position] = build_position_frontier(
+                grouped.get(position, []), position, max_count, budget, spec.max_player_price,
+                filled.get(position, 0), spec.elite_price, spec.elite_cap(position))
+
+    return frontiers
+
+
+def _pareto(entries: Dict[int, float]) -> List[Tuple[int, float]]:
+    """Keep (cost, value) pairs that no cheaper entry beats"""
+    front = []
+    best_value = NEG_INF
+    for cost in sorted(entries):
+        value = entries[cost]
+        if value > best_value:
+            front.append((cost, value))
+            best_value = value
+    return front
+
+
+def count_bounds(spec: StrategySpec, position: str, filled: Dict[str, int],
+                 frontier: PositionFrontier) -> Tuple[int, int]:
+    """Players still to add at a position under a strategy, given those already rostered"""
+    bounds = spec.bounds_for(position)
+    have = filled.get(position, 0)
+    lo_count = max(bounds.min_count - have, 0)
+    hi_count = min(max(bounds.max_count - have, 0), frontier.max_count)
+    return lo_count, hi_count
+
+
+def elite_counts(spec: StrategySpec, roster: List[AuctionPlayer]) -> Dict[str, int]:
+    """Elite players already rostered, per position"""
+    counts = {position: 0 for position in POSITIONS}
+    if spec.elite_price is not None:
+        for player in roster:
+            if player.auction_value >= spec.elite_price:
+                counts[player.position] += 1
+    return counts
+
+
+def merge_position(states: Dict[Tuple[int, int], List[Tuple[int, float]]], frontier: PositionFrontier,
+                   spec: StrategySpec, budget: int, open_slots: int, filled: Dict[str, int],
+                   complete: bool = False, owned_elite: Optional[Dict[str, int]] = None):
+    """
+    Extend partial rosters with one position's frontier
+
+    states[(n, e)] is a Pareto list of (spend, value) for n players placed so
+    far, e of them elite. Returns the merged states and back pointers
+    (n, e, spend) -> (prev n, prev e, prev spend, k, elite added, cost).
+    """
+    owned_elite = owned_elite or {}
+    bounds = spec.bounds_for(frontier.position)
+    lo_count, hi_count = count_bounds(spec, frontier.position, filled, frontier)
+    lo_spend = math.ceil(bounds.min_share * budget)
+    hi_spend = min(math.floor(bounds.max_share * budget), budget)
+    have_elite = owned_elite.get(frontier.position, 0)
+    lo_elite = max(bounds.min_elite - have_elite, 0)
+    hi_elite = len(frontier.best) - 1
+    if bounds.max_elite is not None:
+        hi_elite = min(hi_elite, bounds.max_elite - have_elite)
+    roster_elite = sum(owned_elite.values())
+    max_elite = None if spec.max_elite is None else spec.max_elite - roster_elite
+
+    options = {}
+    for e in range(lo_elite, hi_elite + 1):
+        for k in range(lo_count, hi_count + 1):
+            row = frontier.best[e][k]
+            entries = {c: row[c] for c in range(lo_spend, hi_spend + 1) if row[c] != NEG_INF}
+            if entries:
+                options[(k, e)] = _pareto(entries)
+
+    merged: Dict[Tuple[int, int], Dict[int, float]] = {}
+    pointers: Dict[Tuple[int, int, int], Tuple[int, int, int, int, int, int]] = {}
+    for (n, elite), front in states.items():
+        for (k, e), choices in options.items():
+            total, total_elite = n + k, elite + e
+            if total > open_slots or (complete and total != open_slots):
+                continue
+            if max_elite is not None and total_elite > max_elite:
+                continue
+            if complete and total_elite < spec.min_elite - roster_elite:
+                continue
+            target = merged.setdefault((total, total_elite), {})
+            for spend, value in front:
+                for cost, gain in choices:
+                    new_spend = spend + cost
+                    if new_spend > budget:
+                        break
+                    candidate = value + gain
+                    if candidate > target.get(new_spend, NEG_INF):
+                        target[new_spend] = candidate
+                        pointers[(total, total_elite, new_spend)] = (n, elite, spend, k, e, cost)
+
+    return {key: _pareto(entries) for key, entries in merged.items() if entries}, pointers
+
+
+def solve_strategy(frontiers: Dict[str, PositionFrontier], spec: StrategySpec, budget: int,
+                   open_slots: int, filled: Dict[str, int],
+                   roster: Optional[List[AuctionPlayer]] = None) -> ScenarioResult:
+    """Merge the per-position frontiers under one strategy's bounds"""
+    owned_elite = elite_counts(spec, roster or [])
+    states: Dict[Tuple[int, int], List[Tuple[int, float]]] = {(0, 0): [(0, 0.0)]}
+    back_pointers = []
+
+    for step, position in enumerate(MERGE_ORDER):
+        complete = step == len(MERGE_ORDER) - 1
+        states, pointers = merge_position(states, frontiers[position], spec, budget,
+                                          open_slots, filled, complete, owned_elite)
+        back_pointers.append(pointers)
+
+    finals = [(entry, elite) for (n, elite), front in states.items() if n == open_slots for entry in front]
+    if not finals:
+        return ScenarioResult(spec.key, spec.name, spec.description, feasible=False)
+
+    (total_spend, weighted), elite = max(finals, key=lambda final: final[0][1])
+
+    chosen: List[AuctionPlayer] = []
+    n, spend = open_slots, total_spend
+    for position, pointers in zip(reversed(MERGE_ORDER), reversed(back_pointers)):
+        n, elite, spend, k, e, cost = pointers[(n, elite, spend)]
+        frontier = frontiers[position]
+        chosen.extend(frontier.players[i] for i in frontier.picks[e][k][cost])
+
+    chosen.sort(key=lambda p: (POSITIONS.index(p.position), -p.projected_points))
+    return ScenarioResult(
+        key=spec.key,
+        name=spec.name,
+        description=spec.description,
+        feasible=True,
+        players=chosen,
+        total_cost=sum(p.auction_value for p in chosen),
+        projected_points=round(sum(p.projected_points for p in chosen), 1),
+        weighted_points=round(weighted, 1),
+    )
+
+
+# Per-worker copy of the shared frontiers, installed once by the pool initializer
+_worker_frontiers: Dict[Tuple, Dict[str, PositionFrontier]] = {}
+
+
+def _init_worker(frontiers: Dict[Tuple, Dict[str, PositionFrontier]]):
+    global _worker_frontiers
+    _worker_frontiers = frontiers
+
+
+def _solve_in_worker(job: Tuple[StrategySpec, int, int, Dict[str, int], List[AuctionPlayer]]) -> ScenarioResult:
+    spec, budget, open_slots, filled, roster = job
+    return solve_strategy(_worker_frontiers[spec.frontier_key()], spec, budget, open_slots, filled, roster)
+
+
+class ScenarioEngine:
+    def __init__(self, players: List[AuctionPlayer], budget: int = DEFAULT_BUDGET,
+                 filled: Optional[Dict[str, int]] = None, open_slots: Optional[int] = None,
+                 strategies: Optional[List[StrategySpec]] = None, roster: Optional[List[AuctionPlayer]] = None):
+        """`roster` is who is already bought; it counts toward the strategies' elite bounds"""
+        self.players = players
+        self.budget = budget
+        self.filled = filled or {}
+        self.roster = list(roster or [])
+        self.open_slots = open_slots if open_slots is not None else roster_size() - sum(self.filled.values())
+        self.strategies = strategies or STRATEGIES
+        self.frontiers = build_frontiers(players, self.strategies, budget, self.filled)
+
+    def solve(self, spec: StrategySpec) -> ScenarioResult:
+        """Solve one strategy in-process against the shared frontiers"""
+        if spec.frontier_key() not in self.frontiers:
+            self.frontiers.update(build_frontiers(self.players, [spec], self.budget, self.filled))
+        return solve_strategy(self.frontiers[spec.frontier_key()], spec,
+                              self.budget, self.open_slots, self.filled, self.roster)
+
+    def solve_all(self, workers: Optional[int] = None) -> List[ScenarioResult]:
+        """Solve every strategy concurrently; workers receive the frontiers once"""
+        jobs = [(spec, self.budget, self.open_slots, self.filled, self.roster) for spec in self.strategies]
+        if workers == 1:
+            return [self.solve(spec) for spec in self.strategies]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.frontiers,)) as pool:
+            return list(pool.map(_solve_in_worker, jobs))
+
+
+def print_scenarios(results: List[ScenarioResult]):
+    for result in sorted(results, key=lambda r: -r.weighted_points):
+        if not result.feasible:
+            print(f"\n❌ {result.name}: no roster satisfies the constraints")
+            continue
+
+        spend = result.spend_by_position()
+        print(f"\n🏈 {result.name} ({result.weighted_points} weighted pts, ${result.total_cost})")
+        print(f"   {result.description}")
+        print("   Spend: " + ", ".join(f"{pos} ${spend[pos]}" for pos in POSITIONS))
+        for player in result.players:
+            print(f"   - {player.position:<3} {player.name:<24} ${player.auction_value:<3} "
+                  f"{player.projected_points} pts (Tier {player.tier})")
+
+
+def main():
+    players = load_players()
+    engine = ScenarioEngine(players)
+
+    print("🎯 Solving roster scenarios")
+    print("=" * 50)
+    print(f"📊 Players: {len(players)} | Budget: ${engine.budget} | Open slots: {engine.open_slots}")
+
+    print_scenarios(engine.solve_all())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Rotowire News Prefetcher
+Fetches the latest news block for the top-N players ahead of time so the
+app's /api/scrape-news route answers from a local JSON store with one lookup
+instead of fetching and parsing a player page per request.
+
+- Rotowire_URLs.csv is loaded once into an id -> URL index
+- Players are ordered by the universe rank (entity_resolution.py)
+- Pages are fetched concurrently with conditional requests (ETag /
+  Last-Modified from the previous store), so unchanged pages cost a 304
+- The news block is extracted in one streaming pass with a fixed set of
+  class selectors, matching src/lib/rotowire-scraper.ts field for field
+
+Usage:
+    python3 rotowire_news_prefetch.py [--top 100] [--workers 8] [--store rotowire_news.json]
+"""
+
+import argparse
+import csv
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from auction_players import DEFAULT_PLAYERS_CSV, load_auction_players
+from entity_resolution import ROTOWIRE_CSV, EntityResolver
+
+DEFAULT_STORE = "rotowire_news.json"
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+
+NEWS_CONTAINER_CLASS = "p-card__recent-news-block"
+NEWS_BLOCK_CLASS = "news-update"
+# Element class -> output field (same names as PlayerNewsData in rotowire-scraper.ts)
+FIELD_CLASSES = {
+    "news-update__headline": "headline",
+    "news-update__meta": "meta",
+    "news-update__timestamp": "timestamp",
+    "news-update__news": "news",
+    "news-update__analysis": "analysis",
+}
+LOGO_CLASS = "news-update__logo"
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+
+
+class NewsBlockParser(HTMLParser):
+    """Collects the first `.p-card__recent-news-block .news-update` in one pass"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack: List[Tuple[str, Tuple[str, ...]]] = []
+        self.in_container = 0
+        self.block_depth: Optional[int] = None
+        self.done = False
+        self.parts: Dict[str, List[str]] = {}
+        self.team_logo = ""
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        attributes = dict(attrs)
+        classes = tuple((attributes.get('class') or '').split())
+
+        if self.block_depth is not None and tag == 'img' and LOGO_CLASS in classes and not self.team_logo:
+            self.team_logo = attributes.get('src') or ''
+        if tag in VOID_TAGS:
+            return
+
+        self.stack.append((tag, classes))
+        if NEWS_CONTAINER_CLASS in classes:
+            self.in_container += 1
+        if self.in_container and self.block_depth is None and NEWS_BLOCK_CLASS in classes:
+            self.block_depth = len(self.stack)
+
+    def handle_endtag(self, tag):
+        if self.done or tag in VOID_TAGS:
+            return
+        # Pop to the matching open tag; tolerates unclosed children
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i][0] == tag:
+                for _, classes in self.stack[i:]:
+                    if NEWS_CONTAINER_CLASS in classes:
+                        self.in_container -= 1
+                del self.stack[i:]
+                break
+        if self.block_depth is not None and len(self.stack) < self.block_depth:
+            self.done = True
+
+    def handle_data(self, data):
+        if self.done or self.block_depth is None:
+            return
+        for _, classes in reversed(self.stack):
+            field = next((FIELD_CLASSES[c] for c in classes if c in FIELD_CLASSES), None)
+            if field:
+                self.parts.setdefault(field, []).append(data)
+                return
+
+    def result(self) -> Optional[Dict[str, Optional[str]]]:
+        if self.block_depth is None:
+            return None
+        text = {field: " ".join("".join(chunks).split()) for field, chunks in self.parts.items()}
+        meta = text.get('meta', '')
+        position = meta.split()[0] if meta and meta.split()[0].isupper() else ''
+        analysis = text.get('analysis')
+        if analysis is not None and analysis.startswith('ANALYSIS'):
+            analysis = analysis[len('ANALYSIS'):].strip()
+        return {
+            'headline': text.get('headline', ''),
+            'teamLogo': self.team_logo,
+            'team': meta[len(position):].strip(),
+            'position': position,
+            'timestamp': text.get('timestamp', ''),
+            'news': text.get('news', ''),
+            'analysis': analysis,
+        }
+
+
+def parse_news(html: str) -> Optional[Dict[str, Optional[str]]]:
+    parser = NewsBlockParser()
+    parser.feed(html)
+    return parser.result()
+
+
+def load_url_index(csv_path: str = ROTOWIRE_CSV) -> Dict[str, str]:
+    """Rotowire player id -> page URL"""
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        return {row['id'].strip(): row['rotowire_url'].strip() for row in csv.DictReader(csvfile) if row.get('id')}
+
+
+def prefetch_order(url_index: Dict[str, str], players_csv: str = DEFAULT_PLAYERS_CSV) -> List[Tuple[str, str, str]]:
+    """(rotowire id, name, url) ordered by universe rank; unranked ids go last"""
+    resolver = EntityResolver(load_auction_players(players_csv))
+    resolver.add_rotowire()
+    ranked = sorted((r for r in resolver.report.players if r.rotowire_id in url_index),
+                    key=lambda r: r.player.rank)
+    order = [(r.rotowire_id, r.player.name, url_index[r.rotowire_id]) for r in ranked]
+    seen = {rotowire_id for rotowire_id, _, _ in order}
+    order.extend((rotowire_id, "", url) for rotowire_id, url in url_index.items() if rotowire_id not in seen)
+    return order
+
+
+def load_store(path: str) -> Dict:
+    if not os.path.exists(path):
+        return {'players': {}}
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def write_store(store: Dict, path: str):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as handle:
+        json.dump(store, handle, separators=(',', ':'), ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+class NewsPrefetcher:
+    def __init__(self, store: Dict, workers: int = 8, timeout: float = 10.0):
+        self.store = store
+        self.workers = workers
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        # One session per worker thread keeps connections alive without sharing a Session
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+            self._local.session.headers.update({'User-Agent': USER_AGENT})
+        return self._local.session
+
+    def fetch(self, rotowire_id: str, name: str, url: str) -> Tuple[str, str, Optional[Dict]]:
+        """(rotowire id, status, new entry or None to keep the old one)"""
+        previous = self.store['players'].get(rotowire_id, {})
+        headers = {}
+        if previous.get('etag'):
+            headers['If-None-Match'] = previous['etag']
+        if previous.get('lastModified'):
+            headers['If-Modified-Since'] = previous['lastModified']
+
+        try:
+            response = self._session().get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as error:
+            return rotowire_id, f"error: {error}", None
+        if response.status_code == 304:
+            return rotowire_id, "not modified", dict(previous, fetchedAt=time.time())
+        if response.status_code != 200:
+            return rotowire_id, f"HTTP {response.status_code}", None
+
+        return rotowire_id, "fetched", {
+            'name': name,
+            'url': url,
+            'etag': response.headers.get('ETag', ''),
+            'lastModified': response.headers.get('Last-Modified', ''),
+            'fetchedAt': time.time(),
+            'news': parse_news(response.text),
+        }
+
+    def run(self, targets: List[Tuple[str, str, str]]) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(self.fetch, *target) for target in targets]
+            for future in as_completed(futures):
+                rotowire_id, status, entry = future.result()
+                if entry is not None:
+                    self.store['players'][rotowire_id] = entry
+                key = status if not status.startswith(("error", "HTTP")) else "failed"
+                counts[key] = counts.get(key, 0) + 1
+        self.store['generatedAt'] = time.time()
+        return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefetch Rotowire news into a JSON store")
+    parser.add_argument('--top', type=int, default=100, help="Players to fetch, by universe rank")
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--store', default=DEFAULT_STORE)
+    args = parser.parse_args()
+
+    url_index = load_url_index()
+    targets = prefetch_order(url_index)[:args.top]
+
+    print("📰 Rotowire News Prefetch")
+    print("=" * 50)
+    print(f"🔗 {len(url_index)} Rotowire URLs indexed, fetching {len(targets)} with {args.workers} workers")
+
+    started = time.perf_counter()
+    store = load_store(args.store)
+    counts = NewsPrefetcher(store, args.workers).run(targets)
+    write_store(store, args.store)
+
+    elapsed = time.perf_counter() - started
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+    print(f"✅ {summary} in {elapsed:.1f}s")
+    print(f"💾 {len(store['players'])} players in {args.store}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Priority/Deadline Scrape Scheduler
+Refreshes player stats in order of draft importance instead of list order, so
+a short window before the draft is spent on the players that matter most.
+
+Each player gets a priority score:
+
+    importance = 1 / sqrt(rank) + TIER_BONUS[tier]
+    urgency    = min(hours since last refresh / STALE_AFTER_HOURS, 1) + injury boost
+    priority   = importance * (FRESH_FLOOR + urgency)
+
+Players missing an ESPN ID are looked up by name and position first
+(resolve_espn_ids), so they are scheduled rather than skipped.
+
+Fetches are dispatched strictly highest-priority first from a heap. A new
+fetch only starts while the request budget lasts and the latency estimate
+says it can finish before the wall-clock deadline. The estimate starts at
+INITIAL_LATENCY, follows completed fetches, and is raised to the age of the
+slowest fetch still in flight, so a stalled request holds new ones back
+before it completes. Waiting on in-flight fetches never runs past the
+deadline either; any still running then are abandoned and reported as
+missed. Whatever was not reached is reported as left stale, in priority
+order.
+
+Usage:
+    python3 scrape_scheduler.py --deadline 90 --budget 150 [--workers 4] [--dry-run]
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from auction_players import AuctionPlayer
+from entity_resolution import EntityResolver, espn_athlete_ids
+from player_snapshot import load_players
+
+DEFAULT_STATE = "scrape_state.json"
+NEWS_STORE = "rotowire_news.json"
+
+STALE_AFTER_HOURS = 24.0
+ID_LOOKUP_HOURS = 24.0  # How long a failed ESPN ID lookup is trusted before trying again
+INITIAL_LATENCY = 1.0  # Seconds per fetch assumed until the first one completes
+FRESH_FLOOR = 0.1  # Just-refreshed players keep a sliver of priority
+INJURY_BOOST = 1.0
+TIER_BONUS = {1: 0.6, 2: 0.3, 3: 0.1, 4: 0.0}
+INJURY_PATTERN = re.compile(
+    r"\b(injur\w*|questionable|doubtful|ruled out|injured reserve|IR|hamstring|ankle|knee|concussion)\b",
+    re.IGNORECASE)
+
+
+@dataclass
+class ScheduledFetch:
+    player: AuctionPlayer
+    priority: float
+    hours_stale: Optional[float]  # None: never fetched
+    injured: bool
+
+
+@dataclass
+class ScheduleReport:
+    refreshed: List[ScheduledFetch] = field(default_factory=list)
+    failed: List[ScheduledFetch] = field(default_factory=list)
+    missed: List[ScheduledFetch] = field(default_factory=list)  # Still in flight at the deadline
+    left_stale: List[ScheduledFetch] = field(default_factory=list)
+    no_id: List[AuctionPlayer] = field(default_factory=list)
+    requests_used: int = 0
+    elapsed: float = 0.0
+    latency: float = INITIAL_LATENCY  # Final per-fetch estimate
+    stop_reason: str = "all refreshed"
+
+
+def importance(player: AuctionPlayer) -> float:
+    """How much a player's data matters to the draft, from rank and tier"""
+    return 1 / math.sqrt(max(player.rank, 1)) + TIER_BONUS.get(player.tier, 0.0)
+
+
+def priority_score(player: AuctionPlayer, hours_stale: Optional[float], injured: bool) -> float:
+    staleness = 1.0 if hours_stale is None else min(hours_stale / STALE_AFTER_HOURS, 1.0)
+    urgency = staleness + (INJURY_BOOST if injured else 0.0)
+    return importance(player) * (FRESH_FLOOR + urgency)
+
+
+def load_state(path: str = DEFAULT_STATE) -> Dict[str, Dict]:
+    """Player name -> {'fetched_at': epoch seconds, 'stats': {...}, 'espn_id': looked-up ID, ...}"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def save_state(state: Dict[str, Dict], path: str = DEFAULT_STATE):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as handle:
+        json.dump(state, handle, separators=(',', ':'))
+    os.replace(temp_path, path)
+
+
+def resolve_espn_ids(players: List[AuctionPlayer], state: Dict[str, Dict],
+                     athletes: Optional[Callable[[], Iterable[Dict]]] = None,
+                     now: Optional[float] = None) -> List[AuctionPlayer]:
+    """
+    Fill in missing ESPN IDs: first from earlier lookups remembered in `state`,
+    then, if any are still missing and were not looked up in the last
+    ID_LOOKUP_HOURS, by name and position from one pass over `athletes()`
+    (ESPN's athlete list). Results are remembered in `state` either way.
+    """
+    now = time.time() if now is None else now
+    players = [player if player.espn_id else replace(player, espn_id=state.get(player.name, {}).get('espn_id', ''))
+               for player in players]
+    looked_up = {name: entry['espn_lookup_at'] for name, entry in state.items() if 'espn_lookup_at' in entry}
+    missing = [player for player in players if not player.espn_id
+               and now - looked_up.get(player.name, -math.inf) > ID_LOOKUP_HOURS * 3600]
+    if not missing or athletes is None:
+        return players
+
+    found = espn_athlete_ids(missing, athletes())
+    for player in missing:
+        entry = state.setdefault(player.name, {})
+        entry['espn_lookup_at'] = now
+        if player.name in found:
+            entry['espn_id'] = found[player.name]
+    return [replace(player, espn_id=found[player.name]) if player.name in found else player for player in players]
+
+
+def injured_players(players: List[AuctionPlayer], news_store: str = NEWS_STORE) -> Set[str]:
+    """Names whose prefetched Rotowire news mentions an injury"""
+    if not os.path.exists(news_store):
+        return set()
+    with open(news_store, encoding='utf-8') as handle:
+        news_by_id = json.load(handle).get('players', {})
+
+    resolver = EntityResolver(players)
+    resolver.add_rotowire()
+    injured = set()
+    for resolved in resolver.report.players:
+        news = (news_by_id.get(resolved.rotowire_id) or {}).get('news') or {}
+        text = " ".join(filter(None, (news.get('headline'), news.get('news'))))
+        if text and INJURY_PATTERN.search(text):
+            injured.add(resolved.player.name)
+    return injured
+
+
+class ScrapeScheduler:
+    def __init__(self, players: List[AuctionPlayer], state: Dict[str, Dict],
+                 injured: Optional[Set[str]] = None, now: Optional[float] = None):
+        self.state = state
+        self.now = now if now is not None else time.time()
+        self.injured = injured or set()
+        self.no_id: List[AuctionPlayer] = []
+        self.heap: List = []
+
+        for player in players:
+            if not player.espn_id:
+                self.no_id.append(player)
+                continue
+            fetched_at = state.get(player.name, {}).get('fetched_at')
+            hours_stale = None if fetched_at is None else (self.now - fetched_at) / 3600
+            injured_flag = player.name in self.injured
+            item = ScheduledFetch(player, priority_score(player, hours_stale, injured_flag), hours_stale, injured_flag)
+            heapq.heappush(self.heap, (-item.priority, player.rank, id(item), item))
+
+    def plan(self) -> List[ScheduledFetch]:
+        """Every fetchable player in dispatch order (does not consume the heap)"""
+        return [entry[-1] for entry in sorted(self.heap)]
+
+    def run(self, fetch: Callable[[str], Optional[Dict]], deadline: float, request_budget: int,
+            workers: int = 4, latency: float = INITIAL_LATENCY) -> ScheduleReport:
+        """
+        Refresh players highest priority first until the budget, the deadline or
+        the heap runs out. `fetch(espn_id)` costs one request and returns stats
+        or None; it is called from `workers` threads at once. `latency` seeds
+        the seconds-per-fetch estimate.
+        """
+        report = ScheduleReport(no_id=list(self.no_id))
+        started = time.monotonic()
+        stop_at = started + deadline
+        stopped: Optional[str] = None
+
+        def timed_fetch(item: ScheduledFetch):
+            fetch_started = time.monotonic()
+            stats = fetch(item.player.espn_id)
+            return item, stats, time.monotonic() - fetch_started
+
+        in_flight: Dict = {}  # Future -> (item, monotonic start)
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            while True:
+                while stopped is None and self.heap and len(in_flight) < workers:
+                    now = time.monotonic()
+                    # A fetch running longer than the estimate means the estimate is already too low
+                    expected = max([latency] + [now - since for _, since in in_flight.values()])
+                    if report.requests_used >= request_budget:
+                        stopped = "request budget spent"
+                    elif now + expected > stop_at:
+                        stopped = "deadline"
+                    else:
+                        item = heapq.heappop(self.heap)[-1]
+                        report.requests_used += 1
+                        in_flight[pool.submit(timed_fetch, item)] = (item, now)
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, timeout=max(stop_at - time.monotonic(), 0.0), return_when=FIRST_COMPLETED)
+                if not done:
+                    # Past the deadline: abandon what is still running rather than wait for it
+                    report.missed = [item for item, _ in in_flight.values()]
+                    stopped = "deadline"
+                    break
+                for future in done:
+                    del in_flight[future]
+                    item, stats, took = future.result()
+                    latency = 0.7 * latency + 0.3 * took
+                    if stats is None:
+                        report.failed.append(item)
+                        continue
+                    # Update in place so remembered ESPN IDs survive the refresh
+                    self.state.setdefault(item.player.name, {}).update(fetched_at=time.time(), stats=stats)
+                    report.refreshed.append(item)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        report.latency = latency
+        report.stop_reason = stopped or report.stop_reason
+        report.left_stale = [entry[-1] for entry in sorted(self.heap)]
+        report.elapsed = time.monotonic() - started
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh player stats by draft priority within a deadline")
+    parser.add_argument('--deadline', type=float, default=90.0, help="Wall-clock seconds available")
+    parser.add_argument('--budget', type=int, default=150, help="Maximum ESPN requests")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--state', default=DEFAULT_STATE)
+    parser.add_argument('--dry-run', action='store_true', help="Show the dispatch order without fetching")
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    athletes = None
+    if not args.dry_run:
+        from espn_player_scraper import ESPNPlayerScraper
+
+        def athletes():
+            return ESPNPlayerScraper().iter_athletes(page_size=1000)  # A few requests for the whole league
+
+    print("⏰ Priority Scrape Scheduler")
+    print("=" * 50)
+    state = load_state(args.state)
+    snapshot = load_players()
+    players = resolve_espn_ids(snapshot, state, athletes)
+    looked_up = sum(1 for before, after in zip(snapshot, players) if after.espn_id and not before.espn_id)
+    scheduler = ScrapeScheduler(players, state, injured_players(players))
+    print(f"📊 {len(scheduler.heap)} fetchable players ({looked_up} IDs found by name lookup), "
+          f"{len(scheduler.no_id)} still without ESPN IDs")
+
+    if args.dry_run:
+        for item in scheduler.plan()[:args.budget]:
+            stale = "never" if item.hours_stale is None else f"{item.hours_stale:.1f}h"
+            print(f"   {item.priority:6.3f} #{item.player.rank:<3} {item.player.name:<24} "
+                  f"stale {stale}{' 🚑' if item.injured else ''}")
+        return
+
+    from top_200_fantasy_scraper import Top200FantasyScraper
+
+    local = threading.local()
+
+    def fetch(espn_id: str) -> Optional[Dict]:
+        # One scraper, and so one requests.Session, per worker thread; Sessions are not thread-safe
+        if not hasattr(local, 'scraper'):
+            local.scraper = Top200FantasyScraper()
+        return local.scraper.get_player_stats(espn_id) or None
+
+    # The ID lookup spends part of the wall-clock window
+    report = scheduler.run(fetch, args.deadline - (time.monotonic() - started), args.budget, args.workers)
+    save_state(state, args.state)
+
+    print(f"✅ Refreshed {len(report.refreshed)} in {report.elapsed:.1f}s "
+          f"({report.requests_used} requests, {report.latency:.2f}s per fetch, stopped: {report.stop_reason})")
+    if report.failed:
+        print(f"❌ Failed: {', '.join(i.player.name for i in report.failed)}")
+    if report.missed:
+        print(f"⌛ Still running at the deadline: {', '.join(i.player.name for i in report.missed)}")
+    if report.left_stale:
+        print(f"⚠️  Left stale ({len(report.left_stale)}), highest priority first:")
+        for item in report.left_stale[:20]:
+            print(f"   #{item.player.rank:<3} {item.player.name:<24} priority {item.priority:.3f}")
+
+
+if __name__ == "__main__":
+    main()
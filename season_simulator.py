@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Season Outcome Simulator
+Turns `projected_fpts_2025` point estimates into season outcome
+distributions, so a safe roster can be told apart from a volatile one with
+the same projection.
+
+Per player and week, in NumPy arrays of shape (seasons, weeks, players):
+- points ~ Gamma with mean projection / SEASON_WEEKS and a coefficient of
+  variation from game logs (game_logs.csv: name, position, week,
+  fantasy_points), shrunk toward the position default, or the position
+  default alone when there are no logs
+- one injury spell per season: weekly onset hazard by position, geometric
+  length
+- a bye week per team, shared by its players, from BYE_WEEKS, or drawn
+  uniformly from weeks 5-14 for a team missing from the schedule
+
+Each week's optimal lineup (QB, 2 RB, 2 WR, TE, FLEX, K, DEF) is taken with
+one partition per position across every team, week and season at once.
+
+Each scenario's roster is bought in simulated 12-team auctions
+(auction_simulator.py): our team bids the scenario's StrategySpec and the
+other 11 are value bidders, so our roster pays the same inflated, noisy
+prices as the field it plays. Batches of seasons rotate through FIELD_DRAFTS
+auctions. The report gives median, floor/ceiling percentiles, average finish
+and the chance of finishing top-N. Every scenario shares one set of draws, so
+they are compared on the same seasons.
+
+Usage:
+    python3 season_simulator.py [--sims 2000] [--top 4] [--fields 8] [--seed 7]
+"""
+
+import argparse
+import csv
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from auction_players import BYE_WEEKS, FLEX_POSITIONS, POSITIONS, ROSTER_SLOTS, TEAMS_PER_LEAGUE, AuctionPlayer
+from entity_resolution import player_key
+
+GAME_LOGS_CSV = "game_logs.csv"
+SEASON_WEEKS = 17
+BYE_WEEK_RANGE = (5, 14)
+CHUNK_SEASONS = 1000  # Seasons simulated per batch, bounding memory to tens of MB
+FIELD_DRAFTS = 8  # Simulated auctions per scenario; batches of seasons rotate through their leagues
+DEFAULT_SIMS = 2000
+
+# Weekly standard deviation / mean when a player has no game logs
+POSITION_CV = {"QB": 0.40, "RB": 0.60, "WR": 0.65, "TE": 0.70, "K": 0.45, "DEF": 0.70}
+# Weekly chance an injury spell starts, and its mean length in weeks
+INJURY_HAZARD = {"QB": 0.030, "RB": 0.055, "WR": 0.040, "TE": 0.040, "K": 0.005, "DEF": 0.0}
+INJURY_WEEKS = 2.5
+PRIOR_WEEKS = 6  # Game-log weeks it takes to count as much as the position default
+
+
+@dataclass
+class OutcomeSummary:
+    name: str
+    players: int  # Average roster size across the auctions
+    projected: float  # Average projected starting-lineup points of the bought rosters
+    mean: float
+    median: float
+    floor: float    # 10th percentile season
+    ceiling: float  # 90th percentile season
+    mean_finish: float  # Average place in the 12-team league, 1 is best
+    top_n: int
+    top_n_probability: float
+
+
+def load_game_log_cv(csv_path: str = GAME_LOGS_CSV) -> Dict[str, float]:
+    """player_key -> weekly CV from logged games, shrunk toward the position default"""
+    if not os.path.exists(csv_path):
+        return {}
+    weeks: Dict[str, List[float]] = {}
+    positions: Dict[str, str] = {}
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        for row in csv.DictReader(csvfile):
+            key = player_key(row['name'], row['position'])
+            weeks.setdefault(key, []).append(float(row['fantasy_points']))
+            positions[key] = row['position']
+
+    cv = {}
+    for key, points in weeks.items():
+        logged = np.array(points)
+        default = POSITION_CV.get(positions[key], 0.6)
+        if len(logged) < 2 or logged.mean() <= 0:
+            continue
+        observed = float(logged.std(ddof=1) / logged.mean())
+        cv[key] = (len(logged) * observed + PRIOR_WEEKS * default) / (len(logged) + PRIOR_WEEKS)
+    return cv
+
+
+def auction_league(players: List[AuctionPlayer], strategy: Optional[str] = None,
+                   seed: int = 0) -> Tuple[List[List[AuctionPlayer]], float]:
+    """
+    Every roster from one simulated auction (auction_simulator.simulate_draft),
+    ours first, plus our projected starting-lineup points. Our team bids the
+    `strategy` StrategySpec; the rest value players around auction_value with
+    per-draft market noise and per-team price noise, so each seed drafts a
+    different, realistically priced league.
+    """
+    from auction_simulator import SimulationConfig, simulate_draft
+
+    result = simulate_draft(players, SimulationConfig(strategy=strategy), seed)
+    return [[players[index] for index in roster] for roster in result.rosters], result.lineup_points[0]
+
+
+def waiver_players(players: List[AuctionPlayer]) -> Dict[str, AuctionPlayer]:
+    """Per position, a free agent at the universe's lowest projection, for starting slots a draft left empty"""
+    waivers = {}
+    for position in POSITIONS:
+        points = [player.projected_points for player in players if player.position == position]
+        if points:
+            waivers[position] = AuctionPlayer(0, f"Waiver {position}", position, "FA", 0, 0, min(points))
+    return waivers
+
+
+def fill_starters(roster: List[AuctionPlayer], waivers: Dict[str, AuctionPlayer]) -> List[AuctionPlayer]:
+    """The roster plus a waiver player for each starting slot (FLEX included) it cannot fill"""
+    filled = list(roster)
+    flex_spare = 0
+    for position in POSITIONS:
+        have = sum(player.position == position for player in roster)
+        if position in FLEX_POSITIONS:
+            flex_spare += max(have - ROSTER_SLOTS[position], 0)
+        if position in waivers:
+            filled.extend([waivers[position]] * max(ROSTER_SLOTS[position] - have, 0))
+    flex = [waivers[position] for position in FLEX_POSITIONS if position in waivers]
+    if flex and flex_spare < ROSTER_SLOTS["FLEX"]:
+        best = max(flex, key=lambda player: player.projected_points)
+        filled.extend([best] * (ROSTER_SLOTS["FLEX"] - flex_spare))
+    return filled
+
+
+def lineup_plan(teams: List[np.ndarray], positions: np.ndarray, pad: int) -> List[tuple]:
+    """
+    Per position: a (teams, depth) matrix of each team's player columns, padded
+    with the all-zero column `pad`, plus its starter count and whether leftovers can FLEX
+    """
+    plan = []
+    for position in POSITIONS:
+        own = [team[positions[team] == position] for team in teams]
+        depth = max(len(columns) for columns in own)
+        if not depth:
+            continue
+        index = np.full((len(teams), depth), pad)
+        for row, columns in enumerate(own):
+            index[row, :len(columns)] = columns
+        plan.append((index, ROSTER_SLOTS[position], position in FLEX_POSITIONS))
+    return plan
+
+
+def lineup_totals(weekly: np.ndarray, plan: List[tuple], teams: int) -> np.ndarray:
+    """
+    Season points per simulation for every team at once, shape (seasons, teams),
+    from each week's optimal lineup. A partition along the depth axis splits each
+    position into its starters and its best leftover, the FLEX candidate.
+    """
+    seasons, weeks, count = weekly.shape
+    # Player-major (players + zero pad, seasons * weeks) so gathering a team's players is row indexing
+    flat = np.concatenate([weekly.reshape(seasons * weeks, count).T,
+                           np.zeros((1, seasons * weeks), dtype=weekly.dtype)])
+    lineup = np.zeros((teams, seasons * weeks), dtype=weekly.dtype)
+    flex_candidates = []
+    for index, starters, flex in plan:
+        block = flat[index]  # (teams, depth, seasons * weeks)
+        depth = index.shape[1]
+        if depth <= starters:
+            lineup += block.sum(axis=1)
+            continue
+        split = depth - starters - 1
+        block = np.partition(block, split, axis=1)
+        lineup += block[:, split + 1:].sum(axis=1)
+        if flex:
+            flex_candidates.append(block[:, split])
+    if flex_candidates:
+        lineup += np.max(np.stack(flex_candidates), axis=0) * ROSTER_SLOTS["FLEX"]
+    return lineup.reshape(teams, seasons, weeks).sum(axis=2).T
+
+
+class SeasonSimulator:
+    def __init__(self, players: List[AuctionPlayer], game_log_cv: Optional[Dict[str, float]] = None,
+                 bye_weeks: Optional[Dict[str, int]] = None, seed: int = 0):
+        game_log_cv = load_game_log_cv() if game_log_cv is None else game_log_cv
+        self.waivers = waiver_players(players)
+        self.draftable = players
+        players = players + list(self.waivers.values())
+        self.players = players
+        self.column = {player.name: i for i, player in enumerate(players)}
+        self.positions = np.array([player.position for player in players])
+        self.bye_weeks = BYE_WEEKS if bye_weeks is None else bye_weeks
+        self.seed = seed
+
+        self.weekly_mean = np.array([player.projected_points / SEASON_WEEKS for player in players])
+        self.cv = np.array([game_log_cv.get(player_key(player.name, player.position),
+                                            POSITION_CV.get(player.position, 0.6)) for player in players])
+        self.hazard = np.array([INJURY_HAZARD.get(player.position, 0.03) for player in players])
+        teams = sorted({player.team for player in players})
+        self.team_index = np.array([teams.index(player.team) for player in players])
+        self.team_bye = np.array([self.bye_weeks.get(team, 0) for team in teams])
+
+    def weekly_points(self, seasons: int, rng: np.random.Generator) -> np.ndarray:
+        """(seasons, weeks, players) fantasy points with injuries and byes zeroed"""
+        shape = (1.0 / self.cv ** 2).astype(np.float32)
+        scale = (self.weekly_mean * self.cv ** 2).astype(np.float32)
+        points = rng.standard_gamma(shape, size=(seasons, SEASON_WEEKS, len(self.players)), dtype=np.float32) * scale
+
+        weeks = np.arange(1, SEASON_WEEKS + 1)[None, :, None]
+        onset = rng.geometric(np.maximum(self.hazard, 1e-9), size=(seasons, len(self.players)))[:, None, :]
+        length = rng.geometric(1 / INJURY_WEEKS, size=(seasons, len(self.players)))[:, None, :]
+        absent = (weeks >= onset) & (weeks < onset + length)
+
+        drawn_byes = rng.integers(BYE_WEEK_RANGE[0], BYE_WEEK_RANGE[1] + 1, size=(seasons, len(self.team_bye)))
+        byes = np.where(self.team_bye > 0, self.team_bye, drawn_byes)[:, self.team_index]
+        absent |= weeks == byes[:, None, :]
+
+        points[absent] = 0.0
+        return points
+
+    def _columns(self, roster: List[AuctionPlayer]) -> np.ndarray:
+        return np.array([self.column[player.name] for player in roster if player.name in self.column], dtype=int)
+
+    def evaluate(self, strategies: Dict[str, str], sims: int = DEFAULT_SIMS,
+                 top_n: int = 4, field_drafts: int = FIELD_DRAFTS) -> List[OutcomeSummary]:
+        """
+        Outcome distribution of each scenario (name -> StrategySpec key) over
+        leagues auctioned with our team bidding that strategy; batches of seasons
+        take turns playing each of the `field_drafts` auctions
+        """
+        rng = np.random.default_rng(self.seed)
+        leagues = {name: [auction_league(self.draftable, key, seed=self.seed + draft) for draft in range(field_drafts)]
+                   for name, key in strategies.items()}
+
+        # Per auction, every distinct roster (ours and the opponents) is scored once per batch
+        boards = []
+        for draft in range(field_drafts):
+            teams: List[np.ndarray] = []
+            slot: Dict[tuple, int] = {}
+
+            def team_slot(roster: List[AuctionPlayer]) -> int:
+                columns = self._columns(fill_starters(roster, self.waivers))
+                key = tuple(sorted(columns))
+                if key not in slot:
+                    slot[key] = len(teams)
+                    teams.append(columns)
+                return slot[key]
+
+            candidates = {name: team_slot(leagues[name][draft][0][0]) for name in strategies}
+            opponents = {name: np.array([team_slot(team) for team in leagues[name][draft][0][1:]])
+                         for name in strategies}
+            boards.append((lineup_plan(teams, self.positions, pad=len(self.players)), len(teams),
+                           candidates, opponents))
+        totals = {name: [] for name in strategies}
+        hits = {name: 0 for name in strategies}
+        finishes = {name: 0 for name in strategies}
+
+        done = 0
+        batch = min(CHUNK_SEASONS, -(-sims // field_drafts))  # Small enough that every field gets played
+        while done < sims:
+            seasons = min(batch, sims - done)
+            plan, team_count, candidates, opponents = boards[(done // batch) % field_drafts]
+            season_points = lineup_totals(self.weekly_points(seasons, rng), plan, team_count)
+            for name, team in candidates.items():
+                mine = season_points[:, team]
+                beaten_by = np.sum(season_points[:, opponents[name]] > mine[:, None], axis=1)
+                hits[name] += int(np.sum(beaten_by < top_n))
+                finishes[name] += int(np.sum(beaten_by)) + seasons
+                totals[name].append(mine)
+            done += seasons
+
+        summaries = []
+        for name, chunks in totals.items():
+            seasons_points = np.concatenate(chunks)
+            floor, median, ceiling = np.percentile(seasons_points, [10, 50, 90])
+            bought = leagues[name]
+            summaries.append(OutcomeSummary(
+                name, round(sum(len(league[0]) for league, _ in bought) / len(bought)),
+                round(sum(projected for _, projected in bought) / len(bought), 1),
+                round(float(seasons_points.mean()), 1), round(float(median), 1), round(float(floor), 1),
+                round(float(ceiling), 1), round(finishes[name] / sims, 2), top_n, round(hits[name] / sims, 3)))
+        return summaries
+
+
+def main():
+    from player_snapshot import load_players
+    from roster_scenario_solver import STRATEGIES
+
+    parser = argparse.ArgumentParser(description="Simulate season outcomes for every scenario roster")
+    parser.add_argument('--sims', type=int, default=DEFAULT_SIMS, help="Seasons per scenario")
+    parser.add_argument('--top', type=int, default=4, help="Finish needed to count as a top-N season")
+    parser.add_argument('--fields', type=int, default=FIELD_DRAFTS, help="Simulated auctions per scenario")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    players = load_players()
+    simulator = SeasonSimulator(players, seed=args.seed)
+
+    print("🎲 Season Outcome Simulator")
+    print("=" * 50)
+    print(f"📊 {len(STRATEGIES)} scenarios x {args.sims} seasons, each bought in {args.fields} auctioned "
+          f"{TEAMS_PER_LEAGUE}-team leagues")
+
+    started = time.perf_counter()
+    summaries = simulator.evaluate({spec.name: spec.key for spec in STRATEGIES}, args.sims, args.top, args.fields)
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'Scenario':<28} {'Proj':>6} {'Median':>7} {'P10':>7} {'P90':>7} {'Finish':>7} {f'Top {args.top}':>7}")
+    for summary in sorted(summaries, key=lambda s: s.mean_finish):
+        print(f"{summary.name:<28} {summary.projected:>6.0f} {summary.median:>7.0f} {summary.floor:>7.0f} "
+              f"{summary.ceiling:>7.0f} {summary.mean_finish:>7.2f} {summary.top_n_probability:>7.1%}")
+    print(f"\n⏱️  Simulated in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
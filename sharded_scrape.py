@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Sharded ESPN Scrape
+Spreads a large scrape over N worker processes fed by a durable SQLite work
+queue, so JSON decoding and stat extraction use every core instead of one.
+
+    enqueue  -> scrape_queue.sqlite <- claim/complete -> worker processes
+    merge    -> CSV in the scrape_top_200 schema
+
+Every athlete is one row in the queue. A worker claims the lowest-ranked
+pending row under a time-limited lease, fetches the overview and splits and
+completes the row only if it still holds the lease. A worker that dies just
+lets its lease expire and another worker reclaims the row. So each athlete
+ends with exactly one recorded result, however many times it was attempted.
+The queue survives restarts: `run` again picks up where the last one stopped,
+and `enqueue` again skips athletes already in the queue.
+
+Usage:
+    python3 sharded_scrape.py enqueue [--source top200|league] [--max-players N]
+    python3 sharded_scrape.py run [--workers 4] [--interval 0.5]
+    python3 sharded_scrape.py merge [--output top_200_fantasy_players.csv]
+    python3 sharded_scrape.py status
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Iterator, Optional
+
+from auction_players import calculate_ppr_points
+from streaming_scrape import STAT_KEYS
+
+DEFAULT_QUEUE = "scrape_queue.sqlite"
+LEASE_SECONDS = 60.0
+MAX_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    espn_id       TEXT PRIMARY KEY,
+    rank          INTEGER NOT NULL,
+    name          TEXT NOT NULL,
+    position      TEXT NOT NULL,
+    team          TEXT NOT NULL,
+    tier          INTEGER,
+    state         TEXT NOT NULL DEFAULT 'pending'
+                  CHECK (state IN ('pending', 'leased', 'done', 'failed')),
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    lease_owner   TEXT,
+    lease_expires REAL,
+    result        TEXT,
+    error         TEXT,
+    completed_at  REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (state, rank);
+"""
+
+
+class WorkQueue:
+    """Lease-based job queue in one SQLite file, safe to share between processes"""
+
+    def __init__(self, path: str = DEFAULT_QUEUE):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def enqueue(self, jobs: Iterable[Dict]) -> int:
+        """Add jobs (espn_id, rank, name, position, team, tier); returns how many were new"""
+        jobs = list(jobs)  # Finish any network paging before taking the write lock
+        before = self.conn.total_changes
+        self.conn.execute("BEGIN IMMEDIATE")
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO jobs (espn_id, rank, name, position, team, tier) "
+            "VALUES (:espn_id, :rank, :name, :position, :team, :tier)", jobs)
+        self.conn.execute("COMMIT")
+        return self.conn.total_changes - before
+
+    def claim(self, owner: str, lease_seconds: float = LEASE_SECONDS,
+              max_attempts: int = MAX_ATTEMPTS) -> Optional[sqlite3.Row]:
+        """Lease the next pending (or abandoned) job to `owner`, or None if there is none"""
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")  # Takes the write lock, so two workers never claim one row
+        try:
+            # Leases that ran out on their last allowed attempt are not retried again
+            self.conn.execute(
+                "UPDATE jobs SET state = 'failed', lease_owner = NULL, error = 'lease expired' "
+                "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?", (now, max_attempts))
+            job = self.conn.execute(
+                "UPDATE jobs SET state = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1 "
+                "WHERE espn_id = (SELECT espn_id FROM jobs "
+                "                 WHERE state = 'pending' OR (state = 'leased' AND lease_expires < ?) "
+                "                 ORDER BY rank LIMIT 1) "
+                "RETURNING *", (owner, now + lease_seconds, now)).fetchone()
+            self.conn.execute("COMMIT")
+        except sqlite3.Error:
+            self.conn.execute("ROLLBACK")
+            raise
+        return job
+
+    def complete(self, espn_id: str, owner: str, result: Dict) -> bool:
+        """Record the result if `owner` still holds the lease; False means it was lost"""
+        cursor = self.conn.execute(
+            "UPDATE jobs SET state = 'done', result = ?, error = NULL, lease_owner = NULL, completed_at = ? "
+            "WHERE espn_id = ? AND state = 'leased' AND lease_owner = ?",
+            (json.dumps(result), time.time(), espn_id, owner))
+        return cursor.rowcount == 1
+
+    def fail(self, espn_id: str, owner: str, error: str, max_attempts: int = MAX_ATTEMPTS) -> bool:
+        """Release a lease after an error: back to pending, or failed once attempts run out"""
+        cursor = self.conn.execute(
+            "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "error = ?, lease_owner = NULL, lease_expires = NULL "
+            "WHERE espn_id = ? AND state = 'leased' AND lease_owner = ?",
+            (max_attempts, error, espn_id, owner))
+        return cursor.rowcount == 1
+
+    def retry_failed(self) -> int:
+        cursor = self.conn.execute("UPDATE jobs SET state = 'pending', attempts = 0 WHERE state = 'failed'")
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        counts = {'pending': 0, 'leased': 0, 'done': 0, 'failed': 0}
+        counts.update(self.conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall())
+        return counts
+
+    def outstanding(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM jobs WHERE state IN ('pending', 'leased')").fetchone()[0]
+
+    def rows(self) -> Iterator[sqlite3.Row]:
+        return self.conn.execute("SELECT * FROM jobs ORDER BY rank, espn_id")
+
+
+def top_200_jobs() -> Iterator[Dict]:
+    from top_200_fantasy_scraper import Top200FantasyScraper
+
+    for rank, player in enumerate(Top200FantasyScraper().top_200_players, 1):
+        if player.espn_id:
+            yield {'espn_id': player.espn_id, 'rank': rank, 'name': player.name,
+                   'position': player.position, 'team': player.team, 'tier': player.tier}
+
+
+def league_jobs(max_players: Optional[int] = None) -> Iterator[Dict]:
+    from espn_player_scraper import ESPNPlayerScraper
+
+    athletes = ESPNPlayerScraper().iter_athletes()
+    for rank, athlete in enumerate(itertools.islice(athletes, max_players), 1):
+        yield {'espn_id': str(athlete.get('id', '')), 'rank': rank, 'name': athlete.get('displayName', ''),
+               'position': (athlete.get('position') or {}).get('abbreviation', 'UNK'), 'team': 'UNK', 'tier': None}
+
+
+def scrape_athlete(scraper, espn_id: str) -> Dict:
+    """Overview + splits for one athlete, scored; raises if ESPN did not answer"""
+    overview = scraper.get_player_overview(espn_id)
+    splits = scraper.get_player_stats(espn_id)
+    if overview is None or splits is None:
+        raise RuntimeError("overview or splits request failed")
+    raw = scraper.extract_stats_from_splits(splits)
+    stats = {STAT_KEYS[name]: value for name, value in raw.items() if name in STAT_KEYS}
+    stats['fantasy_points_2024'] = calculate_ppr_points(stats)
+    stats['team'] = scraper.extract_team_from_overview(overview)
+    return stats
+
+
+def run_worker(queue_path: str, lease_seconds: float, interval: float, max_attempts: int):
+    """Worker process: claim, scrape, complete until the queue is drained"""
+    from espn_player_scraper import ESPNPlayerScraper
+
+    owner = f"{os.uname().nodename}:{os.getpid()}"
+    scraper = ESPNPlayerScraper()
+    work_queue = WorkQueue(queue_path)
+    try:
+        while True:
+            job = work_queue.claim(owner, lease_seconds, max_attempts)
+            if job is None:
+                if not work_queue.outstanding():
+                    return
+                time.sleep(1)  # Others hold leases; wait in case one of them expires
+                continue
+            started = time.monotonic()
+            try:
+                result = scrape_athlete(scraper, job['espn_id'])
+            except Exception as e:
+                work_queue.fail(job['espn_id'], owner, str(e), max_attempts)
+            else:
+                if not work_queue.complete(job['espn_id'], owner, result):
+                    print(f"⚠️  Lease on {job['name']} expired before completion; result discarded")
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+    finally:
+        work_queue.close()
+
+
+def run_workers(queue_path: str, workers: int, lease_seconds: float = LEASE_SECONDS,
+                interval: float = 0.5, max_attempts: int = MAX_ATTEMPTS) -> Dict[str, int]:
+    processes = [multiprocessing.Process(target=run_worker, args=(queue_path, lease_seconds, interval, max_attempts))
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+
+    work_queue = WorkQueue(queue_path)
+    try:
+        while any(process.is_alive() for process in processes):
+            counts = work_queue.counts()
+            print(f"   {counts['done']} done, {counts['leased']} in flight, "
+                  f"{counts['pending']} pending, {counts['failed']} failed")
+            for process in processes:
+                process.join(timeout=5 / workers)
+        return work_queue.counts()
+    finally:
+        work_queue.close()
+
+
+def merge(queue_path: str, output_file: str) -> Dict[str, int]:
+    """Write every finished job to a CSV in the scrape_top_200 schema, ordered by rank"""
+    from top_200_fantasy_scraper import TOP_200_FIELDNAMES
+
+    written = {'done': 0, 'failed': 0, 'skipped': 0}
+    work_queue = WorkQueue(queue_path)
+    try:
+        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=TOP_200_FIELDNAMES)
+            writer.writeheader()
+            for job in work_queue.rows():
+                if job['state'] not in ('done', 'failed'):
+                    written['skipped'] += 1
+                    continue
+                stats = json.loads(job['result']) if job['state'] == 'done' else {}
+                scraped_team = stats.get('team', 'UNK')
+                writer.writerow({
+                    'rank': job['rank'],
+                    'name': job['name'],
+                    'position': job['position'],
+                    'team': job['team'] if job['team'] != 'UNK' else scraped_team,
+                    'tier': job['tier'] if job['tier'] is not None else '',
+                    'espn_id': job['espn_id'],
+                    'receptions_2024': stats.get('receptions', 0),
+                    'receiving_yards_2024': stats.get('receiving_yards', 0),
+                    'receiving_tds_2024': stats.get('receiving_tds', 0),
+                    'rushing_yards_2024': stats.get('rushing_yards', 0),
+                    'rushing_tds_2024': stats.get('rushing_tds', 0),
+                    'passing_yards_2024': stats.get('passing_yards', 0),
+                    'passing_tds_2024': stats.get('passing_tds', 0),
+                    'fantasy_points_2024': stats.get('fantasy_points_2024', 0),
+                    'status': "✅ Success" if job['state'] == 'done' else "❌ Failed",
+                    'notes': "Data scraped from ESPN API" if job['state'] == 'done'
+                             else f"Failed after {job['attempts']} attempts: {job['error']}",
+                })
+                written[job['state']] += 1
+    finally:
+        work_queue.close()
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-process ESPN scrape over a SQLite work queue")
+    parser.add_argument('--queue', default=DEFAULT_QUEUE)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    enqueue = commands.add_parser('enqueue', help="Add athletes to the queue (existing ones are kept)")
+    enqueue.add_argument('--source', choices=['top200', 'league'], default='top200')
+    enqueue.add_argument('--max-players', type=int, help="League source: stop after this many athletes")
+    enqueue.add_argument('--retry-failed', action='store_true', help="Also put failed jobs back to pending")
+
+    run = commands.add_parser('run', help="Drain the queue with worker processes")
+    run.add_argument('--workers', type=int, default=os.cpu_count() or 4)
+    run.add_argument('--interval', type=float, default=0.5, help="Minimum seconds per athlete, per worker")
+    run.add_argument('--lease', type=float, default=LEASE_SECONDS, help="Seconds before a claimed job can be reclaimed")
+    run.add_argument('--max-attempts', type=int, default=MAX_ATTEMPTS)
+
+    merge_parser = commands.add_parser('merge', help="Write finished jobs to CSV")
+    merge_parser.add_argument('--output', default="top_200_fantasy_players.csv")
+
+    commands.add_parser('status', help="Show job counts")
+    args = parser.parse_args()
+
+    print("🧩 Sharded ESPN Scrape")
+    print("=" * 50)
+
+    if args.command == 'enqueue':
+        jobs = top_200_jobs() if args.source == 'top200' else league_jobs(args.max_players)
+        work_queue = WorkQueue(args.queue)
+        added = work_queue.enqueue(jobs)
+        retried = work_queue.retry_failed() if args.retry_failed else 0
+        print(f"📥 {added} new jobs queued" + (f", {retried} failed jobs retried" if retried else ""))
+        print(f"📊 {work_queue.counts()}")
+        work_queue.close()
+
+    elif args.command == 'run':
+        started = time.perf_counter()
+        counts = run_workers(args.queue, args.workers, args.lease, args.interval, args.max_attempts)
+        print(f"✅ {counts['done']} done, {counts['failed']} failed with {args.workers} workers "
+              f"in {time.perf_counter() - started:.1f}s")
+
+    elif args.command == 'merge':
+        written = merge(args.queue, args.output)
+        print(f"💾 {written['done']} scraped and {written['failed']} failed rows written to {args.output}")
+        if written['skipped']:
+            print(f"⚠️  {written['skipped']} jobs still unfinished; run again and re-merge")
+
+    else:
+        work_queue = WorkQueue(args.queue)
+        print(f"📊 {work_queue.counts()}")
+        work_queue.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Player Similarity Index
+Answers "who is the closest comparable player still available?" the moment
+a target goes for too much.
+
+Every player is a vector of the scraped 2024 splits columns (receptions,
+receiving/rushing/passing yards and TDs) plus the 2025 projection. Stats are
+z-scored within the position so QB passing volume does not swamp everything
+else; the projection is z-scored across the whole universe so a FLEX query
+still compares points on one scale. Players without scraped stats get their
+position's average stat line, so they are compared on projection alone.
+
+Queries are brute-force k-nearest-neighbour over one NumPy matrix: drafted,
+over-budget and wrong-position rows are masked out and the k closest come
+from argpartition. With a few hundred players this beats the overhead of a
+ball tree and answers in tens of microseconds; drafting a player just clears
+a bit in the mask.
+
+Usage:
+    python3 similarity_index.py "Ja'Marr Chase" [--max-price 30] [--k 5] [--drafted NAME ...]
+"""
+
+import argparse
+import csv
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from auction_players import AuctionPlayer
+from entity_resolution import normalize_name, player_key
+
+STATS_CSV = "top_200_fantasy_players.csv"  # scrape_top_200 / sharded_scrape.py merge output
+STAT_COLUMNS = (
+    'receptions_2024', 'receiving_yards_2024', 'receiving_tds_2024',
+    'rushing_yards_2024', 'rushing_tds_2024', 'passing_yards_2024', 'passing_tds_2024',
+)
+PROJECTION_WEIGHT = 2.0  # The forward-looking projection counts double against any one stat
+
+
+def load_stats(csv_path: str = STATS_CSV) -> Dict[str, List[float]]:
+    """player_key -> stat vector, for rows that were actually scraped (not all zero)"""
+    if not os.path.exists(csv_path):
+        return {}
+    stats = {}
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        for row in csv.DictReader(csvfile):
+            vector = [float(row.get(column) or 0) for column in STAT_COLUMNS]
+            if any(vector):
+                stats[player_key(row['name'], row['position'])] = vector
+    return stats
+
+
+def _standardize(values: np.ndarray) -> np.ndarray:
+    """Column z-scores; constant columns become zero instead of dividing by zero"""
+    spread = values.std(axis=0)
+    return (values - values.mean(axis=0)) / np.where(spread > 0, spread, 1.0)
+
+
+class SimilarityIndex:
+    def __init__(self, players: List[AuctionPlayer], stats: Optional[Dict[str, List[float]]] = None):
+        stats = load_stats() if stats is None else stats
+        self.players = players
+        self.row: Dict[str, int] = {normalize_name(p.name): i for i, p in enumerate(players)}
+        self.positions = np.array([p.position for p in players])
+        self.prices = np.array([p.auction_value for p in players])
+        self.available = np.ones(len(players), dtype=bool)
+
+        raw = np.zeros((len(players), len(STAT_COLUMNS) + 1))
+        scraped = np.zeros(len(players), dtype=bool)
+        for i, player in enumerate(players):
+            vector = stats.get(player_key(player.name, player.position))
+            if vector is not None:
+                raw[i, :-1] = vector
+                scraped[i] = True
+            raw[i, -1] = player.projected_points
+
+        self.vectors = np.zeros_like(raw)
+        for position in np.unique(self.positions):
+            rows = self.positions == position
+            block = raw[rows, :-1]
+            with_stats = scraped[rows]
+            if with_stats.any():
+                block[~with_stats] = block[with_stats].mean(axis=0)
+            self.vectors[rows, :-1] = _standardize(block)
+        self.vectors[:, -1] = _standardize(raw[:, -1]) * PROJECTION_WEIGHT
+        self.squared_norms = np.einsum('ij,ij->i', self.vectors, self.vectors)
+
+    def _index(self, name: str) -> int:
+        index = self.row.get(normalize_name(name))
+        if index is None:
+            raise KeyError(f"Unknown player: {name}")
+        return index
+
+    def player(self, name: str) -> AuctionPlayer:
+        return self.players[self._index(name)]
+
+    def remove(self, name: str):
+        """Mark a player drafted; they stop appearing in results"""
+        self.available[self._index(name)] = False
+
+    def restore(self, name: str):
+        self.available[self._index(name)] = True
+
+    def nearest(self, name: str, k: int = 5, max_price: Optional[int] = None,
+                positions: Optional[Iterable[str]] = None) -> List[Tuple[AuctionPlayer, float]]:
+        """
+        The k available players most like `name`, closest first, with their distances.
+        Defaults to the target's own position; pass positions (e.g. FLEX_POSITIONS) to widen it.
+        """
+        target = self._index(name)
+        mask = self.available.copy()
+        mask[target] = False
+        if max_price is not None:
+            mask &= self.prices <= max_price
+        wanted = (self.positions[target],) if positions is None else tuple(positions)
+        mask &= np.isin(self.positions, wanted)
+
+        candidates = np.flatnonzero(mask)
+        if not len(candidates):
+            return []
+        query = self.vectors[target]
+        distances = self.squared_norms[candidates] - 2 * self.vectors[candidates] @ query + query @ query
+        if len(candidates) > k:
+            closest = np.argpartition(distances, k)[:k]
+        else:
+            closest = np.arange(len(candidates))
+        closest = closest[np.argsort(distances[closest])]
+        return [(self.players[candidates[i]], float(np.sqrt(max(distances[i], 0.0)))) for i in closest]
+
+
+def main():
+    from player_snapshot import load_players
+
+    parser = argparse.ArgumentParser(description="Closest available comparable players")
+    parser.add_argument('player')
+    parser.add_argument('--k', type=int, default=5)
+    parser.add_argument('--max-price', type=int)
+    parser.add_argument('--positions', nargs='*', help="Positions to search (default: the player's own)")
+    parser.add_argument('--drafted', nargs='*', default=[], help="Players already off the board")
+    parser.add_argument('--stats', default=STATS_CSV)
+    args = parser.parse_args()
+
+    stats = load_stats(args.stats)
+    index = SimilarityIndex(load_players(), stats)
+    for name in args.drafted:
+        index.remove(name)
+
+    results = index.nearest(args.player, args.k, args.max_price, args.positions)
+    runs = 1000
+    started = time.perf_counter()
+    for _ in range(runs):
+        index.nearest(args.player, args.k, args.max_price, args.positions)
+    elapsed_us = (time.perf_counter() - started) / runs * 1e6
+
+    target = index.player(args.player)
+    print("🔎 Player Similarity Index")
+    print("=" * 50)
+    print(f"📊 {len(index.players)} players, {len(stats)} with scraped stats; query {elapsed_us:.0f} µs")
+    print(f"🎯 {target.name} ({target.position}, ${target.auction_value}, {target.projected_points} pts)")
+    for player, distance in results:
+        print(f"   {distance:5.2f}  {player.name:<24} {player.position:<3} ${player.auction_value:<3} "
+              f"{player.projected_points} pts (Tier {player.tier})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { queryDraftDaemon } from '@/lib/draft-daemon'
+
+type RouteContext = { params: Promise<{ path: string[] }> }
+
+async function forward(request: NextRequest, context: RouteContext) {
+  const { path } = await context.params
+  const target = `/${path.join('/')}${request.nextUrl.search}`
+
+  try {
+    const response = await queryDraftDaemon(target, {
+      method: request.method,
+      body: request.method === 'POST' ? await request.text() : undefined
+    })
+    return NextResponse.json(await response.json(), { status: response.status })
+  } catch (error) {
+    console.error('Draft daemon unreachable:', error)
+    return NextResponse.json(
+      { error: 'Draft daemon is not running (python3 draft_daemon.py)' },
+      { status: 503 }
+    )
+  }
+}
+
+export async function GET(request: NextRequest, context: RouteContext) {
+  return forward(request, context)
+}
+
+export async function POST(request: NextRequest, context: RouteContext) {
+  return forward(request, context)
+}
@@ -0,0 +1,10 @@
+// Client for the local draft-day daemon (draft_daemon.py)
+const daemonUrl = process.env.DRAFT_DAEMON_URL || 'http://127.0.0.1:8765'
+
+export async function queryDraftDaemon(path: string, init?: RequestInit): Promise<Response> {
+  return fetch(`${daemonUrl}${path}`, {
+    ...init,
+    headers: { 'Content-Type': 'application/json', ...init?.headers },
+    cache: 'no-store'
+  })
+}
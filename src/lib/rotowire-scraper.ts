@@ -12,23 +12,55 @@ interface PlayerNewsData {
   analysis: string | null
 }
 
-// Function to read CSV and find URL for player ID
+// Rotowire_URLs.csv loaded once into an id -> URL index
+let rotowireUrlIndex: Map<string, string> | null = null
+
 function getRotowireUrl(playerId: string): string | null {
-  try {
-    const csvPath = path.join(process.cwd(), 'Rotowire_URLs.csv')
-    const csvContent = fs.readFileSync(csvPath, 'utf-8')
-    const lines = csvContent.split('\n')
-    
-    for (let i = 1; i < lines.length; i++) {
-      const [url, id] = lines[i].split(',')
-      if (id && id.trim() === playerId) {
-        return url
+  if (!rotowireUrlIndex) {
+    try {
+      const csvPath = path.join(process.cwd(), 'Rotowire_URLs.csv')
+      const lines = fs.readFileSync(csvPath, 'utf-8').split('\n')
+      const index = new Map<string, string>()
+      for (let i = 1; i < lines.length; i++) {
+        const [url, id] = lines[i].split(',')
+        if (url && id) {
+          index.set(id.trim(), url.trim())
+        }
       }
+      rotowireUrlIndex = index
+    } catch (error) {
+      console.error('Error reading CSV:', error)
+      return null
     }
-    return null
-  } catch (error) {
-    console.error('Error reading CSV:', error)
-    return null
+  }
+  return rotowireUrlIndex.get(playerId) ?? null
+}
+
+// News prefetched by rotowire_news_prefetch.py, reloaded when the store file changes
+let newsStore: {
+  mtimeMs: number,
+  players: Record<string, { news: PlayerNewsData | null, fetchedAt?: number }>
+} | null = null
+
+// Older prefetched entries are ignored so the caller scrapes live instead
+export const PREFETCHED_NEWS_MAX_AGE_MS = 6 * 60 * 60 * 1000
+
+export function getPrefetchedNews(playerId: string, maxAgeMs: number = PREFETCHED_NEWS_MAX_AGE_MS): PlayerNewsData | null {
+  try {
+    const storePath = path.join(process.cwd(), 'rotowire_news.json')
+    const { mtimeMs } = fs.statSync(storePath)
+    if (!newsStore || newsStore.mtimeMs !== mtimeMs) {
+      const { players } = JSON.parse(fs.readFileSync(storePath, 'utf-8'))
+      newsStore = { mtimeMs, players: players || {} }
+    }
+    const entry = newsStore.players[playerId]
+    // fetchedAt is epoch seconds, written by Python's time.time()
+    if (!entry?.fetchedAt || Date.now() - entry.fetchedAt * 1000 > maxAgeMs) {
+      return null
+    }
+    return entry.news ?? null
+  } catch {
+    return null // No store yet; callers fall back to a live scrape
   }
 }
 
@@ -41,6 +73,11 @@ function createSearchUrl(playerName: string): string {
 }
 
 export async function scrapeRotowireNews(playerId: string, playerName?: string): Promise<PlayerNewsData | null> {
+  const prefetched = getPrefetchedNews(playerId)
+  if (prefetched) {
+    return prefetched
+  }
+
   let url = getRotowireUrl(playerId)
   
   // If no direct URL found and we have a player name, use search URL
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Streaming ESPN Scrape
+Full-league scrape with constant memory: athletes flow through bounded
+queues between stages instead of being collected into lists first.
+
+    athletes (paged) -> fetch workers -> parse/score -> CSV writer
+
+Each queue holds at most a few items per worker. When the writer or parser
+falls behind, the queues fill, `put` blocks and upstream stages pause
+(back-pressure), so memory depends on the queue sizes and not on how many
+athletes the league has. Rows are written and flushed as soon as they are
+scored.
+
+A stage that hits an error records it and skips that athlete, and every stage
+passes the end-of-stream marker on when it stops, so one bad athlete (or a
+failed page of the athlete list) can never leave the others waiting forever.
+
+Usage:
+    python3 streaming_scrape.py [--output nfl_players_stream.csv] [--workers 4] [--max-players N]
+"""
+
+import argparse
+import csv
+import itertools
+import queue
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from auction_players import calculate_ppr_points
+from espn_player_scraper import ESPNPlayerScraper
+
+FIELDNAMES = [
+    'name', 'position', 'team', 'espn_id',
+    'passing_yards_2024', 'passing_tds_2024',
+    'receptions_2024', 'receiving_yards_2024', 'receiving_tds_2024',
+    'rushing_yards_2024', 'rushing_tds_2024', 'fantasy_points_2024',
+]
+
+# ESPN splits stat names -> calculate_ppr_points keys
+STAT_KEYS = {
+    'passingYards': 'passing_yards',
+    'passingTouchdowns': 'passing_tds',
+    'receptions': 'receptions',
+    'receivingYards': 'receiving_yards',
+    'receivingTouchdowns': 'receiving_tds',
+    'rushingYards': 'rushing_yards',
+    'rushingTouchdowns': 'rushing_tds',
+}
+
+_DONE = object()  # End-of-stream marker passed down every queue
+
+
+class RateLimiter:
+    """Minimum spacing between requests across all fetch workers"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class StreamingScrape:
+    def __init__(self, scraper: ESPNPlayerScraper, workers: int = 4, queue_size: int = 2,
+                 request_interval: float = 0.25):
+        self.scraper = scraper
+        self.workers = workers
+        self.limiter = RateLimiter(request_interval)
+        self.fetch_queue: "queue.Queue" = queue.Queue(maxsize=workers * queue_size)
+        self.parse_queue: "queue.Queue" = queue.Queue(maxsize=workers * queue_size)
+        self.write_queue: "queue.Queue" = queue.Queue(maxsize=workers * queue_size)
+        self.high_water = {'fetch': 0, 'parse': 0, 'write': 0}
+        self.errors: List[Tuple[str, str, str]] = []  # (stage, athlete id, error)
+        self._errors_lock = threading.Lock()
+
+    def _record_error(self, stage: str, athlete: Optional[Dict], error: Exception):
+        athlete_id = str(athlete.get('id', '')) if isinstance(athlete, dict) else ''
+        with self._errors_lock:
+            self.errors.append((stage, athlete_id, repr(error)))
+
+    def _put(self, name: str, target: "queue.Queue", item):
+        target.put(item)  # Blocks while the queue is full
+        self.high_water[name] = max(self.high_water[name], target.qsize())
+
+    def _produce(self, athletes: Iterable[Dict]):
+        try:
+            for athlete in athletes:
+                self._put('fetch', self.fetch_queue, athlete)
+        except Exception as error:  # A failed page ends the stream early, with what was already queued
+            self._record_error('produce', None, error)
+        finally:
+            for _ in range(self.workers):
+                self.fetch_queue.put(_DONE)
+
+    def _fetch(self):
+        try:
+            while True:
+                athlete = self.fetch_queue.get()
+                if athlete is _DONE:
+                    return
+                try:
+                    athlete_id = str(athlete.get('id', ''))
+                    self.limiter.wait()
+                    overview = self.scraper.get_player_overview(athlete_id)
+                    self.limiter.wait()
+                    splits = self.scraper.get_player_stats(athlete_id)
+                except Exception as error:
+                    self._record_error('fetch', athlete, error)
+                    continue
+                self._put('parse', self.parse_queue, (athlete, overview, splits))
+        finally:
+            self.parse_queue.put(_DONE)
+
+    def _parse(self):
+        finished = 0
+        try:
+            while finished < self.workers:
+                item = self.parse_queue.get()
+                if item is _DONE:
+                    finished += 1
+                    continue
+                try:
+                    row = self.score(*item)
+                except Exception as error:
+                    self._record_error('parse', item[0], error)
+                    continue
+                self._put('write', self.write_queue, row)
+        finally:
+            self.write_queue.put(_DONE)
+
+    def score(self, athlete: Dict, overview: Optional[Dict], splits: Optional[Dict]) -> Dict:
+        raw = self.scraper.extract_stats_from_splits(splits) if splits else {}
+        stats = {STAT_KEYS[name]: value for name, value in raw.items() if name in STAT_KEYS}
+        return {
+            'name': athlete.get('displayName', ''),
+            'position': (athlete.get('position') or {}).get('abbreviation', 'UNK'),
+            'team': self.scraper.extract_team_from_overview(overview) if overview else 'UNK',
+            'espn_id': athlete.get('id', ''),
+            'passing_yards_2024': stats.get('passing_yards', 0),
+            'passing_tds_2024': stats.get('passing_tds', 0),
+            'receptions_2024': stats.get('receptions', 0),
+            'receiving_yards_2024': stats.get('receiving_yards', 0),
+            'receiving_tds_2024': stats.get('receiving_tds', 0),
+            'rushing_yards_2024': stats.get('rushing_yards', 0),
+            'rushing_tds_2024': stats.get('rushing_tds', 0),
+            'fantasy_points_2024': calculate_ppr_points(stats),
+        }
+
+    def run(self, output_file: str, athletes: Iterable[Dict]) -> int:
+        """Stream every athlete to the CSV; returns rows written"""
+        threads = [threading.Thread(target=self._produce, args=(athletes,), daemon=True),
+                   threading.Thread(target=self._parse, daemon=True)]
+        threads += [threading.Thread(target=self._fetch, daemon=True) for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        written = 0
+        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+            writer.writeheader()
+            while True:
+                row = self.write_queue.get()
+                if row is _DONE:
+                    break
+                writer.writerow(row)
+                csvfile.flush()  # Each row is on disk as soon as it is scored
+                written += 1
+                if written % 100 == 0:
+                    print(f"   {written} players written")
+
+        for thread in threads:
+            thread.join()
+        return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a full-league ESPN scrape to CSV")
+    parser.add_argument('--output', default="nfl_players_stream.csv")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--max-players', type=int, help="Stop after this many athletes")
+    parser.add_argument('--interval', type=float, default=0.25, help="Seconds between requests")
+    args = parser.parse_args()
+
+    scraper = ESPNPlayerScraper()
+    athletes = scraper.iter_athletes()
+    if args.max_players:
+        athletes = itertools.islice(athletes, args.max_players)
+
+    print("🌊 Streaming ESPN Scrape")
+    print("=" * 50)
+    started = time.perf_counter()
+    stream = StreamingScrape(scraper, args.workers, request_interval=args.interval)
+    written = stream.run(args.output, athletes)
+
+    print(f"✅ {written} players written to {args.output} in {time.perf_counter() - started:.1f}s")
+    print(f"📦 Queue high-water marks: {stream.high_water}")
+    if stream.errors:
+        print(f"⚠️  {len(stream.errors)} athletes skipped after errors:")
+        for stage, athlete_id, error in stream.errors[:10]:
+            print(f"   {stage:<8} {athlete_id or '-':<10} {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+draft_fingerprint: every pick and its undo round-trip to the same
+fingerprint, the same state hashes the same whatever the pick order, and
+the LRU evicts least recently used results first.
+"""
+
+import pytest
+
+from draft_fingerprint import DraftFingerprint, ResultCache, zobrist_key
+
+
+def test_purchase_and_undo_round_trip():
+    fingerprint = DraftFingerprint(200)
+    start = fingerprint.value
+    fingerprint.purchase("Ja'Marr Chase", 58)
+    assert (fingerprint.value, fingerprint.budget) != (start, 200)
+    fingerprint.undo_purchase("Ja'Marr Chase", 58)
+    assert (fingerprint.value, fingerprint.budget) == (start, 200)
+
+
+def test_drafted_toggle_round_trips():
+    fingerprint = DraftFingerprint()
+    start = fingerprint.value
+    fingerprint.toggle_drafted("Bijan Robinson")
+    assert fingerprint.value != start
+    fingerprint.toggle_drafted("Bijan Robinson")
+    assert fingerprint.value == start
+
+
+def test_nested_picks_unwind_in_any_order():
+    fingerprint = DraftFingerprint()
+    states = [fingerprint.value]
+    fingerprint.purchase("A", 30)
+    states.append(fingerprint.value)
+    fingerprint.toggle_drafted("B")
+    states.append(fingerprint.value)
+    fingerprint.purchase("C", 12)
+    assert len(set(states + [fingerprint.value])) == 4
+
+    fingerprint.toggle_drafted("B")  # Undo an earlier pick first: XOR commutes
+    fingerprint.undo_purchase("C", 12)
+    assert fingerprint.value == states[1]
+    fingerprint.undo_purchase("A", 30)
+    assert fingerprint.value == states[0]
+
+
+def test_same_state_same_fingerprint_whatever_the_order():
+    first, second = DraftFingerprint(), DraftFingerprint()
+    first.purchase("A", 30)
+    first.toggle_drafted("B")
+    first.purchase("C", 12)
+    second.toggle_drafted("B")
+    second.purchase("C", 12)
+    second.purchase("A", 30)
+    assert first.value == second.value
+
+
+def test_budget_is_part_of_the_state():
+    cheap, dear = DraftFingerprint(), DraftFingerprint()
+    cheap.purchase("A", 10)
+    dear.purchase("A", 11)
+    assert cheap.value != dear.value
+    assert DraftFingerprint(200).value != DraftFingerprint(199).value
+
+
+def test_after_purchase_predicts_without_changing():
+    fingerprint = DraftFingerprint()
+    fingerprint.toggle_drafted("B")
+    before = fingerprint.value
+    predicted = fingerprint.after_purchase("A", 25)
+    assert fingerprint.value == before
+    fingerprint.purchase("A", 25)
+    assert fingerprint.value == predicted
+
+
+def test_keys_are_stable():
+    assert zobrist_key('drafted', "A") == zobrist_key('drafted', "A")
+    assert zobrist_key('drafted', "A") != zobrist_key('mine', "A")
+    assert 0 <= zobrist_key('budget', 200) < 1 << 64
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    cache.put(1, "one")
+    cache.put(2, "two")
+    assert cache.get(1) == "one"  # 2 is now the oldest
+    cache.put(3, "three")
+    assert cache.get(2) is None
+    assert (cache.get(1), cache.get(3)) == ("one", "three")
+    assert cache.stats() == {'entries': 2, 'max_entries': 2, 'hits': 3, 'misses': 1, 'evictions': 1}
+
+
+def test_get_or_compute_only_computes_once():
+    cache = ResultCache()
+    calls = []
+    compute = lambda: calls.append(1) or "result"  # noqa: E731
+    assert cache.get_or_compute("key", compute) == "result"
+    assert cache.get_or_compute("key", compute) == "result"
+    assert len(calls) == 1
+
+
+@pytest.fixture
+def draft_state():
+    from draft_daemon import DraftState
+    from player_snapshot import load_players
+
+    return DraftState(load_players())
+
+
+def test_buy_and_undo_answers_scenarios_from_cache(draft_state):
+    state = draft_state
+    start = state.fingerprint.value
+    state.scenarios()
+    target = state.players[0]
+
+    what_if = state.scenarios(buy=target.name, price=target.auction_value)
+    misses = state.scenario_cache.misses
+    state.nominate(target.name, state.my_team)
+    state.record_sale(target.name, state.my_team, target.auction_value)
+    assert state.scenarios() is what_if  # The what-if was cached under the post-purchase fingerprint
+    state.undo()
+    state.undo()  # The sale, then the nomination
+    assert state.fingerprint.value == start
+    state.scenarios()
+    assert state.scenario_cache.misses == misses
@@ -0,0 +1,135 @@
+"""
+draft_log: every undo restores the board exactly, recovery from a snapshot
+matches a full replay, and a torn last line is dropped.
+"""
+
+import json
+import os
+
+import pytest
+
+from draft_log import DraftBoard, DraftEvent, DraftLog, default_teams, simulate_draft, snapshot_path
+
+PLAYERS = [f"Player {i}" for i in range(200)]
+
+
+def board_state(board: DraftBoard):
+    return (dict(board.budgets), {team: list(roster) for team, roster in board.rosters.items()},
+            dict(board.owner), list(board.sales), board.lot)
+
+
+def new_log(path=None, **kwargs) -> DraftLog:
+    return DraftLog(DraftBoard(default_teams(), players=PLAYERS), path, **kwargs)
+
+
+def test_each_undo_restores_the_state_before_its_event():
+    log = new_log()
+    history = []
+    actions = [
+        ("nominate", "Player 0", "Me", 1), ("bid", "", "Team 2", 5), ("bid", "", "Me", 9),
+        ("sale", "Player 0", "Me", 9),
+        ("nominate", "Player 1", "Team 3", 3), ("sale", "Player 1", "Team 3", 3),
+        ("nominate", "Player 2", "Team 2", 1), ("bid", "", "Team 4", 40),
+    ]
+    for action in actions:
+        history.append(board_state(log.board))
+        log.record(*action)
+
+    for action in reversed(actions):
+        _, undone = log.record("undo")
+        assert (undone.kind, undone.team) == (action[0], action[2])
+        assert board_state(log.board) == history.pop()
+    with pytest.raises(ValueError, match="Nothing to undo"):
+        log.record("undo")
+
+
+def test_undo_then_redo_matches_never_undoing():
+    straight, undoing = new_log(), new_log()
+    for log in (straight, undoing):
+        log.record("nominate", "Player 5", "Team 2", 2)
+    straight.record("sale", "Player 5", "Team 2", 2)
+    undoing.record("sale", "Player 5", "Team 2", 2)
+    undoing.record("undo")
+    undoing.record("sale", "Player 5", "Team 2", 2)
+    assert board_state(undoing.board) == board_state(straight.board)
+
+
+def test_illegal_event_changes_nothing():
+    log = new_log()
+    log.record("nominate", "Player 0", "Me", 1)
+    before = board_state(log.board)
+    with pytest.raises(ValueError):
+        log.record("bid", team="Team 2", price=1)  # Must beat the current $1
+    with pytest.raises(ValueError):
+        log.record("sale", "Player 1", "Me", 1)  # Player 0 is on the block
+    assert board_state(log.board) == before
+    assert log.board.seq == 1
+
+
+@pytest.mark.parametrize("group_commit", [False, True])
+def test_snapshot_recovery_matches_full_replay(tmp_path, group_commit):
+    path = str(tmp_path / "draft.jsonl")
+    log = new_log(path, snapshot_every=50, durable=False, group_commit=group_commit)
+    simulate_draft(log, PLAYERS, seed=3)
+    if group_commit:
+        log.commit()()
+    log.close()
+    expected = log.board.snapshot()
+
+    from_snapshot = new_log(path)
+    from_snapshot.close()
+    assert from_snapshot.board.snapshot() == expected
+    assert from_snapshot.replayed < 50
+
+    os.remove(snapshot_path(path))
+    full = new_log(path)
+    full.close()
+    assert full.board.snapshot() == expected
+    assert full.replayed == log.board.seq
+
+
+def test_recovered_log_keeps_appending(tmp_path):
+    path = str(tmp_path / "draft.jsonl")
+    log = new_log(path, durable=False)
+    log.record("nominate", "Player 0", "Me", 1)
+    log.close()
+
+    reopened = new_log(path, durable=False)
+    reopened.record("sale", "Player 0", "Me", 1)
+    reopened.close()
+    assert new_log(path).board.owner == {"Player 0": "Me"}
+
+
+def test_torn_last_line_is_truncated(tmp_path):
+    path = str(tmp_path / "draft.jsonl")
+    log = new_log(path, durable=False)
+    log.record("nominate", "Player 0", "Me", 1)
+    log.record("bid", team="Team 2", price=4)
+    log.close()
+    intact = os.path.getsize(path)
+    with open(path, 'a', encoding='utf-8') as handle:
+        handle.write('{"seq":3,"kind":"sale","player":"Pla')  # Crash mid-write
+
+    recovered = new_log(path, durable=False)
+    assert recovered.replayed == 2
+    assert recovered.board.lot.price == 4
+    assert os.path.getsize(path) == intact
+
+    recovered.record("sale", "Player 0", "Team 2", 4)
+    recovered.close()
+    with open(path, encoding='utf-8') as handle:
+        assert [json.loads(line)['seq'] for line in handle] == [1, 2, 3]
+
+
+def test_corrupt_complete_line_is_an_error(tmp_path):
+    path = str(tmp_path / "draft.jsonl")
+    with open(path, 'w', encoding='utf-8') as handle:
+        handle.write('{"seq":1,"kind":"nominate"\n')
+    with pytest.raises(ValueError):
+        new_log(path)
+
+
+def test_out_of_order_event_is_rejected():
+    board = DraftBoard(default_teams(), players=PLAYERS)
+    with pytest.raises(ValueError, match="out of order"):
+        board.apply(DraftEvent(2, "nominate", "Player 0", "Me", 1))
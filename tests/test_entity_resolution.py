@@ -0,0 +1,70 @@
+"""
+entity_resolution: names match across spellings, and an ESPN ID that more
+than one player claims is reported and withheld from all of them, as the
+generators' known_ids tables once did with Kelce and Adams on 16800.
+"""
+
+import pytest
+
+from auction_players import AuctionPlayer
+from entity_resolution import EntityResolver, espn_athlete_ids, player_key
+
+
+@pytest.fixture
+def players():
+    return [AuctionPlayer(1, "Ja'Marr Chase", "WR", "CIN", 1, 62, 219.0),
+            AuctionPlayer(2, "Travis Kelce", "TE", "KC", 3, 12, 76.6),
+            AuctionPlayer(3, "Davante Adams", "WR", "LAR", 2, 20, 150.0),
+            AuctionPlayer(4, "Patrick Mahomes", "QB", "KC", 1, 30, 300.0)]
+
+
+@pytest.fixture
+def shared_id_tables():
+    """Two known_ids tables in the shape the generators used to ship, with 16800 claimed twice"""
+    return [('complete_200_players', {"Ja'Marr Chase": "4431750", "Davante Adams": "16800", "Travis Kelce": "16800"}),
+            ('final_top_200_with_known_ids', {"Travis Kelce": "16800", "Patrick Mahomes II": "3139477"})]
+
+
+def test_keys_ignore_case_accents_punctuation_and_suffixes():
+    assert player_key("Ja'Marr Chase", "WR") == player_key("jamarr-chase", "wr") == "jamarr chase|WR"
+    assert player_key("Patrick Mahomes II", "QB") == "patrick mahomes|QB"
+    assert player_key("Philadelphia Eagles", "DST") == player_key("Eagles", "DEF")
+
+
+def test_shared_id_is_flagged_and_withheld(players, shared_id_tables):
+    resolver = EntityResolver(players)
+    for source, known_ids in shared_id_tables:
+        resolver.add_espn_ids(known_ids, source)
+    report = resolver.resolve()
+
+    assert report.id_collisions == {"16800": ["Davante Adams", "Travis Kelce"]}
+    ids = {resolved.player.name: resolved.espn_id for resolved in report.players}
+    assert ids == {"Ja'Marr Chase": "4431750", "Travis Kelce": "", "Davante Adams": "", "Patrick Mahomes": "3139477"}
+
+
+def test_conflicting_ids_for_one_player_are_withheld(players):
+    resolver = EntityResolver(players)
+    resolver.add_espn_ids({"Travis Kelce": "15847"}, 'first')
+    resolver.add_espn_ids({"Travis Kelce": "16800"}, 'second')
+    report = resolver.resolve()
+    assert report.id_conflicts == {"Travis Kelce": ["15847", "16800"]}
+    assert report.id_collisions == {}
+    assert next(r for r in report.players if r.player.name == "Travis Kelce").espn_id == ""
+
+
+def test_generator_tables_have_no_shared_ids(players):
+    from entity_resolution import generator_known_ids
+
+    resolver = EntityResolver(players)
+    for source, known_ids in generator_known_ids():
+        resolver.add_espn_ids(known_ids, source)
+    assert resolver.resolve().id_collisions == {}
+
+
+def test_athlete_list_ids_skip_keys_two_athletes_share(players):
+    athletes = [{'id': 4431750, 'displayName': "Ja'Marr Chase", 'position': {'abbreviation': 'WR'}},
+                {'id': 15847, 'displayName': "Travis Kelce", 'position': {'abbreviation': 'TE'}},
+                {'id': 16800, 'displayName': "Davante Adams", 'position': {'abbreviation': 'WR'}},
+                {'id': 99999, 'displayName': "Davante Adams", 'position': {'abbreviation': 'WR'}},
+                {'id': 1, 'displayName': "Nobody", 'position': None}]
+    assert espn_athlete_ids(players, athletes) == {"Ja'Marr Chase": "4431750", "Travis Kelce": "15847"}
@@ -0,0 +1,134 @@
+"""
+roster_constraints: the packed bitset checks agree with a plain Python
+reading of the same rules, one roster at a time and in NumPy batches, and
+bye coverage is scored without making a roster illegal.
+"""
+
+import numpy as np
+import pytest
+
+from auction_players import POSITION_LIMITS, POSITIONS, ROSTER_SLOTS, AuctionPlayer, roster_size
+from player_snapshot import load_players
+from roster_constraints import RosterConstraints, starter_requirements
+from roster_scenario_solver import ScenarioEngine
+
+
+@pytest.fixture(scope="module")
+def players():
+    return load_players()
+
+
+@pytest.fixture(scope="module")
+def engine(players):
+    return RosterConstraints(players, max_per_team=4)
+
+
+def reference_legal(players, roster, budget=200, max_per_team=4):
+    counts = {position: 0 for position in POSITIONS}
+    teams = {}
+    for i in roster:
+        counts[players[i].position] += 1
+        teams[players[i].team] = teams.get(players[i].team, 0) + 1
+    flex_capable = counts["RB"] + counts["WR"] + counts["TE"]
+    return (len(roster) <= roster_size()
+            and all(counts[p] <= POSITION_LIMITS[p] for p in POSITIONS)
+            and all(counts[p] >= ROSTER_SLOTS[p] for p in POSITIONS)
+            and flex_capable >= ROSTER_SLOTS["RB"] + ROSTER_SLOTS["WR"] + ROSTER_SLOTS["TE"] + ROSTER_SLOTS["FLEX"]
+            and sum(players[i].auction_value for i in roster) <= budget
+            and max(teams.values(), default=0) <= max_per_team)
+
+
+def random_rosters(players, count, seed):
+    """Rosters of 10-14 distinct players, mostly starter-shaped so both outcomes are common"""
+    rng = np.random.default_rng(seed)
+    by_position = {p: np.flatnonzero([player.position == p for player in players]) for p in POSITIONS}
+    rosters = np.full((count, roster_size()), -1, dtype=np.int64)
+    for row in range(count):
+        picks = [rng.choice(by_position[p], size=ROSTER_SLOTS[p], replace=False) for p in POSITIONS]
+        chosen = set(np.concatenate(picks).tolist())
+        size = rng.integers(10, roster_size() + 1)
+        while len(chosen) < size:
+            chosen.add(int(rng.integers(len(players))))
+        chosen = list(chosen)
+        rng.shuffle(chosen)
+        rosters[row, :len(chosen)] = chosen
+    return rosters
+
+
+def test_starter_requirements_for_the_standard_roster():
+    needs = {"/".join(sorted(group)): need for group, need in starter_requirements().items()}
+    assert needs == {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "K": 1, "DEF": 1, "RB/TE/WR": 6}
+
+
+def test_single_checks_match_the_reference(players, engine):
+    for roster in random_rosters(players, 3000, seed=1).tolist():
+        roster = [i for i in roster if i >= 0]
+        assert engine.is_feasible(roster) == reference_legal(players, roster), engine.violations(roster)
+        assert engine.is_feasible(roster) == (not engine.violations(roster))
+
+
+def test_batch_checks_match_single_checks(players, engine):
+    rosters = random_rosters(players, 5000, seed=2)
+    feasible = engine.check_many(rosters)
+    gaps = engine.bye_gaps_many(rosters)
+    assert 0.05 < feasible.mean() < 0.95  # Both outcomes exercised
+    for row, roster in enumerate(rosters.tolist()):
+        roster = [i for i in roster if i >= 0]
+        assert feasible[row] == engine.is_feasible(roster)
+        assert gaps[row] == len(engine.bye_gaps(roster))
+
+
+def test_violations_name_the_broken_rule(players, engine):
+    solver_roster = next(r for r in ScenarioEngine(players).solve_all(workers=1) if r.key == "balanced").players
+    roster = [engine.index(p.name) for p in solver_roster]
+    assert engine.violations(roster) == []
+
+    no_qb = [i for i in roster if players[i].position != "QB"]
+    assert engine.violations(no_qb) == ["fewer than 1 QB to start"]
+
+    tight = RosterConstraints(players, budget=150)
+    assert tight.violations(roster) == ["over the $150 budget"]
+
+
+def test_team_cap_and_stacks():
+    players = [AuctionPlayer(1, "QB A", "QB", "KC", 1, 30, 300.0), AuctionPlayer(2, "WR A", "WR", "KC", 1, 30, 250.0),
+               AuctionPlayer(3, "TE A", "TE", "KC", 1, 20, 200.0), AuctionPlayer(4, "RB A", "RB", "KC", 1, 20, 200.0),
+               AuctionPlayer(5, "WR B", "WR", "BUF", 1, 20, 200.0)]
+    engine = RosterConstraints(players, max_per_team=3, bye_weeks={})
+    assert "more than 3 from KC" in engine.violations([0, 1, 2, 3])
+    assert engine.stacks([0, 1, 4]) == ["KC"]
+    assert engine.stacks([0, 4]) == []
+    assert engine.stacked_many(np.array([[0, 1, -1], [0, 4, -1]])).tolist() == [True, False]
+
+
+def test_bye_gaps_score_without_making_the_roster_illegal():
+    def player(rank, position, team):
+        return AuctionPlayer(rank, f"{position} {rank}", position, team, 2, 5, 100.0)
+
+    players = [player(1, "QB", "AAA"), player(2, "QB", "AAA"),
+               player(3, "RB", "BBB"), player(4, "RB", "CCC"), player(5, "RB", "DDD"), player(6, "RB", "EEE"),
+               player(7, "WR", "BBB"), player(8, "WR", "CCC"), player(9, "WR", "DDD"), player(10, "WR", "EEE"),
+               player(11, "TE", "CCC"), player(12, "TE", "AAA"), player(13, "K", "BBB"), player(14, "DEF", "CCC")]
+    byes = {"AAA": 5, "BBB": 6, "CCC": 7, "DDD": 8, "EEE": 9}
+    engine = RosterConstraints(players, bye_weeks=byes)
+    roster = list(range(len(players)))
+
+    assert engine.is_feasible(roster)
+    assert engine.violations(roster) == []
+    assert engine.bye_gaps(roster) == ["week 5 byes leave fewer than 1 QB"]  # Both QBs share a bye
+    assert engine.bye_gaps_many(np.array([roster])).tolist() == [1]
+
+    thin = [i for i in roster if players[i].name not in ("RB 6", "WR 10")]  # No spare RB/WR/TE depth
+    assert engine.is_feasible(thin)
+    assert engine.bye_gaps(thin) == ["week 5 byes leave fewer than 1 QB",
+                                     "week 7 byes leave fewer than 6 RB/WR/TE"]  # Three of the eight out
+
+    backup_elsewhere = players[:1] + [player(2, "QB", "FFF")] + players[2:]
+    staggered = RosterConstraints(backup_elsewhere, bye_weeks=dict(byes, FFF=10))
+    assert staggered.bye_gaps(roster) == []
+
+
+def test_rosters_past_the_field_width_are_rejected(engine):
+    with pytest.raises(ValueError):
+        engine.check_many(np.zeros((1, 40), dtype=np.int64))
+    assert not engine.is_feasible([0] * 40)
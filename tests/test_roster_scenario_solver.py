@@ -0,0 +1,107 @@
+"""
+roster_scenario_solver: strategy rosters are legal and within their bounds,
+the pool gives the same answers as solving in-process, and on a universe
+small enough to enumerate the optimizer finds the best roster.
+"""
+
+import itertools
+
+import pytest
+
+from auction_players import POSITION_LIMITS, POSITIONS, ROSTER_SLOTS, AuctionPlayer, roster_size
+from player_snapshot import load_players
+from roster_scenario_solver import STRATEGIES, ScenarioEngine, StrategySpec, slot_weights
+
+
+@pytest.fixture(scope="module")
+def players():
+    return load_players()
+
+
+@pytest.fixture(scope="module")
+def results(players):
+    return {result.key: result for result in ScenarioEngine(players).solve_all(workers=1)}
+
+
+def test_every_strategy_fills_a_legal_roster(results):
+    assert set(results) == {spec.key for spec in STRATEGIES}
+    for result in results.values():
+        assert result.feasible, result.key
+        assert len(result.players) == roster_size()
+        assert len({p.name for p in result.players}) == roster_size()
+        assert result.total_cost <= 200
+        counts = {position: 0 for position in POSITIONS}
+        for player in result.players:
+            counts[player.position] += 1
+        for position in POSITIONS:
+            assert ROSTER_SLOTS[position] <= counts[position] <= POSITION_LIMITS[position], (result.key, position)
+
+
+def test_strategies_respect_their_bounds(results):
+    for spec in STRATEGIES:
+        result = results[spec.key]
+        spend = result.spend_by_position()
+        for position in POSITIONS:
+            bounds = spec.bounds_for(position)
+            count = sum(1 for p in result.players if p.position == position)
+            assert bounds.min_count <= count <= bounds.max_count, (spec.key, position)
+            assert bounds.min_share * 200 <= spend[position] <= bounds.max_share * 200 + 1e-9, (spec.key, position)
+        if spec.max_player_price is not None:
+            assert max(p.auction_value for p in result.players) <= spec.max_player_price
+        if spec.elite_price is not None:
+            elite = [p for p in result.players if p.auction_value >= spec.elite_price]
+            assert spec.min_elite <= len(elite) <= spec.max_elite, spec.key
+
+
+def test_hero_rb_has_exactly_one_elite_back(results):
+    elite_rbs = [p for p in results["hero-rb"].players if p.position == "RB" and p.auction_value >= 45]
+    assert len(elite_rbs) == 1
+
+
+def test_pool_matches_in_process(players, results):
+    pooled = ScenarioEngine(players).solve_all(workers=2)
+    assert [(r.key, [p.name for p in r.players], r.weighted_points) for r in pooled] == \
+        [(r.key, [p.name for p in r.players], r.weighted_points) for r in results.values()]
+
+
+def weighted_points(roster, filled):
+    total = 0.0
+    for position in POSITIONS:
+        chosen = sorted((p.projected_points for p in roster if p.position == position), reverse=True)
+        total += sum(w * points for w, points in zip(slot_weights(position, len(chosen), filled.get(position, 0)),
+                                                      chosen))
+    return total
+
+
+def test_matches_brute_force_on_a_small_universe():
+    values = {"QB": [(30, 300), (12, 260), (2, 210)], "RB": [(40, 250), (25, 220), (9, 170), (3, 120)],
+              "WR": [(35, 240), (20, 215), (8, 160), (2, 110)], "TE": [(15, 150), (4, 100)],
+              "K": [(1, 130), (2, 135)], "DEF": [(1, 100), (3, 120)]}
+    players = [AuctionPlayer(rank, f"{position} {i}", position, "KC", 2, cost, float(points))
+               for rank, (position, i, (cost, points)) in enumerate(
+                   ((position, i, entry) for position, entries in values.items() for i, entry in enumerate(entries)), 1)]
+    filled = {"QB": 1, "RB": 1, "WR": 2, "TE": 1, "K": 1, "DEF": 1}
+    budget, open_slots = 45, 3
+    spec = StrategySpec("test", "Test", "Default bounds")
+
+    result = ScenarioEngine(players, budget, filled, open_slots, strategies=[spec]).solve(spec)
+
+    best = max(
+        weighted_points(combo, filled)
+        for combo in itertools.combinations(players, open_slots)
+        if sum(p.auction_value for p in combo) <= budget
+        and all(filled.get(pos, 0) + sum(p.position == pos for p in combo) <= POSITION_LIMITS[pos] for pos in POSITIONS)
+        and filled["RB"] + sum(p.position == "RB" for p in combo) >= ROSTER_SLOTS["RB"]
+    )
+    assert result.feasible
+    assert result.total_cost <= budget
+    assert result.weighted_points == pytest.approx(round(best, 1))
+    assert weighted_points(result.players, filled) == pytest.approx(best)
+
+
+def test_unaffordable_roster_is_infeasible():
+    players = [AuctionPlayer(i, f"RB {i}", "RB", "KC", 1, 50, 200.0) for i in range(3)]
+    spec = StrategySpec("test", "Test", "")
+    result = ScenarioEngine(players, 60, {p: ROSTER_SLOTS[p] for p in POSITIONS if p != "RB"}, 2,
+                            strategies=[spec]).solve(spec)
+    assert not result.feasible
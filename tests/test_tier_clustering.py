@@ -0,0 +1,78 @@
+"""
+tier_clustering: Jenks natural breaks finds the minimum within-tier squared
+error (checked against enumerating every split), and tiers count down from
+1 at the top.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from tier_clustering import METHODS, assign_tiers, natural_breaks, tier_boundaries, tier_by_position
+
+
+def split_error(ordered, cuts):
+    bounds = [0, *cuts, len(ordered)]
+    return sum(((ordered[a:b] - ordered[a:b].mean()) ** 2).sum() for a, b in zip(bounds, bounds[1:]))
+
+
+def labels_error(values, labels):
+    return sum(((values[labels == label] - values[labels == label].mean()) ** 2).sum() for label in np.unique(labels))
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("k", [2, 3, 4])
+def test_natural_breaks_is_optimal(seed, k):
+    values = np.random.default_rng(seed).gamma(2.0, 40.0, size=11).round(1)
+    ordered = np.sort(values)
+    best = min(split_error(ordered, cuts) for cuts in itertools.combinations(range(1, len(ordered)), k - 1))
+
+    labels = natural_breaks(values, k)
+    assert len(np.unique(labels)) == k
+    assert labels_error(values, labels) == pytest.approx(best)
+
+
+def test_natural_breaks_clusters_are_contiguous_and_ordered():
+    values = np.array([31.0, 1.0, 12.0, 50.0, 2.0, 30.0, 11.0, 3.0, 10.0])
+    labels = natural_breaks(values, 4)
+    assert labels.tolist() == [2, 0, 1, 3, 0, 2, 1, 0, 1]
+
+
+def test_tier_one_is_the_top_cluster():
+    tiers = assign_tiers([400, 390, 250, 240, 235, 100, 95, 20])
+    assert tiers.tolist() == [1, 1, 2, 2, 2, 3, 3, 4]
+
+
+def test_fewer_distinct_values_than_tiers():
+    assert assign_tiers([100, 100, 50]).tolist() == [1, 1, 2]
+    assert assign_tiers([7, 7, 7]).tolist() == [1, 1, 1]
+    assert assign_tiers([]).tolist() == []
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_every_method_keeps_tiers_contiguous(method):
+    values = np.random.default_rng(7).normal(150, 60, size=40)
+    tiers = assign_tiers(values, method)
+    assert set(tiers.tolist()) <= {1, 2, 3, 4}
+    order = np.argsort(-values)
+    assert np.all(np.diff(tiers[order]) >= 0)  # Walking down the values never goes back up a tier
+
+
+def test_tiers_are_per_position():
+    tiers, boundaries = tier_by_position(["QB", "QB", "K", "K"], [400.0, 200.0, 140.0, 100.0])
+    assert tiers == [1, 2, 1, 2]  # The best kicker is tier 1 among kickers
+    assert [b['max'] for b in boundaries["K"]] == [140.0, 100.0]
+
+
+def test_flat_positions_keep_their_current_tiers():
+    tiers, _ = tier_by_position(["K", "K", "RB", "RB"], [30.0, 30.0, 250.0, 120.0], current=[1, 3, 4, 4])
+    assert tiers == [1, 3, 1, 2]
+
+
+def test_boundaries_cover_each_tier():
+    values = [400, 390, 250, 240, 100]
+    tiers = assign_tiers(values, k=3)
+    boundaries = tier_boundaries(values, tiers)
+    assert [b['tier'] for b in boundaries] == [1, 2, 3]
+    assert [b['count'] for b in boundaries] == [2, 2, 1]
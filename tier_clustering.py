@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Automatic Tier Clustering
+Recomputes tiers per position from projected points (or auction value)
+instead of trusting the hand-typed tier=1..4 in the generator lists, which go
+stale as soon as projections move.
+
+Each position is clustered in one dimension with NumPy:
+- natural-breaks: Jenks optimal breaks (minimum within-tier squared error),
+  exact dynamic programming over prefix sums
+- kmeans: Lloyd's algorithm seeded at quantiles
+- gmm: Gaussian mixture fitted by EM with one shared variance, which keeps
+  every tier a contiguous range of values
+
+Tier 1 is always the highest cluster. A position gets at most TIER_COUNT
+tiers (fewer if it has fewer distinct values), so the output stays on the
+1..4 scale the rest of the tools expect. Re-tiering the whole universe takes
+a few milliseconds, cheap enough to redo on every refresh or pick.
+
+Usage:
+    python3 tier_clustering.py [--method natural-breaks|kmeans|gmm] [--feature points|value]
+"""
+
+import argparse
+import json
+import os
+import time
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from auction_players import POSITIONS, AuctionPlayer
+
+TIER_COUNT = 4
+METHODS = ("natural-breaks", "kmeans", "gmm")
+FEATURES = {'points': 'projected_points', 'value': 'auction_value'}
+MAX_ITERATIONS = 100
+
+
+def _tier_count(values: np.ndarray, k: int) -> int:
+    return max(1, min(k, len(np.unique(values))))
+
+
+def natural_breaks(values: np.ndarray, k: int) -> np.ndarray:
+    """Cluster index per value (0 = lowest cluster) from Jenks optimal breaks"""
+    order = np.argsort(values)
+    ordered = values[order]
+    n = len(ordered)
+    prefix = np.concatenate(([0.0], np.cumsum(ordered)))
+    prefix_sq = np.concatenate(([0.0], np.cumsum(ordered ** 2)))
+
+    # sse[i, j]: squared error of ordered[i:j] as one cluster (inf where j <= i)
+    start = np.arange(n + 1)[:, None]
+    end = np.arange(n + 1)[None, :]
+    size = end - start
+    with np.errstate(divide='ignore', invalid='ignore'):
+        total = prefix[end] - prefix[start]
+        sse = prefix_sq[end] - prefix_sq[start] - total ** 2 / size
+    sse = np.where(size > 0, np.maximum(sse, 0.0), np.inf)
+
+    # cost[m, j]: best error for ordered[:j] in m + 1 clusters; split[m, j]: where the last cluster starts
+    cost = np.empty((k, n + 1))
+    split = np.zeros((k, n + 1), dtype=int)
+    cost[0] = sse[0]
+    for m in range(1, k):
+        candidates = cost[m - 1][:, None] + sse
+        split[m] = np.argmin(candidates, axis=0)
+        cost[m] = candidates[split[m], np.arange(n + 1)]
+
+    labels = np.empty(n, dtype=int)
+    j = n
+    for m in range(k - 1, -1, -1):
+        i = split[m, j] if m else 0
+        labels[order[i:j]] = m
+        j = i
+    return labels
+
+
+def kmeans_1d(values: np.ndarray, k: int) -> np.ndarray:
+    """Cluster index per value (0 = lowest cluster) from 1-D Lloyd iterations"""
+    centers = np.quantile(values, (np.arange(k) + 0.5) / k)
+    labels = np.zeros(len(values), dtype=int)
+    for _ in range(MAX_ITERATIONS):
+        new_labels = np.argmin(np.abs(values[:, None] - centers[None, :]), axis=1)
+        counts = np.bincount(new_labels, minlength=k)
+        sums = np.bincount(new_labels, weights=values, minlength=k)
+        centers = np.where(counts > 0, sums / np.maximum(counts, 1), centers)
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+    return np.argsort(np.argsort(centers))[labels]
+
+
+def gmm_1d(values: np.ndarray, k: int) -> np.ndarray:
+    """Cluster index per value (0 = lowest cluster) from a shared-variance Gaussian mixture"""
+    labels = kmeans_1d(values, k)
+    means = np.array([values[labels == c].mean() if np.any(labels == c) else values.mean() for c in range(k)])
+    weights = np.full(k, 1.0 / k)
+    variance = max(values.var() / k, 1e-6)
+    log_likelihood = -np.inf
+
+    for _ in range(MAX_ITERATIONS):
+        # E step, in log space for stability
+        log_density = np.log(weights)[None, :] - (values[:, None] - means[None, :]) ** 2 / (2 * variance)
+        peak = log_density.max(axis=1, keepdims=True)
+        responsibility = np.exp(log_density - peak)
+        total = responsibility.sum(axis=1, keepdims=True)
+        responsibility /= total
+        new_log_likelihood = float(np.sum(np.log(total) + peak))
+
+        # M step
+        mass = responsibility.sum(axis=0) + 1e-12
+        weights = mass / len(values)
+        means = (responsibility * values[:, None]).sum(axis=0) / mass
+        variance = max(float((responsibility * (values[:, None] - means[None, :]) ** 2).sum() / len(values)), 1e-6)
+
+        if new_log_likelihood - log_likelihood < 1e-9:
+            break
+        log_likelihood = new_log_likelihood
+
+    return np.argsort(np.argsort(means))[np.argmax(responsibility, axis=1)]
+
+
+CLUSTERERS = {
+    "natural-breaks": natural_breaks,
+    "kmeans": kmeans_1d,
+    "gmm": gmm_1d,
+}
+
+
+def assign_tiers(values: Sequence[float], method: str = "natural-breaks", k: int = TIER_COUNT) -> np.ndarray:
+    """Tier per value for one position, 1 = highest"""
+    array = np.asarray(values, dtype=float)
+    if len(array) == 0:
+        return np.zeros(0, dtype=int)
+    count = _tier_count(array, k)
+    labels = CLUSTERERS[method](array, count)
+    # Some clusters can come out empty; renumber the used ones densely from the top
+    used = np.unique(labels)
+    return len(used) - np.searchsorted(used, labels)
+
+
+def tier_boundaries(values: Sequence[float], tiers: Sequence[int]) -> List[Dict]:
+    """Value range and size of each tier, tier 1 first"""
+    array = np.asarray(values, dtype=float)
+    tier_array = np.asarray(tiers)
+    return [
+        {
+            'tier': int(tier),
+            'min': round(float(array[tier_array == tier].min()), 1),
+            'max': round(float(array[tier_array == tier].max()), 1),
+            'count': int(np.sum(tier_array == tier)),
+        }
+        for tier in np.unique(tier_array)
+    ]
+
+
+def tier_by_position(positions: Sequence[str], values: Sequence[float], method: str = "natural-breaks",
+                     k: int = TIER_COUNT, current: Optional[Sequence[int]] = None
+                     ) -> Tuple[List[int], Dict[str, List[Dict]]]:
+    """
+    Tiers computed separately within each position, plus each position's boundaries.
+    A position whose values are all equal (e.g. flat K/DEF projections) carries
+    nothing to cluster and keeps its `current` tiers when given.
+    """
+    position_array = np.asarray(positions)
+    value_array = np.asarray(values, dtype=float)
+    tiers = np.zeros(len(value_array), dtype=int)
+    boundaries = {}
+    present = set(positions)
+    for position in [p for p in POSITIONS if p in present] + sorted(present - set(POSITIONS)):
+        mask = position_array == position
+        if current is not None and len(np.unique(value_array[mask])) == 1:
+            tiers[mask] = np.asarray(current)[mask]
+        else:
+            tiers[mask] = assign_tiers(value_array[mask], method, k)
+        boundaries[position] = tier_boundaries(value_array[mask], tiers[mask])
+    return tiers.tolist(), boundaries
+
+
+def retier(players: List[AuctionPlayer], method: str = "natural-breaks", feature: str = "points",
+           k: int = TIER_COUNT) -> Tuple[List[AuctionPlayer], Dict[str, List[Dict]]]:
+    """Copies of `players` with recomputed tiers, plus the boundaries per position"""
+    values = [getattr(player, FEATURES[feature]) for player in players]
+    tiers, boundaries = tier_by_position([player.position for player in players], values, method, k,
+                                         current=[player.tier for player in players])
+    return [replace(player, tier=tier) for player, tier in zip(players, tiers)], boundaries
+
+
+def boundaries_path(csv_path: str) -> str:
+    """Where the boundaries sidecar for a CSV goes: players.csv -> players_tiers.json"""
+    return f"{os.path.splitext(csv_path)[0]}_tiers.json"
+
+
+def write_boundaries(boundaries: Dict[str, List[Dict]], path: str, method: str, feature: str):
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump({'method': method, 'feature': feature, 'positions': boundaries}, handle, indent=2)
+        handle.write("\n")
+
+
+def main():
+    from auction_players import DEFAULT_PLAYERS_CSV
+    from player_snapshot import load_players
+
+    parser = argparse.ArgumentParser(description="Recompute per-position tiers by 1-D clustering")
+    parser.add_argument('--method', choices=METHODS, default="natural-breaks")
+    parser.add_argument('--feature', choices=sorted(FEATURES), default="points")
+    parser.add_argument('--tiers', type=int, default=TIER_COUNT, help="Maximum tiers per position")
+    parser.add_argument('--output', default=boundaries_path(DEFAULT_PLAYERS_CSV), help="Boundaries JSON")
+    args = parser.parse_args()
+
+    players = load_players()
+    retiered, boundaries = retier(players, args.method, args.feature, args.tiers)
+    # Time repeat runs, as on every pick, rather than the first call's NumPy warm-up
+    started = time.perf_counter()
+    for _ in range(20):
+        retier(players, args.method, args.feature, args.tiers)
+    elapsed = (time.perf_counter() - started) * 1000 / 20
+
+    print("🧮 Automatic Tier Clustering")
+    print("=" * 50)
+    print(f"📊 {len(players)} players re-tiered by {args.method} on {args.feature} in {elapsed:.2f} ms")
+    for position, tiers in boundaries.items():
+        ranges = "  ".join(f"T{b['tier']} {b['min']:g}-{b['max']:g} ({b['count']})" for b in tiers)
+        print(f"   {position:<4} {ranges}")
+
+    moved = [(old, new) for old, new in zip(players, retiered) if old.tier != new.tier]
+    print(f"\n🔀 {len(moved)} players changed tier from the hand-typed lists")
+    for old, new in moved[:15]:
+        print(f"   #{old.rank:<3} {old.name:<24} {old.position:<3} tier {old.tier} -> {new.tier}")
+
+    write_boundaries(boundaries, args.output, args.method, args.feature)
+    print(f"💾 Boundaries written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,15 @@ import time
 import re
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+from functools import cached_property
+
+# Column order of scrape_top_200 output
+TOP_200_FIELDNAMES = [
+    'rank', 'name', 'position', 'team', 'tier', 'espn_id',
+    'receptions_2024', 'receiving_yards_2024', 'receiving_tds_2024',
+    'rushing_yards_2024', 'rushing_tds_2024', 'passing_yards_2024', 'passing_tds_2024',
+    'fantasy_points_2024', 'status', 'notes',
+]
 
 @dataclass
 class FantasyPlayer:
@@ -28,9 +37,11 @@ class Top200FantasyScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
-        
-        # Initialize our top 200 fantasy players list
-        self.top_200_players = self._build_top_200_list()
+    
+    @cached_property
+    def top_200_players(self) -> List[FantasyPlayer]:
+        """Built on first use, so stat lookups alone skip the list"""
+        return self._build_top_200_list()
     
     def _build_top_200_list(self) -> List[FantasyPlayer]:
         """Build list of top 200 fantasy relevant players by position"""
@@ -317,29 +328,10 @@ class Top200FantasyScraper:
         print("🏈 Starting Top 200 Fantasy Players Scrape")
         print("=" * 50)
         
-        fieldnames = [
-            'rank',
-            'name',
-            'position', 
-            'team',
-            'tier',
-            'espn_id',
-            'receptions_2024',
-            'receiving_yards_2024',
-            'receiving_tds_2024',
-            'rushing_yards_2024',
-            'rushing_tds_2024',
-            'passing_yards_2024',
-            'passing_tds_2024',
-            'fantasy_points_2024',
-            'status',
-            'notes'
-        ]
-        
         successful_scrapes = 0
         
         with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.DictWriter(csvfile, fieldnames=TOP_200_FIELDNAMES)
             writer.writeheader()
             
             for rank, player in enumerate(self.top_200_players, 1):